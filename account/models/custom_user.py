@@ -30,6 +30,10 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, BaseModel):
     def __str__(self):
         return self.phone_number
 
+    def get_full_name(self):
+        """Return the first_name plus the last_name, with a space in between."""
+        return f"{self.first_name} {self.last_name}".strip()
+
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
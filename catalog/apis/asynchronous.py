@@ -0,0 +1,201 @@
+import logging
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, AuthenticationFailed, NotAuthenticated, NotFound, Throttled
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from catalog.apis.projects import ProjectDetailAPIView
+from catalog.filters import ProjectFilter
+from catalog.models import Project, Tag
+from catalog.pagination import ProjectCursorPagination
+from catalog.serializers.fast import FastProjectSerializer
+from catalog.serializers.projects import ProjectDetailSerializer, ProjectListSerializer, TagSerializer
+from catalog.services.bitmaps import ProjectBitmapIndex
+from catalog.services.cache import AsyncCatalogResponseCache
+from catalog.services.fieldsets import ProjectFieldPlan
+from catalog.services.validators import (
+    aproject_collection_validators,
+    aproject_validators,
+    atag_collection_validators,
+)
+from utility.authentication import AsyncJWTAuthentication
+from utility.conditional import build_etag, not_modified_response, set_validators
+from utility.persian import normalize_persian
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------
+# 🔹 Async read path (ASGI)
+# ------------------------------------------------------------------------
+# Async twins of the public catalog reads. Responses, cache entries, ETags
+# and errors match the DRF views; the request never leaves the event loop
+# except for the queries themselves.
+
+
+class AsyncCatalogView(View):
+    """
+    Base of the async catalog reads: a plain Django async view speaking DRF.
+
+    The request is wrapped in a DRF ``Request`` (query_params, absolute URLs)
+    and authenticated with AsyncJWTAuthentication, then checked against the
+    same throttles as the DRF views (``throttle_classes``; their counters live
+    in the sync cache, so each check runs in a thread). DRF exceptions and
+    Http404 are rendered the way DRF's exception handler renders them.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            drf_request = Request(request)
+            drf_request.user = await AsyncJWTAuthentication().aauthenticate(request)
+            await self.check_throttles(drf_request)
+            return await super().dispatch(drf_request, *args, **kwargs)
+        except Http404 as exc:
+            return self.exception_response(NotFound(*exc.args))
+        except APIException as exc:
+            return self.exception_response(exc)
+
+    def get_throttles(self):
+        return [throttle() for throttle in self.throttle_classes]
+
+    async def check_throttles(self, request):
+        """
+        Async APIView.check_throttles.
+
+        Raises:
+            Throttled: If any throttle refuses the request (with the longest wait).
+        """
+        durations = []
+        for throttle in self.get_throttles():
+            if not await sync_to_async(throttle.allow_request)(request, self):
+                durations.append(throttle.wait())
+        if durations:
+            raise Throttled(max((duration for duration in durations if duration is not None), default=None))
+
+    @staticmethod
+    def render(data, status: int = 200) -> HttpResponse:
+        return HttpResponse(JSONRenderer().render(data), status=status, content_type="application/json")
+
+    def exception_response(self, exc: APIException) -> HttpResponse:
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+        response = self.render(data, status=exc.status_code)
+        if isinstance(exc, (NotAuthenticated, AuthenticationFailed)):
+            response["WWW-Authenticate"] = AsyncJWTAuthentication().authenticate_header(self.request)
+        if getattr(exc, "wait", None):
+            response["Retry-After"] = "%d" % exc.wait
+        return response
+
+
+class AsyncProjectListView(AsyncCatalogView):
+    """Async ProjectListCreateAPIView.get (filters, keyset pages, fieldsets, cache, 304)."""
+
+    serializer_class = ProjectListSerializer
+    pagination_class = ProjectCursorPagination
+
+    async def get(self, request):
+        project_filter = ProjectFilter(request.query_params)
+        field_plan = ProjectFieldPlan.from_request(request, self.serializer_class)
+        ordering = project_filter.ordering()  # 400 for orderings outside the registry
+        if ProjectBitmapIndex.enabled():
+            # The bitmap lookups use the sync Redis client
+            queryset = await sync_to_async(project_filter.apply)(Project.objects.all())
+        else:
+            queryset = project_filter.apply(Project.objects.all())
+
+        cache = AsyncCatalogResponseCache()
+        etag, last_modified = await cache.avalidators(
+            request,
+            "project-list",
+            lambda: aproject_collection_validators(queryset, cache.normalized_query(request)),
+        )
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = await cache.arespond(
+            request,
+            "project-list",
+            lambda: self._list_data(
+                request, self.pagination_class.order(queryset, ordering), ordering, field_plan
+            ),
+        )
+        return set_validators(response, etag, last_modified)
+
+    async def _list_data(self, request, queryset, ordering, field_plan):
+        logger.info("Fetching projects for listing (async)")
+        context = {"request": request, **field_plan.context()}
+        paginator = self.pagination_class()
+
+        if FastProjectSerializer.supports(field_plan):
+            fast = FastProjectSerializer(self.serializer_class, context)
+            page = await paginator.apaginate_queryset(fast.queryset(queryset, ordering), request)
+            data = fast.to_representation(page)
+        else:
+            page = await paginator.apaginate_queryset(field_plan.apply(queryset, ordering), request)
+            data = self.serializer_class(page, many=True, context=context).data
+        return paginator.get_paginated_data(data)
+
+
+class AsyncProjectDetailView(AsyncCatalogView):
+    """Async ProjectDetailAPIView.get (id or slug, fieldsets, cache, 304)."""
+
+    async def get(self, request, pk_or_slug):
+        field_plan = ProjectFieldPlan.from_request(request, ProjectDetailSerializer)
+        lookup = ProjectDetailAPIView.get_lookup(pk_or_slug)
+
+        validators = await aproject_validators(**lookup)
+        if validators is None:
+            raise Http404("No Project matches the given query.")
+        etag, last_modified = validators
+        if not field_plan.is_default:
+            etag = build_etag(etag, field_plan.fields, field_plan.expand)
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = await AsyncCatalogResponseCache().arespond(
+            request, "project-detail", lambda: self._detail_data(request, lookup, field_plan)
+        )
+        return set_validators(response, etag, last_modified)
+
+    async def _detail_data(self, request, lookup, field_plan):
+        context = {"request": request, **field_plan.context()}
+
+        if FastProjectSerializer.supports(field_plan):
+            fast = FastProjectSerializer(ProjectDetailSerializer, context)
+            rows = [row async for row in fast.queryset(Project.objects.filter(**lookup))[:1]]
+            if not rows:
+                raise Http404("No Project matches the given query.")
+            return fast.to_representation(rows)[0]
+
+        try:
+            project = await field_plan.apply(Project.objects.all()).aget(**lookup)
+        except Project.DoesNotExist:
+            raise Http404("No Project matches the given query.")
+        return ProjectDetailSerializer(project, context=context).data
+
+
+class AsyncTagListView(AsyncCatalogView):
+    """Async TagListCreateAPIView.get (search, 304)."""
+
+    async def get(self, request):
+        tags = Tag.objects.all()
+        search_param = request.query_params.get("search")
+        if search_param:
+            # Served by the trigram index on name_normalized
+            tags = tags.filter(name_normalized__contains=normalize_persian(search_param))
+
+        etag, last_modified = await atag_collection_validators(tags, AsyncCatalogResponseCache.normalized_query(request))
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        data = TagSerializer([tag async for tag in tags.aiterator()], many=True).data
+        return set_validators(self.render(data), etag, last_modified)
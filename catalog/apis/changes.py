@@ -0,0 +1,38 @@
+import logging
+
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema_view
+
+from catalog.schema.changes import CatalogChangesSchema
+from catalog.services.changes import CatalogChangeFeed
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------
+# 🔹 Catalog Change Feed
+# ------------------------------------------------------------------------
+@extend_schema_view(get=CatalogChangesSchema.changes_schema)
+class CatalogChangesAPIView(APIView):
+    """
+    Incremental sync for offline clients: the projects, media and tags changed
+    after ``?cursor=`` plus deletions, in O(changes) (see catalog.services.changes).
+    """
+
+    permission_classes = [permissions.AllowAny]
+    # Cursors must never pass a row a lagging replica has not received yet
+    replica_reads = False
+
+    def get(self, request):
+        feed = CatalogChangeFeed(
+            cursor=request.query_params.get("cursor"),
+            limit=request.query_params.get("limit"),
+            request=request,
+        )
+        data = feed.page()
+        logger.debug(
+            f"Change feed page: {len(data['projects'])} projects, {len(data['media'])} media, {len(data['tags'])} tags"
+        )
+        return Response(data)
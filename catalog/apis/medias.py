@@ -1,12 +1,16 @@
+from django.conf import settings
+from django.shortcuts import get_object_or_404
+
 from rest_framework import status, permissions
+from rest_framework.parsers import MultiPartParser
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
-from django.shortcuts import get_object_or_404
-
-from catalog.models import Project, Media
-from catalog.schema.medias import ProjectMediaUploadSchema
-from catalog.serializers.medias import MediaSerializer
+from catalog.models import Project
+from catalog.schema.medias import ChunkedUploadSchema, ProjectMediaUploadSchema
+from catalog.serializers.medias import ChunkedUploadCreateSerializer, MediaSerializer
+from catalog.services.media import MediaBatchUploader
+from catalog.services.uploads import ChunkedUpload
 
 from drf_spectacular.utils import extend_schema_view
 
@@ -15,15 +19,106 @@ from drf_spectacular.utils import extend_schema_view
     post=ProjectMediaUploadSchema.post_schema
 )
 class ProjectMediaUploadAPIView(APIView):
+    """
+    Upload several files to a project at once (owner only).
+
+    The files are written to storage concurrently and their rows inserted
+    with one bulk INSERT, appended after the existing media in upload order
+    (see catalog.services.media). The response is serialized without queries.
+    """
+
     permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser]
 
     def post(self, request, pk):
-        project = get_object_or_404(Project, pk=pk)
-        if project.owner != request.user:
+        project = get_object_or_404(Project.objects.only('id', 'owner_id', 'title'), pk=pk)
+        if project.owner_id != request.user.pk:
             return Response({'detail': 'Not allowed'}, status=status.HTTP_403_FORBIDDEN)
 
         files = request.FILES.getlist('files')
-        created = []
-        for f in files:
-            created.append(Media.objects.create(project=project, file=f, type='image'))
-        return Response(MediaSerializer(created, many=True, context={'request': request}).data, status=201)
+        if not files:
+            return Response({'files': 'No files uploaded.'}, status=status.HTTP_400_BAD_REQUEST)
+        max_files = settings.CATALOG_MEDIA_UPLOAD_MAX_FILES
+        if len(files) > max_files:
+            return Response(
+                {'files': f'At most {max_files} files per upload.'}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        created = MediaBatchUploader(project).save(files)
+        return Response(
+            MediaSerializer(created, many=True, context={'request': request}).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# ------------------------------------------------------------------------
+# 🔹 Resumable chunked uploads
+# ------------------------------------------------------------------------
+# Large files are sent as byte ranges to an upload session and attached to
+# the project on commit; see catalog.services.uploads for the protocol.
+
+
+@extend_schema_view(
+    post=ChunkedUploadSchema.create_schema
+)
+class ProjectUploadSessionAPIView(APIView):
+    """Open a resumable upload session for one file of a project (owner only)."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, pk):
+        project = get_object_or_404(Project.objects.only('id', 'owner_id'), pk=pk)
+        if project.owner_id != request.user.pk:
+            return Response({'detail': 'Not allowed'}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = ChunkedUploadCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        upload = ChunkedUpload.create(project, **serializer.validated_data)
+        return Response(upload.data(), status=status.HTTP_201_CREATED)
+
+
+@extend_schema_view(
+    get=ChunkedUploadSchema.retrieve_schema,
+    put=ChunkedUploadSchema.chunk_schema,
+    delete=ChunkedUploadSchema.abort_schema,
+)
+class UploadSessionAPIView(APIView):
+    """
+    Progress of an upload session, its chunks and its cancellation.
+
+    PUT bodies are raw bytes described by ``Content-Range``; they are streamed
+    to disk and never parsed, so ``request.data`` is not touched here.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, upload_id):
+        return Response(ChunkedUpload.get(str(upload_id), request.user).data())
+
+    def put(self, request, upload_id):
+        upload = ChunkedUpload.get(str(upload_id), request.user)
+        start, length = upload.parse_range(
+            request.headers.get('Content-Range'), int(request.META.get('CONTENT_LENGTH') or 0)
+        )
+        upload.write(start, length, request.stream)
+        return Response(upload.data())
+
+    def delete(self, request, upload_id):
+        ChunkedUpload.get(str(upload_id), request.user).abort()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+@extend_schema_view(
+    post=ChunkedUploadSchema.commit_schema
+)
+class UploadSessionCommitAPIView(APIView):
+    """Attach a completely received upload to its project as a Media row."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, upload_id):
+        media = ChunkedUpload.get(str(upload_id), request.user).commit()
+        return Response(
+            MediaSerializer(media, context={'request': request}).data, status=status.HTTP_201_CREATED
+        )
@@ -1,6 +1,7 @@
 import logging
+from django.conf import settings
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
 
 from rest_framework import status, permissions
 from rest_framework.views import APIView
@@ -8,13 +9,31 @@ from rest_framework.response import Response
 
 from drf_spectacular.utils import extend_schema_view
 
+from catalog.filters import ProjectFilter
 from catalog.models import Project
-from catalog.schema.projects import ProjectDetailSchema, ProjectListCreateSchema
+from catalog.pagination import ProjectCursorPagination
+from catalog.schema.projects import (
+    ProjectBulkSchema,
+    ProjectDetailSchema,
+    ProjectExportSchema,
+    ProjectFacetsSchema,
+    ProjectHistogramsSchema,
+    ProjectListCreateSchema,
+)
+from catalog.services.cache import CatalogResponseCache
+from catalog.services.export import ProjectExporter
+from catalog.services.facets import ProjectFacets
+from catalog.services.fieldsets import ProjectFieldPlan
+from catalog.services.histograms import ProjectHistograms
+from catalog.services.validators import project_collection_validators, project_validators
+from catalog.serializers.fast import FastProjectSerializer
 from catalog.serializers.projects import (
+    ProjectBulkItemSerializer,
     ProjectListSerializer,
     ProjectDetailSerializer,
     ProjectWriteSerializer,
 )
+from utility.conditional import build_etag, not_modified_response, set_validators
 
 logger = logging.getLogger(__name__)
 
@@ -30,43 +49,60 @@ class ProjectListCreateAPIView(APIView):
     """
     API View for listing all projects and creating new ones.
 
-    - GET: Public list (filtering, search, ordering supported)
+    - GET: Public list (filtering, search, ordering, cursor pagination and
+      sparse fieldsets via ?fields= / ?expand= supported), anonymous responses are served from the versioned catalog cache and
+      conditional requests (If-None-Match / If-Modified-Since) may answer 304
     - POST: Create project (authenticated users only)
     """
 
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     serializer_class = ProjectListSerializer
+    pagination_class = ProjectCursorPagination
 
     def get(self, request):
+        project_filter = ProjectFilter(request.query_params)
+        field_plan = ProjectFieldPlan.from_request(request, self.serializer_class)
+        ordering = project_filter.ordering()  # 400 for orderings outside the registry
+        queryset = project_filter.apply(Project.objects.all())
+
+        # --- Conditional GET: one aggregate query per catalog generation, no serialization ---
+        cache = CatalogResponseCache()
+        etag, last_modified = cache.validators(
+            request,
+            "project-list",
+            lambda: project_collection_validators(queryset, cache.normalized_query(request)),
+        )
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = cache.respond(
+            request,
+            "project-list",
+            lambda: self._list_data(
+                request, self.pagination_class.order(queryset, ordering), ordering, field_plan
+            ),
+        )
+        return set_validators(response, etag, last_modified)
+
+    def _list_data(self, request, queryset, ordering, field_plan):
         logger.info("Fetching projects for listing")
+        context = {"request": request, **field_plan.context()}
 
-        queryset = Project.objects.select_related("owner").prefetch_related("tags")
-
-        # --- Filtering ---
-        status_param = request.query_params.get("status")
-        featured_param = request.query_params.get("featured")
-        search_param = request.query_params.get("search")
-        ordering_param = request.query_params.get("ordering")
-
-        if status_param:
-            queryset = queryset.filter(status=status_param)
-        if featured_param in ["true", "1"]:
-            queryset = queryset.filter(featured=True)
-        if search_param:
-            queryset = queryset.filter(
-                Q(title__icontains=search_param)
-                | Q(municipal_file_number__icontains=search_param)
-                | Q(owner_name__icontains=search_param)
-                | Q(address__icontains=search_param)
-            )
-        if ordering_param:
-            queryset = queryset.order_by(ordering_param)
+        # --- Pagination (keyset, no COUNT / OFFSET) ---
+        paginator = self.pagination_class()
+
+        # --- Fast path: .values() rows + one tag query, no model/serializer instances ---
+        if FastProjectSerializer.supports(field_plan):
+            fast = FastProjectSerializer(self.serializer_class, context)
+            page = paginator.paginate_queryset(fast.queryset(queryset, ordering), request, view=self)
+            data = fast.to_representation(page)
         else:
-            queryset = queryset.order_by("-created_at")
+            page = paginator.paginate_queryset(field_plan.apply(queryset, ordering), request, view=self)
+            data = self.serializer_class(page, many=True, context=context).data
 
-        serializer = self.serializer_class(queryset, many=True, context={"request": request})
-        logger.debug(f"Returning {len(serializer.data)} projects")
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        logger.debug(f"Returning {len(data)} projects")
+        return paginator.get_paginated_data(data)
 
     def post(self, request):
         logger.info(f"Creating new project by user {request.user}")
@@ -83,6 +119,90 @@ class ProjectListCreateAPIView(APIView):
         return Response(response_data, status=status.HTTP_201_CREATED)
 
 
+# ------------------------------------------------------------------------
+# 🔹 Project Facets
+# ------------------------------------------------------------------------
+@extend_schema_view(get=ProjectFacetsSchema.facets_schema)
+class ProjectFacetsAPIView(APIView):
+    """
+    Facet counts (status, featured, tags) for the project list filters.
+
+    One grouped query per facet family (see catalog.services.facets); results
+    are cached per catalog generation for every user, since they do not
+    depend on who asks.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        project_filter = ProjectFilter(request.query_params)
+        return CatalogResponseCache().respond(
+            request, "project-facets", lambda: ProjectFacets(project_filter).counts(), shared=True
+        )
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Histograms
+# ------------------------------------------------------------------------
+@extend_schema_view(get=ProjectHistogramsSchema.histograms_schema)
+class ProjectHistogramsAPIView(APIView):
+    """
+    Bucketed distributions of budget / area / floors for the range sliders.
+
+    A single ``width_bucket`` query for all fields (see catalog.services.histograms);
+    cached per catalog generation for every user, like the facet counts.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        fields = [name for name in request.query_params.get("fields", "").split(",") if name.strip()]
+        histograms = ProjectHistograms(
+            ProjectFilter(request.query_params),
+            fields=[name.strip() for name in fields],
+            buckets=request.query_params.get("buckets"),
+        )
+        return CatalogResponseCache().respond(request, "project-histograms", histograms.data, shared=True)
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Bulk Create / Update
+# ------------------------------------------------------------------------
+@extend_schema_view(post=ProjectBulkSchema.bulk_schema)
+class ProjectBulkAPIView(APIView):
+    """
+    Create or update many projects of the current user in one request.
+
+    Items are matched on municipal_file_number; the batch is written with a
+    constant number of queries in one transaction (see catalog.services.bulk).
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = ProjectBulkItemSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.CATALOG_BULK_MAX_ITEMS,
+            context={"request": request},
+        )
+        if not serializer.is_valid():
+            logger.warning(f"Bulk validation errors: {serializer.errors}")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        created, updated = serializer.save()
+        logger.info(f"Bulk write by user {request.user}: {len(created)} created, {len(updated)} updated")
+
+        def summary(projects):
+            return [
+                {"id": project.id, "slug": project.slug, "municipal_file_number": project.municipal_file_number}
+                for project in projects
+            ]
+
+        return Response({"created": summary(created), "updated": summary(updated)}, status=status.HTTP_200_OK)
+
+
 # ------------------------------------------------------------------------
 # 🔹 Project Detail (Retrieve, Update, Delete)
 # ------------------------------------------------------------------------
@@ -96,24 +216,59 @@ class ProjectDetailAPIView(APIView):
     """
     Retrieve, update, or delete a specific project.
 
-    Supports both numeric ID and slug as identifier.
+    Supports both numeric ID and slug as identifier; GET also accepts
+    ?fields= / ?expand= (see catalog.services.fieldsets).
     """
 
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    @staticmethod
+    def get_lookup(pk_or_slug):
+        return {"pk": pk_or_slug} if str(pk_or_slug).isdigit() else {"slug": pk_or_slug}
+
     def get_object(self, pk_or_slug):
         """Fetch project by ID or slug."""
-        lookup = {"pk": pk_or_slug} if str(pk_or_slug).isdigit() else {"slug": pk_or_slug}
         project = get_object_or_404(
-            Project.objects.select_related("owner").prefetch_related("tags"), **lookup
+            Project.objects.select_related("owner"), **self.get_lookup(pk_or_slug)
         )
         return project
 
     def get(self, request, pk_or_slug):
+        field_plan = ProjectFieldPlan.from_request(request, ProjectDetailSerializer)
+
+        # --- Conditional GET from updated_at (project, owner, tags) ---
+        validators = project_validators(**self.get_lookup(pk_or_slug))
+        if validators is None:
+            raise Http404("No Project matches the given query.")
+        etag, last_modified = validators
+        if not field_plan.is_default:
+            etag = build_etag(etag, field_plan.fields, field_plan.expand)
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = CatalogResponseCache().respond(
+            request, "project-detail", lambda: self._detail_data(request, pk_or_slug, field_plan)
+        )
+        return set_validators(response, etag, last_modified)
+
+    def _detail_data(self, request, pk_or_slug, field_plan):
         logger.info(f"Fetching project details for {pk_or_slug}")
-        project = self.get_object(pk_or_slug)
-        serializer = ProjectDetailSerializer(project, context={"request": request})
-        return Response(serializer.data)
+        context = {"request": request, **field_plan.context()}
+
+        if FastProjectSerializer.supports(field_plan):
+            fast = FastProjectSerializer(ProjectDetailSerializer, context)
+            rows = fast.queryset(Project.objects.filter(**self.get_lookup(pk_or_slug)))[:1]
+            data = fast.to_representation(rows)
+            if not data:
+                raise Http404("No Project matches the given query.")
+            return data[0]
+
+        project = get_object_or_404(
+            field_plan.apply(Project.objects.all()), **self.get_lookup(pk_or_slug)
+        )
+        serializer = ProjectDetailSerializer(project, context=context)
+        return serializer.data
 
     def put(self, request, pk_or_slug):
         return self._update_project(request, pk_or_slug, partial=False)
@@ -150,3 +305,28 @@ class ProjectDetailAPIView(APIView):
         project.delete()
         logger.info(f"Project {pk_or_slug} deleted successfully")
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Export (streaming NDJSON / CSV)
+# ------------------------------------------------------------------------
+@extend_schema_view(get=ProjectExportSchema.export_schema)
+class ProjectExportAPIView(APIView):
+    """
+    Stream every project matching the list filters as NDJSON or CSV.
+
+    Memory stays constant in the number of rows (see catalog.services.export).
+    Authenticated users only, since it bypasses pagination.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, file_format):
+        if file_format not in ProjectExporter.content_types:
+            raise Http404("Unsupported export format.")
+
+        logger.info(f"Exporting projects as {file_format} for user {request.user}")
+        exporter = ProjectExporter(request.query_params, file_format=file_format, request=request)
+        response = StreamingHttpResponse(exporter.stream(), content_type=exporter.content_type)
+        response["Content-Disposition"] = f'attachment; filename="{exporter.filename}"'
+        return response
@@ -0,0 +1,33 @@
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema_view
+
+from catalog.models import ProjectStatistic
+from catalog.schema.statistics import ProjectStatisticsSchema
+from catalog.services.statistics import ProjectStatistics
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Statistics
+# ------------------------------------------------------------------------
+@extend_schema_view(get=ProjectStatisticsSchema.statistics_schema)
+class ProjectStatisticsAPIView(APIView):
+    """
+    Project count, total budget and total area per status, owner and start month.
+
+    Served from the pre-aggregated rollups (see catalog.services.statistics),
+    so the cost does not depend on the number of projects. Staff only, since the
+    owner breakdown exposes every user's totals.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        dimensions = [value for value, _ in ProjectStatistic.DIMENSION_CHOICES]
+        requested = [name.strip() for name in request.query_params.get("dimensions", "").split(",") if name.strip()]
+        unknown = [name for name in requested if name not in dimensions]
+        if unknown:
+            raise ValidationError({"dimensions": f"Unknown dimension(s): {', '.join(unknown)}"})
+        return Response(ProjectStatistics.read(requested or dimensions))
@@ -7,11 +7,15 @@ from django.shortcuts import get_object_or_404
 from catalog.models import Tag
 from catalog.schema.tags import TagDetailSchema, TagListCreateSchema
 from catalog.serializers.projects import TagSerializer
+from catalog.services.cache import CatalogResponseCache
+from catalog.services.validators import tag_collection_validators
+from utility.conditional import not_modified_response, set_validators
+from utility.persian import normalize_persian
 
 from drf_spectacular.utils import extend_schema_view
 
 
-TagListCreateAPIView = extend_schema_view(
+@extend_schema_view(
     get=TagListCreateSchema.list_schema,
     post=TagListCreateSchema.create_schema,
 )
@@ -20,8 +24,18 @@ class TagListCreateAPIView(APIView):
 
     def get(self, request):
         tags = Tag.objects.all()
+        search_param = request.query_params.get("search")
+        if search_param:
+            # Served by the trigram index on name_normalized
+            tags = tags.filter(name_normalized__contains=normalize_persian(search_param))
+
+        etag, last_modified = tag_collection_validators(tags, CatalogResponseCache.normalized_query(request))
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
         serializer = TagSerializer(tags, many=True)
-        return Response(serializer.data)
+        return set_validators(Response(serializer.data), etag, last_modified)
 
     def post(self, request):
         serializer = TagSerializer(data=request.data)
@@ -30,7 +44,7 @@ class TagListCreateAPIView(APIView):
             return Response(TagSerializer(tag).data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-TagDetailAPIView = extend_schema_view(
+@extend_schema_view(
     get=TagDetailSchema.retrieve_schema,
     put=TagDetailSchema.update_schema,
     delete=TagDetailSchema.delete_schema,
@@ -0,0 +1,212 @@
+import datetime
+import math
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, QuerySet
+from rest_framework.exceptions import ValidationError
+
+from catalog.models import Project
+from catalog.pagination import ProjectCursorPagination
+from catalog.services.bitmaps import ProjectBitmapIndex, filter_ids
+from catalog.services.geo import within_bbox, within_radius
+from catalog.services.periods import active_between
+from catalog.services.search import ProjectSearch
+
+# Numeric columns filterable with ``<field>_min`` / ``<field>_max`` (inclusive),
+# each backed by a btree index (see Project.Meta.indexes).
+PROJECT_RANGE_FIELDS = ("budget", "area_sqm", "total_area", "floors_count")
+
+# Largest ``radius`` (meters) accepted with ``near``; bigger areas use ``bbox``
+MAX_RADIUS_M = 100_000
+
+
+class ProjectFilter:
+    """
+    The public project list filters, shared by every endpoint that accepts them.
+
+    Supported query parameters:
+        - status: exact project status
+        - featured: "true"/"1" keeps only featured projects
+        - tags: comma separated tag ids; projects must have all of them
+          (any of them with ``tags_match=any``)
+        - search: full-text search (see catalog.services.search)
+        - <field>_min / <field>_max: inclusive bounds for PROJECT_RANGE_FIELDS
+          (e.g. ``budget_min=1000000&floors_count_max=5``)
+        - active_between: ``YYYY-MM-DD,YYYY-MM-DD`` (or a single day); projects
+          whose contract period overlaps it (see catalog.services.periods)
+        - bbox: ``west,south,east,north`` in degrees; projects inside the map viewport
+        - near + radius: ``lat,lng`` and meters; projects within that distance
+          (see catalog.services.geo)
+        - ordering: one of catalog.pagination.PROJECT_ORDERINGS
+
+    Example:
+        >>> project_filter = ProjectFilter(request.query_params)
+        >>> queryset = project_filter.apply(Project.objects.all()).order_by(*project_filter.ordering())
+    """
+
+    def __init__(self, params):
+        self.params = params
+
+    def without(self, *names) -> "ProjectFilter":
+        """A copy of this filter ignoring the given parameters (used by facet counts)."""
+        return ProjectFilter({key: self.params.get(key) for key in self.params if key not in names})
+
+    @property
+    def search_term(self):
+        return self.params.get("search")
+
+    @property
+    def tag_ids(self) -> list:
+        raw = self.params.get("tags") or ""
+        return sorted({int(value) for value in raw.split(",") if value.strip().isdigit()})
+
+    @property
+    def match_all_tags(self) -> bool:
+        return self.params.get("tags_match") != "any"
+
+    @property
+    def ranges(self) -> dict:
+        """
+        ``{lookup: value}`` for every ``<field>_min`` / ``<field>_max`` parameter.
+
+        Raises:
+            ValidationError: If a bound is not a valid value for its column.
+        """
+        lookups = {}
+        for name in PROJECT_RANGE_FIELDS:
+            model_field = Project._meta.get_field(name)
+            for suffix, lookup in (("min", "gte"), ("max", "lte")):
+                param = f"{name}_{suffix}"
+                raw = self.params.get(param)
+                if raw in (None, ""):
+                    continue
+                try:
+                    lookups[f"{name}__{lookup}"] = model_field.to_python(raw)
+                except DjangoValidationError:
+                    raise ValidationError({param: f"Invalid value '{raw}'."})
+        return lookups
+
+    @property
+    def active_period(self):
+        """
+        ``(start, end)`` of the ``active_between`` parameter, or None.
+
+        Raises:
+            ValidationError: If the dates are malformed or reversed.
+        """
+        raw = self.params.get("active_between")
+        if not raw:
+            return None
+        parts = [part.strip() for part in raw.split(",")]
+        try:
+            if len(parts) not in (1, 2):
+                raise ValueError
+            start, end = datetime.date.fromisoformat(parts[0]), datetime.date.fromisoformat(parts[-1])
+        except ValueError:
+            raise ValidationError({"active_between": "Expected YYYY-MM-DD or YYYY-MM-DD,YYYY-MM-DD."})
+        if start > end:
+            raise ValidationError({"active_between": "The start date must not be after the end date."})
+        return start, end
+
+    @staticmethod
+    def _coordinates(param, raw, count) -> list:
+        try:
+            values = [float(part) for part in raw.split(",")]
+        except ValueError:
+            values = []
+        if len(values) != count or not all(map(math.isfinite, values)):
+            raise ValidationError({param: f"Expected {count} comma separated numbers."})
+        return values
+
+    @property
+    def bbox(self):
+        """
+        ``(south, west, north, east)`` of the ``bbox`` parameter, or None.
+
+        Raises:
+            ValidationError: For malformed or out-of-range boxes; boxes crossing
+                the antimeridian (west > east) are not supported.
+        """
+        raw = self.params.get("bbox")
+        if not raw:
+            return None
+        west, south, east, north = self._coordinates("bbox", raw, 4)
+        if not (-180 <= west <= east <= 180 and -90 <= south <= north <= 90):
+            raise ValidationError({"bbox": "Expected west,south,east,north with west <= east and south <= north."})
+        return south, west, north, east
+
+    @property
+    def near(self):
+        """
+        ``(latitude, longitude, radius_m)`` of the ``near`` / ``radius`` parameters, or None.
+
+        Raises:
+            ValidationError: For a malformed point or a radius outside 0..MAX_RADIUS_M.
+        """
+        raw = self.params.get("near")
+        if not raw:
+            return None
+        latitude, longitude = self._coordinates("near", raw, 2)
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValidationError({"near": "Expected lat,lng in degrees."})
+        try:
+            radius = float(self.params.get("radius") or "")
+        except ValueError:
+            radius = -1
+        if not 0 < radius <= MAX_RADIUS_M:
+            raise ValidationError({"radius": f"Required with near: meters between 0 and {MAX_RADIUS_M}."})
+        return latitude, longitude, radius
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Return ``queryset`` narrowed by the request filters (ordering is not applied)."""
+        status_param = self.params.get("status")
+        featured = self.params.get("featured") in ["true", "1"]
+        tag_ids = self.tag_ids
+
+        # status / featured / tags resolve through the Redis bitmaps when enabled
+        project_ids = None
+        if (status_param or featured or tag_ids) and ProjectBitmapIndex.enabled():
+            project_ids = ProjectBitmapIndex().resolve(
+                statuses=[status_param] if status_param else [],
+                featured=True if featured else None,
+                tag_ids=tag_ids,
+                match_all_tags=self.match_all_tags,
+            )
+
+        if project_ids is not None:
+            queryset = filter_ids(queryset, project_ids)
+        else:
+            if status_param:
+                queryset = queryset.filter(status=status_param)
+            if featured:
+                queryset = queryset.filter(featured=True)
+            if tag_ids:
+                queryset = queryset.filter(pk__in=self._tagged_project_ids(tag_ids))
+        ranges = self.ranges
+        if ranges:
+            queryset = queryset.filter(**ranges)
+        active_period = self.active_period
+        if active_period:
+            queryset = active_between(queryset, *active_period)
+        bbox, near = self.bbox, self.near
+        if bbox:
+            queryset = within_bbox(queryset, *bbox)
+        if near:
+            queryset = within_radius(queryset, *near)
+        if self.search_term:
+            queryset = ProjectSearch(self.search_term).apply(queryset)
+        return queryset
+
+    def _tagged_project_ids(self, tag_ids):
+        """Subquery of projects having all (or any) of ``tag_ids``, without one join per tag."""
+        rows = Project.tags.through.objects.filter(tag_id__in=tag_ids).values("project_id")
+        if self.match_all_tags and len(tag_ids) > 1:
+            rows = rows.annotate(matched=Count("tag_id")).filter(matched=len(tag_ids))
+        return rows.values("project_id")
+
+    def ordering(self) -> tuple:
+        """Keyset ordering for the request; search results default to relevance."""
+        ordering_param = self.params.get("ordering")
+        if self.search_term and not ordering_param:
+            return ProjectSearch.ordering
+        return ProjectCursorPagination.ordering_for(ordering_param)
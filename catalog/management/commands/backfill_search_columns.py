@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from catalog.models import Project, Tag
+from catalog.services.search import PROJECT_SEARCH_FIELDS, project_search_vector
+from utility.persian import normalize_persian
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill the normalized search columns of projects and tags in primary-key "
+        "batches, and refresh Project.search_vector from them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows per UPDATE batch")
+        parser.add_argument(
+            "--model",
+            choices=["all", "project", "tag"],
+            default="all",
+            help="Which model to backfill",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(options["batch_size"], 1)
+
+        if options["model"] in ("all", "project"):
+            total = self._backfill_projects(batch_size)
+            self.stdout.write(self.style.SUCCESS(f"✅ Projects backfilled: {total}"))
+
+        if options["model"] in ("all", "tag"):
+            total = self._backfill_tags(batch_size)
+            self.stdout.write(self.style.SUCCESS(f"✅ Tags backfilled: {total}"))
+
+    def _backfill_projects(self, batch_size):
+        normalized_fields = [f"{field}_normalized" for field in PROJECT_SEARCH_FIELDS]
+        total = 0
+        for batch in self._batches(Project.objects.only("pk", *PROJECT_SEARCH_FIELDS), batch_size):
+            for project in batch:
+                project.populate_computed_fields()
+            with transaction.atomic():
+                Project.objects.bulk_update(batch, normalized_fields)
+                Project.objects.filter(pk__gte=batch[0].pk, pk__lte=batch[-1].pk).update(
+                    search_vector=project_search_vector()
+                )
+            total += len(batch)
+            self.stdout.write(f"  ⏳ projects up to id={batch[-1].pk} ({total})")
+        return total
+
+    def _backfill_tags(self, batch_size):
+        total = 0
+        for batch in self._batches(Tag.objects.only("pk", "name"), batch_size):
+            for tag in batch:
+                tag.name_normalized = normalize_persian(tag.name)
+            Tag.objects.bulk_update(batch, ["name_normalized"])
+            total += len(batch)
+        return total
+
+    @staticmethod
+    def _batches(queryset, batch_size):
+        """Yield lists of rows ordered by primary key, walking the pk index (no OFFSET)."""
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk).order_by("pk")[:batch_size])
+            if not batch:
+                return
+            yield batch
+            last_pk = batch[-1].pk
@@ -0,0 +1,85 @@
+import datetime
+import json
+import random
+import statistics
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+
+# The catalog_proj_contract_gist index and the active_between predicate
+# (catalog.services.periods), written out for the synthetic table.
+PERIOD = "daterange(start_date, end_date, '[]')"
+CONDITION = "start_date IS NOT NULL AND (end_date IS NULL OR end_date >= start_date)"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark active_between on a synthetic temporary table of contract periods: "
+        "the overlap query is timed (EXPLAIN ANALYZE) before and after building the "
+        "partial GiST daterange index, and the plan node used is reported."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic contracts generated")
+        parser.add_argument("--runs", type=int, default=12, help="Month windows queried per phase")
+        parser.add_argument("--seed", type=int, default=7, help="Seed of the month windows")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        windows = []
+        for _ in range(max(options["runs"], 1)):
+            start = datetime.date(rng.randint(2015, 2024), rng.randint(1, 12), 1)
+            end = (start + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1)
+            windows.append((start, end))
+
+        # The temporary table lives in this transaction only and is never committed
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"⚙️  Generating {options['rows']:,} contracts"))
+            cursor.execute(
+                "CREATE TEMPORARY TABLE bench_contracts ON COMMIT DROP AS "
+                "SELECT n AS id, s AS start_date, "
+                "CASE WHEN random() < 0.1 THEN NULL ELSE s + (random() * 720)::int END AS end_date "
+                "FROM (SELECT n, CASE WHEN random() < 0.02 THEN NULL "
+                "ELSE DATE '2015-01-01' + (random() * 3650)::int END AS s "
+                "FROM generate_series(1, %s) AS n) AS g",
+                [options["rows"]],
+            )
+            cursor.execute("ANALYZE bench_contracts")
+            before = self._measure(cursor, windows)
+
+            cursor.execute(f"CREATE INDEX bench_contracts_gist ON bench_contracts USING gist (({PERIOD})) WHERE {CONDITION}")
+            cursor.execute("ANALYZE bench_contracts")
+            after = self._measure(cursor, windows)
+
+            transaction.set_rollback(True)
+
+        for label, (timing, matched, nodes) in (("sequential", before), ("GiST index", after)):
+            self.stdout.write(
+                f"  {label:<12} {timing:9.2f} ms median, {matched:,} rows/month avg, plan: {', '.join(nodes)}"
+            )
+        if any("bench_contracts_gist" in node for node in after[2]):
+            self.stdout.write(self.style.SUCCESS(f"✅ Index used, {before[0] / after[0]:.1f}x faster"))
+        else:
+            self.stdout.write(self.style.WARNING("⚠️  The planner did not use the GiST index"))
+
+    @staticmethod
+    def _measure(cursor, windows):
+        timings, matched, nodes = [], [], {}
+        for start, end in windows:
+            cursor.execute(
+                f"EXPLAIN (ANALYZE, FORMAT JSON) SELECT id FROM bench_contracts "
+                f"WHERE {CONDITION} AND {PERIOD} && daterange(%s, %s, '[]')",
+                [start, end],
+            )
+            plan = cursor.fetchone()[0]
+            plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]
+            timings.append(plan["Execution Time"])
+            matched.append(plan["Plan"]["Actual Rows"])
+            stack = [plan["Plan"]]
+            while stack:
+                node = stack.pop()
+                name = node["Node Type"] + (f" on {node['Index Name']}" if "Index Name" in node else "")
+                nodes[name] = None
+                stack.extend(node.get("Plans", []))
+        return statistics.median(timings), int(statistics.mean(matched)), list(nodes)
@@ -0,0 +1,177 @@
+import asyncio
+import io
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from catalog.models import Project
+
+
+# Sync URL -> async twin (see catalog.apis.asynchronous)
+ENDPOINTS = {
+    "projects": ("/api/catalog/projects", "/api/catalog/async/projects"),
+    "detail": ("/api/catalog/projects/{pk}", "/api/catalog/async/projects/{pk}"),
+    "tags": ("/api/catalog/tags", "/api/catalog/async/tags"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the sync (WSGI) and async (ASGI) catalog reads at high concurrency. "
+        "Each endpoint is driven in-process through Django's WSGIHandler (one thread per "
+        "concurrent request, like a threaded WSGI server) and its async twin through "
+        "ASGIHandler (one event loop); throughput and latency percentiles are reported. "
+        "No network server is involved, so the numbers compare the two request paths only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--endpoints", default="projects,detail,tags", help=f"Comma separated: {', '.join(ENDPOINTS)}")
+        parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint and mode")
+        parser.add_argument("--concurrency", type=int, default=64, help="Requests in flight at once")
+        parser.add_argument("--query", default="", help="Query string added to every URL, e.g. 'page_size=50'")
+        parser.add_argument(
+            "--authenticated",
+            action="store_true",
+            help="Send a bearer token for the first active user (authenticated reads bypass the response cache)",
+        )
+
+    def handle(self, *args, **options):
+        names = [name.strip() for name in options["endpoints"].split(",") if name.strip()]
+        unknown = [name for name in names if name not in ENDPOINTS]
+        if unknown:
+            raise CommandError(f"Unknown endpoint(s): {', '.join(unknown)}")
+        if settings.DEBUG:
+            self.stdout.write(self.style.WARNING("⚠️  DEBUG is on: every query is recorded, timings are inflated"))
+
+        headers = [(b"host", b"localhost")]
+        if options["authenticated"]:
+            user = get_user_model().objects.filter(is_active=True).order_by("pk").first()
+            if user is None:
+                raise CommandError("No active user to authenticate as.")
+            headers.append((b"authorization", f"Bearer {AccessToken.for_user(user)}".encode()))
+
+        project_pk = Project.objects.order_by("pk").values_list("pk", flat=True).first()
+        if "detail" in names and project_pk is None:
+            raise CommandError("The detail endpoint needs at least one project.")
+
+        total, concurrency = max(options["requests"], 1), max(options["concurrency"], 1)
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(f"⚙️  {total:,} requests per run, {concurrency} in flight")
+        )
+        for name in names:
+            sync_path, async_path = (path.format(pk=project_pk) for path in ENDPOINTS[name])
+            self.stdout.write(f"  {name}")
+            runs = [
+                ("WSGI sync", self._run_wsgi(sync_path, options["query"], headers, total, concurrency)),
+                ("ASGI async", self._run_asgi(async_path, options["query"], headers, total, concurrency)),
+            ]
+            for label, (latencies, errors, elapsed) in runs:
+                p50, p95, p99 = (statistics.quantiles(latencies, n=100)[i] for i in (49, 94, 98))
+                self.stdout.write(
+                    f"    {label:<10} {total / elapsed:9.1f} req/s  p50 {p50:7.2f} ms  p95 {p95:7.2f} ms  "
+                    f"p99 {p99:7.2f} ms  errors {errors}"
+                )
+            (_, _, sync_elapsed), (_, _, async_elapsed) = runs[0][1], runs[1][1]
+            ratio = sync_elapsed / async_elapsed
+            style = self.style.SUCCESS if ratio >= 1 else self.style.WARNING
+            self.stdout.write(style(f"    {'✅' if ratio >= 1 else '⚠️ '} async/sync throughput {ratio:.2f}x"))
+
+    # ------------------------------------------------------------------------
+    # Runners
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def _timings(results, elapsed):
+        latencies = [duration * 1000 for duration, _ in results]
+        errors = sum(1 for _, status in results if status not in (200, 304))
+        return latencies, errors, elapsed
+
+    def _run_wsgi(self, path, query, headers, total, concurrency):
+        handler = WSGIHandler()
+        base = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "wsgi.url_scheme": "http",
+            "wsgi.errors": io.StringIO(),
+            **{f"HTTP_{name.decode().upper()}": value.decode() for name, value in headers},
+        }
+
+        def call(_):
+            statuses = []
+            started = time.perf_counter()
+            result = handler({**base, "wsgi.input": io.BytesIO(b"")}, lambda status, *args: statuses.append(status))
+            try:
+                for _chunk in result:
+                    pass
+            finally:
+                result.close()  # request_finished: the connection goes back to the pool
+            return time.perf_counter() - started, int(statuses[0].split()[0])
+
+        call(None)  # warm-up
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            started = time.perf_counter()
+            results = list(pool.map(call, range(total)))
+            elapsed = time.perf_counter() - started
+        return self._timings(results, elapsed)
+
+    def _run_asgi(self, path, query, headers, total, concurrency):
+        handler = ASGIHandler()
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": headers,
+            "server": ("localhost", 80),
+            "client": ("127.0.0.1", 50000),
+        }
+
+        async def call():
+            statuses, received, finished = [], False, asyncio.Event()
+
+            async def receive():
+                nonlocal received
+                if not received:
+                    received = True
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                await finished.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            started = time.perf_counter()
+            await handler(dict(scope), receive, send)
+            finished.set()
+            return time.perf_counter() - started, statuses[0]
+
+        async def run():
+            await call()  # warm-up
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def bounded():
+                async with semaphore:
+                    return await call()
+
+            started = time.perf_counter()
+            results = await asyncio.gather(*(bounded() for _ in range(total)))
+            return results, time.perf_counter() - started
+
+        results, elapsed = asyncio.run(run())
+        return self._timings(results, elapsed)
@@ -0,0 +1,87 @@
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from catalog.models import Project
+from catalog.services.search import ProjectSearch
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the legacy icontains project search with the full-text/trigram "
+        "search using EXPLAIN ANALYZE and wall-clock timings. "
+        "Run it against a representative dataset: on tiny tables PostgreSQL "
+        "prefers sequential scans regardless of the available indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("terms", nargs="+", help="Search terms to benchmark")
+        parser.add_argument("--runs", type=int, default=20, help="Timed runs per query")
+        parser.add_argument("--limit", type=int, default=20, help="Rows fetched per query (page size)")
+        parser.add_argument(
+            "--strict",
+            action="store_true",
+            help="Fail if the indexed search plan still scans catalog_project sequentially",
+        )
+
+    def handle(self, *args, **options):
+        failures = []
+        for term in options["terms"]:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"🔎 Term: {term!r}"))
+
+            legacy = self._legacy_queryset(term)
+            indexed = ProjectSearch(term).apply(Project.objects.all()).order_by(*ProjectSearch.ordering)
+
+            for label, queryset in (("icontains", legacy), ("full-text", indexed)):
+                page = queryset[: options["limit"]]
+                nodes = self._plan_nodes(page)
+                timing = self._time(page, options["runs"])
+
+                scans = ", ".join(sorted({self._describe(node) for node in nodes if "Scan" in node["Node Type"]}))
+                self.stdout.write(f"  {label:<10} median {timing:8.2f} ms | {scans}")
+
+                if label == "full-text" and any(
+                    node["Node Type"] == "Seq Scan" and node.get("Relation Name") == Project._meta.db_table
+                    for node in nodes
+                ):
+                    failures.append(term)
+
+        if failures and options["strict"]:
+            raise CommandError(f"❌ Sequential scan on {Project._meta.db_table} for: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark finished"))
+
+    def _legacy_queryset(self, term):
+        """The pre-index search: four ORed icontains predicates ordered by creation date."""
+        return Project.objects.filter(
+            Q(title__icontains=term)
+            | Q(municipal_file_number__icontains=term)
+            | Q(owner_name__icontains=term)
+            | Q(address__icontains=term)
+        ).order_by("-created_at", "-id")
+
+    def _plan_nodes(self, queryset):
+        """Run EXPLAIN ANALYZE and flatten the plan tree into a list of nodes."""
+        plan = json.loads(queryset.explain(format="json", analyze=True))
+        nodes, stack = [], [plan[0]["Plan"]]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.get("Plans", []))
+        return nodes
+
+    def _time(self, queryset, runs):
+        samples = []
+        for _ in range(max(runs, 1)):
+            started = time.perf_counter()
+            list(queryset.values_list("id", flat=True))
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples)
+
+    @staticmethod
+    def _describe(node):
+        if node.get("Index Name"):
+            return f"{node['Node Type']} using {node['Index Name']}"
+        return f"{node['Node Type']} on {node.get('Relation Name', '?')}"
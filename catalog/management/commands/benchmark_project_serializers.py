@@ -0,0 +1,62 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from catalog.models import Project
+from catalog.serializers.fast import FastProjectSerializer
+from catalog.serializers.projects import ProjectDetailSerializer, ProjectListSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rows/sec of the DRF project serializers with the .values() fast path "
+        "(query + serialization + JSON rendering) and check both produce identical bytes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=500, help="Projects serialized per run")
+        parser.add_argument("--runs", type=int, default=10, help="Timed runs per serializer")
+        parser.add_argument("--host", default="localhost", help="Host used to build absolute file URLs")
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get("/", HTTP_HOST=options["host"])
+        context = {"request": request}
+        queryset = Project.objects.order_by("-created_at", "-id")[: options["limit"]]
+        rows = queryset.count()
+        if not rows:
+            raise CommandError("❌ No projects to benchmark; load some data first.")
+
+        renderer = JSONRenderer()
+        for serializer_class in (ProjectListSerializer, ProjectDetailSerializer):
+            self.stdout.write(self.style.MIGRATE_HEADING(f"⚙️  {serializer_class.__name__} ({rows} rows)"))
+
+            def drf():
+                page = queryset.select_related("owner")
+                return renderer.render(serializer_class(page, many=True, context=context).data)
+
+            def fast():
+                serializer = FastProjectSerializer(serializer_class, context)
+                return renderer.render(serializer.to_representation(serializer.queryset(queryset)))
+
+            if drf() != fast():
+                raise CommandError(f"❌ Fast path output differs from {serializer_class.__name__}")
+
+            before = self._median(drf, options["runs"])
+            after = self._median(fast, options["runs"])
+            self.stdout.write(f"  DRF        {rows / before:10.0f} rows/sec ({before * 1000:.1f} ms)")
+            self.stdout.write(f"  fast path  {rows / after:10.0f} rows/sec ({after * 1000:.1f} ms)")
+            self.stdout.write(f"  speedup    {before / after:10.1f}x, output byte-identical")
+
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark finished"))
+
+    @staticmethod
+    def _median(build, runs):
+        samples = []
+        for _ in range(max(runs, 1)):
+            started = time.perf_counter()
+            build()
+            samples.append(time.perf_counter() - started)
+        return statistics.median(samples)
@@ -0,0 +1,68 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from catalog.services.images import ImageDerivatives, render_variants
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the WebP/JPEG variants (CATALOG_IMAGE_VARIANT_WIDTHS) of project covers and "
+        "image media that have none yet, or whose file changed since. Images are decoded, "
+        "resized and encoded in a process pool; rows are updated in primary-key batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=["all", "cover", "media"],
+            default="all",
+            help="Which images to process",
+        )
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+        parser.add_argument("--batch-size", type=int, default=200, help="Images per batch (one UPDATE transaction)")
+        parser.add_argument("--force", action="store_true", help="Render every image again, even if up to date")
+
+    def handle(self, *args, **options):
+        batch_size, workers = max(options["batch_size"], 1), max(options["workers"], 1)
+        jobs = []
+        if options["model"] in ("all", "cover"):
+            jobs.append(("covers", ImageDerivatives.pending_covers(options["force"]), "save_covers"))
+        if options["model"] in ("all", "media"):
+            jobs.append(("media", ImageDerivatives.pending_media(options["force"]), "save_media"))
+
+        # Workers only touch storage. A forking pool starts all of its workers on
+        # the first submit, so submit a no-op before any query: forked workers
+        # must not inherit (and later close) this process's database connections.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+            pool.submit(int).result()
+            derivatives = ImageDerivatives()
+            self.stdout.write(self.style.MIGRATE_HEADING(f"⚙️  Rendering image variants ({workers} worker processes)"))
+            for label, queryset, save in jobs:
+                started, total, updated = time.perf_counter(), 0, 0
+                for rows in self._batches(queryset, batch_size):
+                    names = [name for _, name in rows]
+                    results = pool.map(render_variants, names, chunksize=max(len(names) // (workers * 4), 1))
+                    updated += getattr(derivatives, save)(rows, results)
+                    total += len(rows)
+                    self.stdout.write(f"  ⏳ {label} up to id={rows[-1][0]} ({total})")
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    self.style.SUCCESS(f"✅ {label}: {updated} of {total} images updated in {elapsed:.1f}s")
+                )
+
+    @staticmethod
+    def _batches(queryset, batch_size):
+        """Yield ``(pk, name)`` lists ordered by primary key, walking the pk index (no OFFSET)."""
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                return
+            yield batch
+            last_pk = batch[-1][0]
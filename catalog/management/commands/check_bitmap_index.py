@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from catalog.services.bitmaps import ProjectBitmapIndex
+
+
+class Command(BaseCommand):
+    help = "Compare the Redis bitmap facet index with the database and report drifted bitmaps."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repair", action="store_true", help="Rebuild the index when drift is found")
+
+    def handle(self, *args, **options):
+        index = ProjectBitmapIndex()
+        if not index.is_ready():
+            self.stdout.write(self.style.WARNING("⚠️  Index is not marked ready (never built or a write failed)"))
+
+        drift = index.check()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("✅ Bitmap index matches the database"))
+            return
+
+        for key, (missing, unexpected) in drift.items():
+            self.stdout.write(f"  {key:<40} missing {missing:>6} | unexpected {unexpected:>6}")
+
+        if options["repair"]:
+            index.rebuild()
+            self.stdout.write(self.style.SUCCESS(f"✅ Rebuilt after drift in {len(drift)} bitmaps"))
+            return
+        raise CommandError(f"❌ Drift in {len(drift)} bitmaps (run with --repair or rebuild_bitmap_index)")
@@ -0,0 +1,68 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from catalog.filters import MAX_RADIUS_M, PROJECT_RANGE_FIELDS
+from catalog.pagination import PROJECT_ORDERINGS
+from catalog.services.export import ProjectExporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream the project catalog as NDJSON or CSV (same filters as the project list). "
+        "Rows are read with a server-side cursor, so memory does not grow with the catalog."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", dest="file_format", choices=sorted(ProjectExporter.content_types), default="ndjson")
+        parser.add_argument("--output", "-o", help="Target file (default: stdout)")
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Rows fetched per round trip")
+        parser.add_argument("--status", help="Only projects with this status")
+        parser.add_argument("--featured", action="store_true", help="Only featured projects")
+        parser.add_argument("--tags", help="Comma separated tag ids; projects must have all of them")
+        parser.add_argument(
+            "--tags-match", choices=["all", "any"], help="With --tags: require all (default) or any of the tags"
+        )
+        parser.add_argument("--search", help="Full-text search term")
+        for name in PROJECT_RANGE_FIELDS:
+            flag = name.replace("_", "-")
+            parser.add_argument(f"--{flag}-min", dest=f"{name}_min", help=f"Minimum {name} (inclusive)")
+            parser.add_argument(f"--{flag}-max", dest=f"{name}_max", help=f"Maximum {name} (inclusive)")
+        parser.add_argument(
+            "--active-between",
+            help="YYYY-MM-DD,YYYY-MM-DD (or one day); projects whose contract period overlaps it",
+        )
+        parser.add_argument("--bbox", help="west,south,east,north in degrees (use --bbox=... for negative values)")
+        parser.add_argument("--near", help="lat,lng; projects within --radius meters of it")
+        parser.add_argument("--radius", help=f"Meters around --near (at most {MAX_RADIUS_M})")
+        parser.add_argument(
+            "--ordering", choices=list(PROJECT_ORDERINGS), help="One of the project list orderings"
+        )
+
+    def handle(self, *args, **options):
+        # ProjectFilter query parameters, named like the project list's
+        names = ["status", "tags", "tags_match", "search", "active_between", "bbox", "near", "radius", "ordering"]
+        names += [f"{name}_{suffix}" for name in PROJECT_RANGE_FIELDS for suffix in ("min", "max")]
+        params = {name: options[name] for name in names}
+        params["featured"] = "true" if options["featured"] else None
+        try:
+            exporter = ProjectExporter(
+                {key: value for key, value in params.items() if value},
+                file_format=options["file_format"],
+                chunk_size=options["chunk_size"],
+            )
+        except ValidationError as e:
+            errors = e.detail if isinstance(e.detail, dict) else {"filters": e.detail}
+            raise CommandError("; ".join(f"--{name.replace('_', '-')}: {error}" for name, error in errors.items()))
+
+        output = open(options["output"], "w", encoding="utf-8", newline="") if options["output"] else sys.stdout
+        try:
+            for line in exporter.stream():
+                output.write(line)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+
+        if options["output"]:
+            self.stderr.write(self.style.SUCCESS(f"✅ Exported projects to {options['output']}"))
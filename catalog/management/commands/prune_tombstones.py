@@ -0,0 +1,29 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from catalog.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete change feed tombstones older than CATALOG_TOMBSTONE_RETENTION_DAYS. "
+        "Clients with older cursors get 410 and resync from scratch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.CATALOG_TOMBSTONE_RETENTION_DAYS,
+            help="Keep tombstones of the last N days (never less than the setting)",
+        )
+
+    def handle(self, *args, **options):
+        # Pruning inside the retention window would let a valid cursor miss deletions
+        days = max(options["days"], settings.CATALOG_TOMBSTONE_RETENTION_DAYS)
+        cutoff = timezone.now() - datetime.timedelta(days=days)
+        deleted, _ = Tombstone.objects.filter(updated_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f"✅ {deleted} tombstones older than {days} days pruned"))
@@ -0,0 +1,49 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from catalog.services.uploads import ChunkedUpload
+from utility.redis import RedisService
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the partial files of expired resumable upload sessions from CATALOG_UPLOAD_DIR. "
+        "A file is removed once its Redis session is gone and it has not changed for "
+        "CATALOG_UPLOAD_SESSION_TTL seconds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only list the files that would be deleted")
+
+    def handle(self, *args, **options):
+        directory = ChunkedUpload.directory()
+        if not os.path.isdir(directory):
+            self.stdout.write(self.style.SUCCESS(f"✅ No upload directory at {directory}"))
+            return
+
+        redis_service = RedisService()
+        cutoff = time.time() - settings.CATALOG_UPLOAD_SESSION_TTL
+        deleted = freed = 0
+        for entry in os.scandir(directory):
+            if not entry.name.endswith(".part"):
+                continue
+            upload_id = entry.name[: -len(".part")]
+            # The mtime check covers a session created between scandir and the lookup
+            if entry.stat().st_mtime > cutoff or redis_service.exists(ChunkedUpload.key(upload_id)):
+                continue
+            size = entry.stat().st_size
+            if options["dry_run"]:
+                self.stdout.write(f"  {entry.name} ({size:,} bytes)")
+            else:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    continue
+            deleted += 1
+            freed += size
+
+        verb = "would be deleted" if options["dry_run"] else "deleted"
+        self.stdout.write(self.style.SUCCESS(f"✅ {deleted} expired upload files {verb} ({freed:,} bytes)"))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from catalog.services.bitmaps import ProjectBitmapIndex
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the Redis bitmap facet index (status / featured / tags) from the database "
+        "and mark it ready. Writes staging keys first and swaps them in atomically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=10000, help="SETBIT commands per pipeline round trip")
+
+    def handle(self, *args, **options):
+        index = ProjectBitmapIndex()
+        if not index.enabled():
+            self.stdout.write(self.style.WARNING("⚠️  CATALOG_BITMAP_INDEX is off; the index is built but not used"))
+
+        counts = index.rebuild(batch_size=max(options["batch_size"], 1))
+        for key, count in sorted(counts.items()):
+            self.stdout.write(f"  {key:<40} {count:>8} projects")
+        self.stdout.write(self.style.SUCCESS(f"✅ Bitmap index rebuilt ({len(counts)} bitmaps)"))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from catalog.models import ProjectStatistic
+from catalog.services.statistics import ProjectStatistics
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the project statistics rollups (per status, owner and start month) "
+        "from the projects table. Project writes wait for the rebuild to finish."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true", help="Only report rollups that differ from a rebuild")
+
+    def handle(self, *args, **options):
+        before = self._snapshot()
+        if options["check"]:
+            # Rebuild inside a transaction that is rolled back, then compare
+            with transaction.atomic():
+                ProjectStatistics.rebuild()
+                after = self._snapshot()
+                transaction.set_rollback(True)
+        else:
+            ProjectStatistics.rebuild()
+            after = self._snapshot()
+
+        drifted = sorted(key for key in before.keys() | after.keys() if before.get(key) != after.get(key))
+        if options["check"]:
+            if drifted:
+                preview = ", ".join(f"{dimension}={key or '∅'}" for dimension, key in drifted[:20])
+                self.stdout.write(self.style.WARNING(f"⚠️  {len(drifted)} rollups drifted: {preview}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"✅ {len(after)} rollups match the projects table"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✅ {len(after)} rollups rebuilt ({len(drifted)} had drifted)"))
+
+    @staticmethod
+    def _snapshot() -> dict:
+        return {
+            (dimension, key): (count, budget, area)
+            for dimension, key, count, budget, area in ProjectStatistic.objects.filter(project_count__gt=0).values_list(
+                "dimension", "key", "project_count", "total_budget", "total_area"
+            )
+        }
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from catalog.models import Project
+from catalog.services.cache import CatalogResponseCache
+from catalog.services.tags import refresh_tag_snapshots, tag_snapshot_expression
+
+
+class Command(BaseCommand):
+    help = (
+        "Find projects whose tags_snapshot differs from their tags (in primary-key "
+        "batches, compared in SQL) and rewrite the drifted snapshots."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="Projects compared per query")
+        parser.add_argument("--dry-run", action="store_true", help="Only report drifted projects")
+
+    def handle(self, *args, **options):
+        batch_size = max(options["batch_size"], 1)
+        checked, drifted = 0, []
+
+        last_pk = 0
+        while True:
+            batch = Project.objects.filter(pk__gt=last_pk).order_by("pk")[:batch_size]
+            bounds = list(batch.values_list("pk", flat=True))
+            if not bounds:
+                break
+            checked += len(bounds)
+            last_pk = bounds[-1]
+
+            drifted_ids = list(
+                Project.objects.filter(pk__gte=bounds[0], pk__lte=bounds[-1])
+                .annotate(expected_snapshot=tag_snapshot_expression())
+                .exclude(tags_snapshot=F("expected_snapshot"))
+                .values_list("pk", flat=True)
+            )
+            if drifted_ids and not options["dry_run"]:
+                refresh_tag_snapshots(drifted_ids)
+            drifted.extend(drifted_ids)
+
+        if drifted and not options["dry_run"]:
+            CatalogResponseCache().bump()
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS(f"✅ {checked} projects checked, no drift"))
+        elif options["dry_run"]:
+            preview = ", ".join(map(str, drifted[:20]))
+            self.stdout.write(self.style.WARNING(f"⚠️  {len(drifted)}/{checked} projects drifted: {preview}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✅ {len(drifted)}/{checked} drifted snapshots repaired"))
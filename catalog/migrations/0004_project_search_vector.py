@@ -0,0 +1,48 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:43
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_search_vector(apps, schema_editor):
+    Project = apps.get_model('catalog', 'Project')
+    Project.objects.update(
+        search_vector=(
+            SearchVector('title', weight='A', config='simple')
+            + SearchVector('municipal_file_number', weight='A', config='simple')
+            + SearchVector('owner_name', weight='B', config='simple')
+            + SearchVector('address', weight='C', config='simple')
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0003_project_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='project',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='catalog_proj_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('municipal_file_number', models.TextField())), name='gin_trgm_ops'), name='catalog_proj_file_no_trgm'),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:46
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_project_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='catalog_proj_file_no_trgm',
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='address_normalized',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='municipal_file_number_normalized',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='owner_name_normalized',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='title_normalized',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='name_normalized',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['municipal_file_number_normalized'], name='catalog_proj_file_no_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title_normalized'], name='catalog_proj_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['name_normalized'], name='catalog_tag_name_norm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name_normalized'], name='catalog_tag_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
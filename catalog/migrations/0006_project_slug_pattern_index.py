@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0005_normalized_search_columns'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['slug'], name='catalog_proj_slug_like_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
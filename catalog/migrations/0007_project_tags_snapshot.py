@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-17 21:00
+
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, JSONObject
+
+
+def populate_tags_snapshot(apps, schema_editor):
+    Project = apps.get_model('catalog', 'Project')
+    ProjectTags = Project._meta.get_field('tags').remote_field.through
+    tags = (
+        ProjectTags.objects.filter(project_id=OuterRef('pk'))
+        .order_by()
+        .values('project_id')
+        .annotate(snapshot=JSONBAgg(JSONObject(id='tag_id', name='tag__name'), order_by='tag_id'))
+        .values('snapshot')
+    )
+    Project.objects.update(tags_snapshot=Coalesce(Subquery(tags), Value([], output_field=models.JSONField())))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0006_project_slug_pattern_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='tags_snapshot',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(populate_tags_snapshot, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-17 21:07
+
+import datetime
+import django.db.models.functions.comparison
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0007_project_tags_snapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('start_date', models.Value(datetime.date(1, 1, 1))), models.F('id'), name='catalog_proj_start_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('budget', models.Value(Decimal('-1')), output_field=models.DecimalField(decimal_places=2, max_digits=14)), models.F('id'), name='catalog_proj_budget_id_idx'),
+        ),
+    ]
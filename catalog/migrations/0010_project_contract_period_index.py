@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-17 21:10
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0009_project_range_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GistIndex(models.Func(models.F('start_date'), models.F('end_date'), models.Value('[]'), function='daterange', output_field=django.contrib.postgres.fields.ranges.DateRangeField()), condition=models.Q(('start_date__isnull', False), models.Q(('end_date__isnull', True), ('end_date__gte', models.F('start_date')), _connector='OR')), name='catalog_proj_contract_gist'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-17 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0011_project_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('kind', models.CharField(choices=[('project', 'Project'), ('media', 'Media'), ('tag', 'Tag')], max_length=16)),
+                ('object_id', models.BigIntegerField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(fields=['updated_at', 'id'], name='catalog_media_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['updated_at', 'id'], name='catalog_tag_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['updated_at', 'id'], name='catalog_tomb_updated_id_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.5 on 2026-10-17 21:17
+
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+
+
+def populate_statistics(apps, schema_editor):
+    Project = apps.get_model('catalog', 'Project')
+    ProjectStatistic = apps.get_model('catalog', 'ProjectStatistic')
+    totals = {
+        'project_count': Count('pk'),
+        'total_budget': Coalesce(Sum('budget'), Value(0), output_field=DecimalField()),
+        'total_area': Coalesce(Sum('total_area'), Value(0), output_field=DecimalField()),
+    }
+    groups = [
+        ('status', 'status', Project.objects.all(), str),
+        ('owner', 'owner_id', Project.objects.all(), str),
+        ('month', 'month', Project.objects.annotate(month=TruncMonth('start_date')),
+         lambda value: value.strftime('%Y-%m') if value else ''),
+    ]
+    rows = []
+    for dimension, column, queryset, to_key in groups:
+        for value, count, budget, area in (
+            queryset.order_by().values(column).annotate(**totals).values_list(column, *totals)
+        ):
+            rows.append(ProjectStatistic(
+                dimension=dimension, key=to_key(value), project_count=count, total_budget=budget, total_area=area,
+            ))
+    ProjectStatistic.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0012_change_feed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('dimension', models.CharField(choices=[('status', 'Status'), ('owner', 'Owner'), ('month', 'Start month')], max_length=16)),
+                ('key', models.CharField(blank=True, max_length=64)),
+                ('project_count', models.BigIntegerField(default=0)),
+                ('total_budget', models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                ('total_area', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'key'), name='catalog_stat_dimension_key_uniq')],
+            },
+        ),
+        migrations.RunPython(populate_statistics, migrations.RunPython.noop),
+    ]
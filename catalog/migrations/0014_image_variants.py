@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-17 21:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0013_project_statistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='media',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='cover_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
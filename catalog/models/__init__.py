@@ -1,2 +1,4 @@
 from .medias import Media
-from .projects import Project, Tag
\ No newline at end of file
+from .projects import Project, Tag
+from .statistics import ProjectStatistic
+from .tombstones import Tombstone
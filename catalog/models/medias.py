@@ -14,10 +14,16 @@ class Media(BaseModel):
     caption = models.CharField(max_length=180, blank=True, default="")
     type = models.CharField(max_length=10, choices=FILE_TYPES, default='image')
     order = models.PositiveIntegerField(default=0)
+    # Resized WebP/JPEG copies of image files (see catalog.services.images)
+    variants = models.JSONField(default=dict, blank=True, editable=False)
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['order', 'uploaded_at']
+        indexes = [
+            # Change feed keyset (see catalog.services.changes)
+            models.Index(fields=['updated_at', 'id'], name='catalog_media_updated_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.project.title} - {self.caption or self.file.name}"
@@ -1,8 +1,17 @@
-from django.db import models
-from django.utils.text import slugify
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
+from django.core.validators import MaxValueValidator, MinValueValidator
 from utility.bases.base_model import BaseModel
 from catalog.models.tags import Tag
+from catalog.services.ordering import PROJECT_ORDERING_KEYS
+from catalog.services.periods import CONTRACT_PERIOD_CONDITION, contract_period
+from catalog.services.search import PROJECT_SEARCH_FIELDS, project_search_vector
+from catalog.services.slugs import allocate_slugs
+from utility.geohash import encode as geohash_encode
+from utility.persian import normalize_persian
 
 
 class Project(BaseModel):
@@ -12,6 +21,8 @@ class Project(BaseModel):
     """
 
     MUNICIPAL_FILE_NUMBER_HELP = "Unique municipal file number for each project."
+    # Saves retried when a concurrent insert takes the allocated slug
+    SLUG_ATTEMPTS = 3
 
     STATUS_CHOICES = [
         ("draft", "Draft"),
@@ -66,6 +77,23 @@ class Project(BaseModel):
     address = models.TextField(
         verbose_name="Project Address", null=True, blank=True, default="Unknown address"
     )  # 🟢 default added
+    latitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+    )
+    longitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+    )
+    # Geohash of (latitude, longitude), "" without coordinates; filled in save()
+    # and prefix-scanned by map queries (see catalog.services.geo).
+    geohash = models.CharField(max_length=12, blank=True, default="", editable=False)
 
     status = models.CharField(
         max_length=16,
@@ -76,7 +104,22 @@ class Project(BaseModel):
 
     featured = models.BooleanField(default=False)
     cover = models.ImageField(upload_to="projects/covers/", null=True, blank=True)
+    # Resized WebP/JPEG copies of ``cover`` by format and width, maintained
+    # after upload (see catalog.services.images); rendered as ``cover_srcset``.
+    cover_variants = models.JSONField(default=dict, blank=True, editable=False)
     tags = models.ManyToManyField(Tag, blank=True, related_name="projects")
+    # Denormalized [{"id", "name"}] of ``tags`` ordered by id, maintained in SQL
+    # (see catalog.services.tags); read paths render tags from it without a join.
+    tags_snapshot = models.JSONField(default=list, blank=True, editable=False)
+
+    # Normalized shadows of PROJECT_SEARCH_FIELDS (see utility.persian), filled in save().
+    title_normalized = models.TextField(blank=True, default="", editable=False)
+    municipal_file_number_normalized = models.TextField(blank=True, default="", editable=False)
+    owner_name_normalized = models.TextField(blank=True, default="", editable=False)
+    address_normalized = models.TextField(blank=True, default="", editable=False)
+
+    # Maintained in save() from the normalized shadows, never edited directly.
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Last Updated")
@@ -89,6 +132,37 @@ class Project(BaseModel):
             models.Index(fields=["municipal_file_number"]),
             models.Index(fields=["status"]),
             models.Index(fields=["slug"]),
+            # slug LIKE 'base%' lookups of the slug allocator (see catalog.services.slugs)
+            models.Index(fields=["slug"], opclasses=["varchar_pattern_ops"], name="catalog_proj_slug_like_idx"),
+            # Keyset pagination keys (see catalog.pagination.PROJECT_ORDERINGS);
+            # nullable columns are indexed through their non-null ordering key
+            models.Index(fields=["created_at", "id"], name="catalog_proj_created_id_idx"),
+            models.Index(fields=["updated_at", "id"], name="catalog_proj_updated_id_idx"),
+            models.Index(fields=["title", "id"], name="catalog_proj_title_id_idx"),
+            models.Index(PROJECT_ORDERING_KEYS["start_date_key"], F("id"), name="catalog_proj_start_id_idx"),
+            models.Index(PROJECT_ORDERING_KEYS["budget_key"], F("id"), name="catalog_proj_budget_id_idx"),
+            # Range filters and histograms (see catalog.filters.PROJECT_RANGE_FIELDS)
+            models.Index(fields=["budget"], name="catalog_proj_budget_idx"),
+            models.Index(fields=["area_sqm"], name="catalog_proj_area_idx"),
+            models.Index(fields=["total_area"], name="catalog_proj_total_area_idx"),
+            models.Index(fields=["floors_count"], name="catalog_proj_floors_idx"),
+            # Geohash prefix scans of bbox / radius queries (see catalog.services.geo)
+            models.Index(fields=["geohash"], opclasses=["varchar_pattern_ops"], name="catalog_proj_geohash_like_idx"),
+            # active_between overlap queries (see catalog.services.periods)
+            GistIndex(contract_period(), name="catalog_proj_contract_gist", condition=CONTRACT_PERIOD_CONDITION),
+            # Full-text search (see catalog.services.search)
+            GinIndex(fields=["search_vector"], name="catalog_proj_search_gin"),
+            # Partial (substring) matches on the normalized shadows
+            GinIndex(
+                fields=["municipal_file_number_normalized"],
+                opclasses=["gin_trgm_ops"],
+                name="catalog_proj_file_no_trgm",
+            ),
+            GinIndex(
+                fields=["title_normalized"],
+                opclasses=["gin_trgm_ops"],
+                name="catalog_proj_title_trgm",
+            ),
         ]
 
     def __str__(self):
@@ -96,20 +170,64 @@ class Project(BaseModel):
 
     def save(self, *args, **kwargs):
         """
-        Auto-generate a unique slug based on the project title if not provided.
+        Auto-generate a unique slug based on the project title if not provided,
+        and keep the full-text search vector in sync with the searchable fields.
         """
-        if not self.slug:
+        auto_slug = not self.slug
+        if auto_slug:
             self.slug = self.generate_unique_slug()
-        super().save(*args, **kwargs)
+
+        self.populate_computed_fields()
+        touched = set(PROJECT_SEARCH_FIELDS)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            touched &= set(update_fields)
+            computed = [f"{field}_normalized" for field in touched]
+            if {"latitude", "longitude"} & set(update_fields):
+                computed.append("geohash")
+            kwargs["update_fields"] = list(update_fields) + computed
+
+        # One transaction, so readers (and on-commit cache invalidation) never
+        # see the row without its matching search vector. A concurrent save may
+        # take the allocated slug first; allocate again and retry.
+        for attempt in range(1, self.SLUG_ATTEMPTS + 1):
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                    if touched:
+                        self.refresh_search_vector()
+                return
+            except IntegrityError:
+                if not auto_slug or attempt == self.SLUG_ATTEMPTS or not self._slug_taken():
+                    raise
+                self.slug = self.generate_unique_slug()
+
+    def populate_computed_fields(self):
+        """
+        Fill the columns derived from user input (normalized search shadows, geohash).
+
+        Called by save(); bulk code paths that bypass save() must call it themselves.
+        """
+        for field in PROJECT_SEARCH_FIELDS:
+            value = getattr(self, field)
+            setattr(self, f"{field}_normalized", normalize_persian(None if value is None else str(value)))
+        if self.latitude is None or self.longitude is None:
+            self.geohash = ""
+        else:
+            self.geohash = geohash_encode(float(self.latitude), float(self.longitude))
+
+    def refresh_search_vector(self):
+        """
+        Recompute ``search_vector`` in the database (one UPDATE, no signals).
+        """
+        type(self).objects.filter(pk=self.pk).update(search_vector=project_search_vector())
 
     def generate_unique_slug(self):
         """
-        Generate a unique slug from the project title.
+        Generate a unique slug from the project title (one query, see
+        catalog.services.slugs.allocate_slugs).
         """
-        base_slug = slugify(self.title)
-        slug = base_slug
-        num = 1
-        while Project.objects.filter(slug=slug).exists():
-            slug = f"{base_slug}-{num}"
-            num += 1
-        return slug
+        return allocate_slugs(Project, [self.title])[0]
+
+    def _slug_taken(self):
+        return Project.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
@@ -0,0 +1,34 @@
+from django.db import models
+
+from utility.bases.base_model import BaseModel
+
+
+class ProjectStatistic(BaseModel):
+    """
+    Pre-aggregated project totals for one value of one dimension
+    (e.g. ``status = "active"`` or ``month = "2025-03"``).
+
+    Maintained incrementally by catalog.services.statistics (signals and the
+    bulk writer) and rebuilt with ``manage.py rebuild_project_statistics``.
+    """
+
+    DIMENSION_CHOICES = [
+        ("status", "Status"),
+        ("owner", "Owner"),
+        ("month", "Start month"),
+    ]
+
+    dimension = models.CharField(max_length=16, choices=DIMENSION_CHOICES)
+    # Status value, owner id or "YYYY-MM" of start_date ("" without a start date)
+    key = models.CharField(max_length=64, blank=True)
+    project_count = models.BigIntegerField(default=0)
+    total_budget = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    total_area = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["dimension", "key"], name="catalog_stat_dimension_key_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}={self.key}: {self.project_count}"
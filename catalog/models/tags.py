@@ -1,11 +1,33 @@
 from django.db import models
 from django.utils.text import slugify
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
 from utility.bases.base_model import BaseModel
+from utility.persian import normalize_persian
 
 class Tag(BaseModel):
 
     name = models.CharField(max_length=50, unique=True)
+    # Normalized shadow of ``name`` (see utility.persian), filled in save().
+    name_normalized = models.TextField(blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["name_normalized"], name="catalog_tag_name_norm_idx"),
+            GinIndex(fields=["name_normalized"], opclasses=["gin_trgm_ops"], name="catalog_tag_name_trgm"),
+            # Change feed keyset (see catalog.services.changes)
+            models.Index(fields=["updated_at", "id"], name="catalog_tag_updated_id_idx"),
+        ]
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        """
+        Keep ``name_normalized`` in sync with ``name``.
+        """
+        self.name_normalized = normalize_persian(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = list(update_fields) + ["name_normalized"]
+        super().save(*args, **kwargs)
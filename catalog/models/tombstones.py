@@ -0,0 +1,31 @@
+from django.db import models
+
+from utility.bases.base_model import BaseModel
+
+
+class Tombstone(BaseModel):
+    """
+    Record of a deleted catalog row for the change feed (see catalog.services.changes).
+
+    Written by the post_delete signals; ``updated_at`` is the deletion time, so
+    tombstones are paged with the same ``(updated_at, id)`` keyset as live rows.
+    Pruned after ``CATALOG_TOMBSTONE_RETENTION_DAYS`` (``manage.py prune_tombstones``).
+    """
+
+    KIND_CHOICES = [
+        ("project", "Project"),
+        ("media", "Media"),
+        ("tag", "Tag"),
+    ]
+
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+
+    class Meta:
+        indexes = [
+            # Change feed keyset and retention pruning
+            models.Index(fields=["updated_at", "id"], name="catalog_tomb_updated_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id}"
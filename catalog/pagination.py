@@ -0,0 +1,62 @@
+from rest_framework.exceptions import ValidationError
+
+from catalog.services.ordering import PROJECT_ORDERING_KEYS
+from utility.pagination import KeysetPagination
+
+
+# Each public ordering maps to a deterministic (column, id) key.
+# Every key has a matching composite index on ``Project`` (see Project.Meta.indexes),
+# a single btree serves both directions through a backward index scan.
+# Orderings not listed here are rejected, so no request can trigger a full sort.
+PROJECT_ORDERINGS = {
+    "created_at": ("created_at", "id"),
+    "-created_at": ("-created_at", "-id"),
+    "updated_at": ("updated_at", "id"),
+    "-updated_at": ("-updated_at", "-id"),
+    "title": ("title", "id"),
+    "-title": ("-title", "-id"),
+    "start_date": ("start_date_key", "id"),
+    "-start_date": ("-start_date_key", "-id"),
+    "budget": ("budget_key", "id"),
+    "-budget": ("-budget_key", "-id"),
+}
+
+DEFAULT_PROJECT_ORDERING = "-created_at"
+
+
+class ProjectCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for the project catalog.
+
+    - Default page size comes from ``REST_FRAMEWORK['PAGE_SIZE']``.
+    - Clients may ask for up to ``max_page_size`` rows with ``?page_size=``.
+    """
+
+    max_page_size = 100
+
+    @staticmethod
+    def ordering_for(ordering_param):
+        """
+        Return the keyset ordering for a public ``ordering`` value.
+
+        Raises:
+            ValidationError: For orderings outside PROJECT_ORDERINGS.
+        """
+        ordering = PROJECT_ORDERINGS.get(ordering_param or DEFAULT_PROJECT_ORDERING)
+        if ordering is None:
+            raise ValidationError(
+                {"ordering": f"Unsupported ordering '{ordering_param}'. Allowed: {', '.join(PROJECT_ORDERINGS)}"}
+            )
+        return ordering
+
+    @staticmethod
+    def order(queryset, ordering):
+        """Return ``queryset`` ordered by ``ordering``, annotating any computed keys it uses."""
+        keys = {
+            name: PROJECT_ORDERING_KEYS[name]
+            for name in (field.lstrip("-") for field in ordering)
+            if name in PROJECT_ORDERING_KEYS
+        }
+        if keys:
+            queryset = queryset.annotate(**keys)
+        return queryset.order_by(*ordering)
@@ -0,0 +1,84 @@
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample, OpenApiParameter, inline_serializer
+from drf_spectacular.types import OpenApiTypes
+from rest_framework import serializers, status
+
+from catalog.serializers.medias import MediaSerializer
+from catalog.serializers.projects import ProjectDetailSerializer, TagSerializer
+
+
+# ------------------------------------------------------------------------
+# 🔹 Catalog Change Feed Schema
+# ------------------------------------------------------------------------
+class CatalogChangesSchema:
+    """🔄 Schema برای همگام‌سازی افزایشی کاتالوگ"""
+
+    changes_schema = extend_schema(
+        summary="تغییرات کاتالوگ از آخرین همگام‌سازی",
+        description=(
+            "پروژه‌ها، رسانه‌ها و تگ‌هایی که بعد از `cursor` تغییر کرده‌اند، به‌همراه شناسه موارد حذف‌شده.\n\n"
+            "- بدون `cursor` کل کاتالوگ (همگام‌سازی اولیه) صفحه به صفحه برگردانده می‌شود.\n"
+            "- ابتدا `projects`، `media` و `tags` را ذخیره/جایگزین کنید، سپس موارد `deleted` را حذف کنید.\n"
+            "- مقدار `cursor` پاسخ را نگه دارید و تا وقتی `has_more` برابر true است درخواست را تکرار کنید.\n"
+            "- تغییرات چند ثانیه آخر در درخواست بعدی می‌آیند (برای جلوگیری از جاافتادن تراکنش‌های کند).\n"
+            "- اگر `cursor` از مدت نگهداری حذف‌ها قدیمی‌تر باشد خطای ۴۱۰ برمی‌گردد و باید از ابتدا همگام‌سازی شود."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="مقدار `cursor` پاسخ قبلی (opaque)؛ خالی برای همگام‌سازی اولیه",
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="حداکثر تعداد ردیف از هر نوع در هر صفحه (پیش‌فرض ۵۰۰، حداکثر ۱۰۰۰)",
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                response=inline_serializer(
+                    name="CatalogChanges",
+                    fields={
+                        "projects": ProjectDetailSerializer(many=True),
+                        "media": MediaSerializer(many=True),
+                        "tags": TagSerializer(many=True),
+                        "deleted": inline_serializer(
+                            name="CatalogDeletions",
+                            fields={
+                                "projects": serializers.ListField(child=serializers.IntegerField()),
+                                "media": serializers.ListField(child=serializers.IntegerField()),
+                                "tags": serializers.ListField(child=serializers.IntegerField()),
+                            },
+                        ),
+                        "cursor": serializers.CharField(),
+                        "has_more": serializers.BooleanField(),
+                    },
+                ),
+                description="✅ تغییرات با موفقیت دریافت شد",
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="❌ مقدار `limit` نامعتبر است",
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                description="❌ `cursor` نامعتبر است",
+            ),
+            status.HTTP_410_GONE: OpenApiResponse(
+                description="❌ `cursor` منقضی شده است؛ همگام‌سازی را بدون `cursor` از ابتدا انجام دهید",
+            ),
+        },
+        examples=[
+            OpenApiExample(
+                "نمونه خروجی",
+                value={
+                    "projects": [],
+                    "media": [],
+                    "tags": [{"id": 3, "name": "تجاری"}],
+                    "deleted": {"projects": [12], "media": [], "tags": []},
+                    "cursor": "eyJ0YWdzIjpbIjIwMjYtMTAtMTdUMjE6MDA6MDArMDA6MDAiLDNdfQ",
+                    "has_more": False,
+                },
+            )
+        ],
+    )
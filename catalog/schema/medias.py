@@ -1,8 +1,9 @@
-from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample, OpenApiParameter
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample, OpenApiParameter, inline_serializer
+from drf_spectacular.types import OpenApiTypes
 
-from rest_framework import status
+from rest_framework import serializers, status
 
-from catalog.serializers.medias import MediaSerializer
+from catalog.serializers.medias import ChunkedUploadCreateSerializer, MediaSerializer
 
 
 class ProjectMediaUploadSchema:
@@ -10,7 +11,11 @@ class ProjectMediaUploadSchema:
 
     post_schema = extend_schema(
         summary="آپلود چند فایل به پروژه",
-        description="فایل‌های ارسالی به پروژه اضافه می‌شوند. فقط صاحب پروژه می‌تواند آپلود کند.",
+        description=(
+            "فایل‌های ارسالی به پروژه اضافه می‌شوند. فقط صاحب پروژه می‌تواند آپلود کند.\n\n"
+            "فایل‌ها به ترتیب ارسال بعد از رسانه‌های فعلی پروژه قرار می‌گیرند (`order`) و نوع هر فایل "
+            "(`image`، `video` یا `file`) از content type آن تعیین می‌شود. حداکثر ۵۰ فایل در هر درخواست."
+        ),
         request=None,  # فایل‌ها معمولا با form-data ارسال می‌شوند، می‌توان از OpenApiParameter برای توضیح استفاده کرد
         parameters=[
             OpenApiParameter(
@@ -51,6 +56,88 @@ class ProjectMediaUploadSchema:
                     )
                 ]
             ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="فایلی ارسال نشده یا تعداد فایل‌ها بیش از حد مجاز است",
+                examples=[OpenApiExample("خطا", value={"files": "No files uploaded."})]
+            ),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                description="کاربر اجازه آپلود ندارد",
+                examples=[OpenApiExample("خطا", value={"detail": "Not allowed"})]
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                description="پروژه یافت نشد",
+                examples=[OpenApiExample("خطا", value={"detail": "Not Found"})]
+            ),
+        },
+    )
+
+
+# ------------------------------------------------------------------------
+# 🔹 Resumable Chunked Upload Schema
+# ------------------------------------------------------------------------
+UploadSessionSerializer = inline_serializer(
+    name="UploadSession",
+    fields={
+        "id": serializers.UUIDField(),
+        "project": serializers.IntegerField(),
+        "filename": serializers.CharField(),
+        "content_type": serializers.CharField(),
+        "size": serializers.IntegerField(),
+        "offset": serializers.IntegerField(help_text="تعداد بایت‌های دریافت‌شده؛ بخش بعدی از این بایت شروع می‌شود"),
+        "complete": serializers.BooleanField(),
+        "expires_in": serializers.IntegerField(allow_null=True, help_text="ثانیه تا انقضای نشست بدون دریافت بخش جدید"),
+    },
+)
+
+UPLOAD_SESSION_EXAMPLE = {
+    "id": "3f1c7a52-9a0e-4c1b-8d0f-2b7e51c0a9d4",
+    "project": 1,
+    "filename": "survey.mp4",
+    "content_type": "video/mp4",
+    "size": 52428800,
+    "offset": 8388608,
+    "complete": False,
+    "expires_in": 86400,
+}
+
+UPLOAD_ID_PARAMETER = OpenApiParameter(
+    name="upload_id",
+    type=OpenApiTypes.UUID,
+    location=OpenApiParameter.PATH,
+    description="شناسه نشست آپلود",
+)
+
+UPLOAD_NOT_FOUND = OpenApiResponse(
+    description="نشست آپلود وجود ندارد، منقضی شده یا متعلق به کاربر دیگری است",
+    examples=[OpenApiExample("خطا", value={"detail": "Upload not found or expired."})]
+)
+
+
+class ChunkedUploadSchema:
+    """📦 Schema برای آپلود تکه‌تکه و قابل ادامه فایل‌های بزرگ"""
+
+    create_schema = extend_schema(
+        summary="شروع آپلود تکه‌تکه یک فایل بزرگ",
+        description=(
+            "یک نشست آپلود برای یک فایل پروژه باز می‌کند. فقط صاحب پروژه می‌تواند آپلود کند.\n\n"
+            "مراحل:\n"
+            "1. با این درخواست نشست را بسازید و `id` را نگه دارید.\n"
+            "2. بخش‌های فایل را به ترتیب با `PUT /uploads/{id}` و هدر `Content-Range` بفرستید.\n"
+            "3. در صورت قطع ارتباط، `offset` را با `GET /uploads/{id}` بخوانید و از همان‌جا ادامه دهید.\n"
+            "4. بعد از دریافت کامل، با `POST /uploads/{id}/commit` فایل به رسانه‌های پروژه اضافه می‌شود.\n\n"
+            "نشستی که ۲۴ ساعت بخشی دریافت نکند منقضی می‌شود."
+        ),
+        request=ChunkedUploadCreateSerializer,
+        responses={
+            status.HTTP_201_CREATED: OpenApiResponse(
+                response=UploadSessionSerializer,
+                description="نشست آپلود ساخته شد",
+                examples=[OpenApiExample("موفق", value={**UPLOAD_SESSION_EXAMPLE, "offset": 0, "content_type": "video/mp4"})]
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="داده نامعتبر یا فایل بزرگ‌تر از حد مجاز",
+                examples=[OpenApiExample("خطا", value={"size": ["Files larger than 4294967296 bytes are not accepted."]})]
+            ),
             status.HTTP_403_FORBIDDEN: OpenApiResponse(
                 description="کاربر اجازه آپلود ندارد",
                 examples=[OpenApiExample("خطا", value={"detail": "Not allowed"})]
@@ -61,3 +148,86 @@ class ProjectMediaUploadSchema:
             ),
         },
     )
+
+    retrieve_schema = extend_schema(
+        summary="وضعیت نشست آپلود",
+        description="تعداد بایت‌های دریافت‌شده (`offset`) را برمی‌گرداند تا آپلود از همان نقطه ادامه یابد.",
+        parameters=[UPLOAD_ID_PARAMETER],
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                response=UploadSessionSerializer,
+                description="وضعیت نشست",
+                examples=[OpenApiExample("موفق", value=UPLOAD_SESSION_EXAMPLE)]
+            ),
+            status.HTTP_404_NOT_FOUND: UPLOAD_NOT_FOUND,
+        },
+    )
+
+    chunk_schema = extend_schema(
+        summary="ارسال یک بخش از فایل",
+        description=(
+            "بدنه درخواست بایت‌های خام بخش است و هدر `Content-Range` محل آن را مشخص می‌کند، "
+            "مثلا `bytes 8388608-16777215/52428800`.\n\n"
+            "- بخش باید از `offset` فعلی یا قبل از آن شروع شود (ارسال دوباره یک بخش مجاز است).\n"
+            "- اگر ارتباط وسط بخش قطع شود، بایت‌های رسیده ذخیره می‌شوند و `offset` جلو می‌رود.\n"
+            "- هم‌زمان فقط یک بخش از هر نشست پذیرفته می‌شود."
+        ),
+        parameters=[
+            UPLOAD_ID_PARAMETER,
+            OpenApiParameter(
+                name="Content-Range",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.HEADER,
+                required=True,
+                description="محدوده بایت‌های بخش: `bytes <start>-<end>/<size>`",
+            ),
+        ],
+        request={"application/octet-stream": OpenApiTypes.BINARY},
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                response=UploadSessionSerializer,
+                description="بخش ذخیره شد",
+                examples=[OpenApiExample("موفق", value={**UPLOAD_SESSION_EXAMPLE, "offset": 16777216})]
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="هدر `Content-Range` نامعتبر است یا با اندازه بدنه/فایل نمی‌خواند",
+                examples=[OpenApiExample("خطا", value={"Content-Range": "Expected 'bytes <start>-<end>/<size>'."})]
+            ),
+            status.HTTP_404_NOT_FOUND: UPLOAD_NOT_FOUND,
+            status.HTTP_409_CONFLICT: OpenApiResponse(
+                description="بخش بعد از `offset` شروع می‌شود یا بخش دیگری در حال دریافت است",
+                examples=[OpenApiExample("خطا", value={"detail": "Chunk starts at 16777216, the upload continues at 8388608."})]
+            ),
+        },
+    )
+
+    abort_schema = extend_schema(
+        summary="لغو نشست آپلود",
+        description="نشست و بایت‌های دریافت‌شده آن حذف می‌شوند.",
+        parameters=[UPLOAD_ID_PARAMETER],
+        responses={
+            status.HTTP_204_NO_CONTENT: OpenApiResponse(description="نشست لغو شد"),
+            status.HTTP_404_NOT_FOUND: UPLOAD_NOT_FOUND,
+        },
+    )
+
+    commit_schema = extend_schema(
+        summary="پایان آپلود و افزودن فایل به پروژه",
+        description=(
+            "فایل کامل‌شده بعد از رسانه‌های فعلی پروژه اضافه می‌شود و نشست بسته می‌شود. "
+            "نوع رسانه از content type فایل تعیین می‌شود."
+        ),
+        parameters=[UPLOAD_ID_PARAMETER],
+        request=None,
+        responses={
+            status.HTTP_201_CREATED: OpenApiResponse(
+                response=MediaSerializer,
+                description="رسانه ساخته شد",
+            ),
+            status.HTTP_404_NOT_FOUND: UPLOAD_NOT_FOUND,
+            status.HTTP_409_CONFLICT: OpenApiResponse(
+                description="هنوز همه بایت‌های فایل دریافت نشده است",
+                examples=[OpenApiExample("خطا", value={"detail": "Upload is incomplete: 8388608 of 52428800 bytes received."})]
+            ),
+        },
+    )
@@ -3,17 +3,71 @@ from drf_spectacular.utils import (
     OpenApiResponse,
     OpenApiExample,
     OpenApiParameter,
+    inline_serializer,
 )
 from drf_spectacular.types import OpenApiTypes
-from rest_framework import status
+from rest_framework import serializers, status
 
+from catalog.filters import PROJECT_RANGE_FIELDS
+from catalog.pagination import PROJECT_ORDERINGS
 from catalog.serializers.projects import (
+    ProjectBulkItemSerializer,
     ProjectListSerializer,
     ProjectDetailSerializer,
     ProjectWriteSerializer,
 )
 
 
+RANGE_FIELD_LABELS = {
+    "budget": "بودجه",
+    "area_sqm": "مساحت زمین (متر مربع)",
+    "total_area": "متراژ کل پروژه (متر مربع)",
+    "floors_count": "تعداد طبقات",
+}
+
+# <field>_min / <field>_max for every field of catalog.filters.PROJECT_RANGE_FIELDS,
+# plus the contract period overlap and map (bbox / radius) filters
+RANGE_PARAMETERS = [
+    *(
+        OpenApiParameter(
+            name=f"{name}_{suffix}",
+            type=OpenApiTypes.NUMBER,
+            location=OpenApiParameter.QUERY,
+            description=f"{label} {RANGE_FIELD_LABELS[name]} (شامل خود مقدار)",
+        )
+        for name in PROJECT_RANGE_FIELDS
+        for suffix, label in (("min", "حداقل"), ("max", "حداکثر"))
+    ),
+    OpenApiParameter(
+        name="active_between",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description=(
+            "پروژه‌هایی که دوره قرارداد آن‌ها (`start_date` تا `end_date`) با این بازه هم‌پوشانی دارد، "
+            "به شکل `2025-03-01,2025-03-31` یا یک روز؛ قرارداد بدون تاریخ پایان، باز (بدون پایان) در نظر گرفته می‌شود"
+        ),
+    ),
+    OpenApiParameter(
+        name="bbox",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description="محدوده نقشه به شکل `west,south,east,north` (درجه)، مثلاً `51.30,35.68,51.45,35.72`",
+    ),
+    OpenApiParameter(
+        name="near",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description="نقطه مرکز جستجوی شعاعی به شکل `lat,lng` (همراه با `radius`)",
+    ),
+    OpenApiParameter(
+        name="radius",
+        type=OpenApiTypes.NUMBER,
+        location=OpenApiParameter.QUERY,
+        description="شعاع جستجو از `near` به متر (حداکثر ۱۰۰٬۰۰۰)",
+    ),
+]
+
+
 # ------------------------------------------------------------------------
 # 🔹 Project List & Create Schema
 # ------------------------------------------------------------------------
@@ -27,8 +81,20 @@ class ProjectListCreateSchema:
             "پارامترهای پشتیبانی‌شده:\n"
             "- `status`: فیلتر بر اساس وضعیت پروژه (مثلاً active, draft, completed)\n"
             "- `featured`: فیلتر پروژه‌های ویژه (true/false)\n"
-            "- `search`: جستجو در عنوان، نام مالک، شماره پرونده و آدرس\n"
-            "- `ordering`: مرتب‌سازی بر اساس هر فیلد (مثلاً `-created_at`, `title`)"
+            "- `tags`: فیلتر بر اساس شناسه تگ‌ها (`1,4`)، همراه با `tags_match=any|all`\n"
+            "- `budget_min`/`budget_max`، `area_sqm_min`/`area_sqm_max`، `total_area_min`/`total_area_max`، "
+            "`floors_count_min`/`floors_count_max`: فیلتر بازه‌ای (شامل دو سر بازه)\n"
+            "- `active_between`: پروژه‌های دارای قرارداد فعال در بازه (`2025-03-01,2025-03-31`)\n"
+            "- `bbox`: فقط پروژه‌های داخل محدوده نقشه (`west,south,east,north`)؛ "
+            "`near` و `radius`: پروژه‌های تا فاصله `radius` متر از نقطه `lat,lng`\n"
+            "- `search`: جستجوی تمام‌متن در عنوان، نام مالک، شماره پرونده و آدرس "
+            "(بدون `ordering` بر اساس میزان ارتباط مرتب می‌شود)\n"
+            "- `ordering`: مرتب‌سازی (`created_at`, `updated_at`, `title`, `start_date`, `budget` و معکوس آن‌ها "
+            "با `-`؛ مقادیر دیگر با خطای ۴۰۰ رد می‌شوند)\n"
+            "- `cursor`: مکان‌نمای صفحه بعد/قبل (از `next` و `previous` پاسخ)\n"
+            "- `page_size`: تعداد نتایج در هر صفحه (حداکثر ۱۰۰)\n"
+            "- `fields`: فقط فیلدهای مشخص‌شده برگردانده می‌شوند (مثلاً `id,title,slug`)\n"
+            "- `expand`: افزودن داده‌های تو در تو (فعلاً `media`)"
         ),
         parameters=[
             OpenApiParameter(
@@ -43,6 +109,20 @@ class ProjectListCreateSchema:
                 location=OpenApiParameter.QUERY,
                 description="نمایش فقط پروژه‌های ویژه (true/false)",
             ),
+            OpenApiParameter(
+                name="tags",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="شناسه تگ‌ها، جداشده با کاما (مثلاً `1,4`)؛ پروژه باید همه آن‌ها را داشته باشد",
+            ),
+            OpenApiParameter(
+                name="tags_match",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=["all", "any"],
+                description="`any`: داشتن حداقل یکی از تگ‌ها کافی است (پیش‌فرض `all`)",
+            ),
+            *RANGE_PARAMETERS,
             OpenApiParameter(
                 name="search",
                 type=OpenApiTypes.STR,
@@ -53,14 +133,52 @@ class ProjectListCreateSchema:
                 name="ordering",
                 type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
+                enum=list(PROJECT_ORDERINGS),
                 description="مرتب‌سازی پروژه‌ها (مثلاً `-created_at` یا `title`)",
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="مکان‌نمای صفحه‌بندی (مقدار opaque از `next` یا `previous`)",
+            ),
+            OpenApiParameter(
+                name="page_size",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="تعداد پروژه‌ها در هر صفحه (پیش‌فرض ۲۰، حداکثر ۱۰۰)",
+            ),
+            OpenApiParameter(
+                name="fields",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="فیلدهای خروجی، جداشده با کاما (مثلاً `id,title,slug`)؛ نام نامعتبر خطای ۴۰۰ می‌دهد",
+            ),
+            OpenApiParameter(
+                name="expand",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="داده‌های تو در تو برای افزودن به خروجی، جداشده با کاما (مقادیر مجاز: `media`)",
+            ),
         ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
-                response=ProjectListSerializer(many=True),
+                response=inline_serializer(
+                    name="PaginatedProjectList",
+                    fields={
+                        "next": serializers.URLField(allow_null=True),
+                        "previous": serializers.URLField(allow_null=True),
+                        "results": ProjectListSerializer(many=True),
+                    },
+                ),
                 description="✅ لیست پروژه‌ها با موفقیت دریافت شد",
             ),
+            status.HTTP_304_NOT_MODIFIED: OpenApiResponse(
+                description="لیست از آخرین دریافت تغییری نکرده است (If-None-Match)",
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="❌ نام نامعتبر در `fields` یا `expand`، `ordering` پشتیبانی‌نشده یا مقدار نامعتبر بازه",
+            ),
             status.HTTP_500_INTERNAL_SERVER_ERROR: OpenApiResponse(
                 description="❌ خطا در دریافت لیست پروژه‌ها",
             ),
@@ -68,19 +186,29 @@ class ProjectListCreateSchema:
         examples=[
             OpenApiExample(
                 "نمونه خروجی",
-                value=[
-                    {
-                        "id": 1,
-                        "title": "ساخت برج اداری",
-                        "slug": "office-tower",
-                        "municipal_file_number": "MUN-1403-01",
-                        "owner_name": "علی احمدی",
-                        "status": "ongoing",
-                        "featured": True,
-                        "cover": "/media/projects/cover1.jpg",
-                        "created_at": "2025-01-01T08:00:00Z",
-                    }
-                ],
+                value={
+                    "next": "http://example.com/api/catalog/projects?cursor=eyJvIjpbIi1jcmVhdGVkX2F0Il19",
+                    "previous": None,
+                    "results": [
+                        {
+                            "id": 1,
+                            "title": "ساخت برج اداری",
+                            "slug": "office-tower",
+                            "municipal_file_number": "MUN-1403-01",
+                            "owner_name": "علی احمدی",
+                            "status": "ongoing",
+                            "featured": True,
+                            "cover": "/media/projects/cover1.jpg",
+                            "cover_srcset": {
+                                "webp": "/media/projects/covers/derived/cover1.jpg/320w.webp 320w, "
+                                        "/media/projects/covers/derived/cover1.jpg/640w.webp 640w",
+                                "jpeg": "/media/projects/covers/derived/cover1.jpg/320w.jpg 320w, "
+                                        "/media/projects/covers/derived/cover1.jpg/640w.jpg 640w",
+                            },
+                            "created_at": "2025-01-01T08:00:00Z",
+                        }
+                    ],
+                },
             )
         ],
     )
@@ -130,12 +258,35 @@ class ProjectDetailSchema:
 
     retrieve_schema = extend_schema(
         summary="دریافت جزئیات پروژه",
-        description="دریافت اطلاعات کامل پروژه بر اساس شناسه یا slug.",
+        description=(
+            "دریافت اطلاعات کامل پروژه بر اساس شناسه یا slug.\n\n"
+            "با `fields` می‌توان خروجی را محدود کرد و با `expand=media` رسانه‌های پروژه را هم دریافت کرد."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="fields",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="فیلدهای خروجی، جداشده با کاما (مثلاً `id,title,slug`)؛ نام نامعتبر خطای ۴۰۰ می‌دهد",
+            ),
+            OpenApiParameter(
+                name="expand",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="داده‌های تو در تو برای افزودن به خروجی، جداشده با کاما (مقادیر مجاز: `media`)",
+            ),
+        ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
                 response=ProjectDetailSerializer,
                 description="✅ جزئیات پروژه با موفقیت دریافت شد",
             ),
+            status.HTTP_304_NOT_MODIFIED: OpenApiResponse(
+                description="پروژه از آخرین دریافت تغییری نکرده است (If-None-Match / If-Modified-Since)",
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="❌ نام نامعتبر در `fields` یا `expand`",
+            ),
             status.HTTP_404_NOT_FOUND: OpenApiResponse(
                 description="❌ پروژه یافت نشد",
             ),
@@ -218,3 +369,301 @@ class ProjectDetailSchema:
             ),
         },
     )
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Export Schema
+# ------------------------------------------------------------------------
+class ProjectExportSchema:
+    """📙 Schema برای خروجی گرفتن از کل پروژه‌ها"""
+
+    export_schema = extend_schema(
+        summary="خروجی کامل پروژه‌ها (NDJSON / CSV)",
+        description=(
+            "خروجی همه پروژه‌ها به‌صورت جریانی (streaming) و بدون صفحه‌بندی، برای گزارش‌های شهرداری.\n\n"
+            "- `export.ndjson`: هر خط یک پروژه به شکل JSON (همان خروجی جزئیات پروژه)\n"
+            "- `export.csv`: فایل CSV با سرستون؛ تگ‌ها با `|` از هم جدا می‌شوند\n\n"
+            "فیلترهای `status`، `featured`، `tags`، فیلترهای بازه‌ای، `search` و `ordering` مانند لیست پروژه‌ها پشتیبانی می‌شوند."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="file_format",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                enum=["ndjson", "csv"],
+                description="قالب خروجی",
+            ),
+            OpenApiParameter(
+                name="status",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="فیلتر بر اساس وضعیت پروژه",
+            ),
+            OpenApiParameter(
+                name="featured",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="فقط پروژه‌های ویژه (true/false)",
+            ),
+            OpenApiParameter(
+                name="tags",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="شناسه تگ‌ها، جداشده با کاما (مثلاً `1,4`)؛ پروژه باید همه آن‌ها را داشته باشد",
+            ),
+            OpenApiParameter(
+                name="tags_match",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=["all", "any"],
+                description="`any`: داشتن حداقل یکی از تگ‌ها کافی است (پیش‌فرض `all`)",
+            ),
+            *RANGE_PARAMETERS,
+            OpenApiParameter(
+                name="search",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="جستجو در عنوان، شماره پرونده، نام مالک یا آدرس پروژه",
+            ),
+            OpenApiParameter(
+                name="ordering",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=list(PROJECT_ORDERINGS),
+                description="مرتب‌سازی (مانند لیست پروژه‌ها)",
+            ),
+        ],
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description="✅ هر خط یک پروژه (JSON)",
+            ),
+            (status.HTTP_200_OK, "text/csv"): OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description="✅ فایل CSV پروژه‌ها",
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="❌ `ordering` پشتیبانی‌نشده",
+            ),
+            status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
+                description="❌ نیاز به ورود کاربر دارد",
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                description="❌ قالب خروجی پشتیبانی نمی‌شود",
+            ),
+        },
+    )
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Bulk Schema
+# ------------------------------------------------------------------------
+class ProjectBulkSchema:
+    """📒 Schema برای ایجاد/ویرایش دسته‌ای پروژه‌ها"""
+
+    bulk_schema = extend_schema(
+        summary="ایجاد یا ویرایش دسته‌ای پروژه‌ها",
+        description=(
+            "لیستی از پروژه‌ها را در یک تراکنش ذخیره می‌کند (برای ورود اطلاعات از شهرداری).\n\n"
+            "- پروژه‌ها بر اساس `municipal_file_number` شناسایی می‌شوند: شماره جدید ایجاد و شماره موجود ویرایش می‌شود\n"
+            "- اگر شماره پرونده‌ای متعلق به کاربر دیگری باشد کل درخواست رد می‌شود (403)\n"
+            "- `tags` لیست شناسه تگ‌هاست و جایگزین تگ‌های فعلی پروژه می‌شود\n"
+            "- حداکثر ۵۰۰۰ پروژه در هر درخواست"
+        ),
+        request=ProjectBulkItemSerializer(many=True),
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                response=inline_serializer(
+                    name="ProjectBulkResult",
+                    fields={
+                        "created": serializers.ListField(child=serializers.DictField()),
+                        "updated": serializers.ListField(child=serializers.DictField()),
+                    },
+                ),
+                description="✅ پروژه‌ها با موفقیت ذخیره شدند",
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="❌ داده‌های ارسالی نامعتبر است",
+            ),
+            status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
+                description="❌ نیاز به ورود کاربر دارد",
+            ),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                description="❌ شماره پرونده متعلق به کاربر دیگری است",
+            ),
+        },
+        examples=[
+            OpenApiExample(
+                "نمونه درخواست",
+                value=[
+                    {"title": "مجتمع مسکونی نور", "municipal_file_number": "MUN-1403-11", "status": "active", "tags": [1]},
+                    {"title": "پارک محله", "municipal_file_number": "MUN-1403-12", "tags": []},
+                ],
+                request_only=True,
+            )
+        ],
+    )
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Facets Schema
+# ------------------------------------------------------------------------
+class ProjectFacetsSchema:
+    """📊 Schema برای شمارش پروژه‌ها به تفکیک فیلترها"""
+
+    facets_schema = extend_schema(
+        summary="شمارش پروژه‌ها به تفکیک وضعیت، ویژه بودن و تگ",
+        description=(
+            "همه شمارش‌های نوار کناری در یک درخواست.\n\n"
+            "فیلترهای `status`، `featured`، `tags`، فیلترهای بازه‌ای و `search` مانند لیست پروژه‌ها اعمال می‌شوند؛ "
+            "شمارش هر گروه بدون فیلتر همان گروه محاسبه می‌شود تا گزینه‌های دیگر هم قابل انتخاب بمانند. "
+            "`total` تعداد پروژه‌های لیست با همه فیلترهاست.\n\n"
+            "نتیجه تا تغییر بعدی کاتالوگ کش می‌شود."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="status",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="فیلتر بر اساس وضعیت پروژه",
+            ),
+            OpenApiParameter(
+                name="featured",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="فقط پروژه‌های ویژه (true/false)",
+            ),
+            OpenApiParameter(
+                name="tags",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="شناسه تگ‌ها، جداشده با کاما (مثلاً `1,4`)؛ پروژه باید همه آن‌ها را داشته باشد",
+            ),
+            OpenApiParameter(
+                name="tags_match",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=["all", "any"],
+                description="`any`: داشتن حداقل یکی از تگ‌ها کافی است (پیش‌فرض `all`)",
+            ),
+            *RANGE_PARAMETERS,
+            OpenApiParameter(
+                name="search",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="جستجو در عنوان، شماره پرونده، نام مالک یا آدرس پروژه",
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                response=inline_serializer(
+                    name="ProjectFacets",
+                    fields={
+                        "total": serializers.IntegerField(),
+                        "status": serializers.ListField(child=serializers.DictField()),
+                        "featured": serializers.ListField(child=serializers.DictField()),
+                        "tags": serializers.ListField(child=serializers.DictField()),
+                    },
+                ),
+                description="✅ شمارش‌ها با موفقیت دریافت شد",
+            ),
+        },
+        examples=[
+            OpenApiExample(
+                "نمونه خروجی",
+                value={
+                    "total": 12,
+                    "status": [
+                        {"value": "active", "label": "Active", "count": 9},
+                        {"value": "completed", "label": "Completed", "count": 3},
+                    ],
+                    "featured": [{"value": True, "count": 4}, {"value": False, "count": 8}],
+                    "tags": [{"id": 3, "name": "تجاری", "count": 5}],
+                },
+            )
+        ],
+    )
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Histograms Schema
+# ------------------------------------------------------------------------
+class ProjectHistogramsSchema:
+    """📊 Schema برای توزیع بازه‌ای بودجه، مساحت و تعداد طبقات"""
+
+    histograms_schema = extend_schema(
+        summary="هیستوگرام بودجه، مساحت و تعداد طبقات پروژه‌ها",
+        description=(
+            "توزیع مقادیر برای اسلایدرهای فیلتر بازه‌ای، همه فیلدها در یک کوئری.\n\n"
+            "بازه حداقل تا حداکثر هر فیلد (روی پروژه‌های فیلترشده) به `buckets` بخش مساوی تقسیم می‌شود. "
+            "فیلترهای لیست پروژه‌ها اعمال می‌شوند، به جز فیلتر بازه‌ای خود همان فیلد تا کل توزیع دیده شود. "
+            "پروژه‌های بدون مقدار در هیستوگرام آن فیلد شمرده نمی‌شوند.\n\n"
+            "نتیجه تا تغییر بعدی کاتالوگ کش می‌شود."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="fields",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "فیلدها، جداشده با کاما (مقادیر مجاز: "
+                    f"{', '.join(f'`{name}`' for name in PROJECT_RANGE_FIELDS)}؛ پیش‌فرض همه)"
+                ),
+            ),
+            OpenApiParameter(
+                name="buckets",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="تعداد بخش‌های هر هیستوگرام (پیش‌فرض ۱۰، حداکثر ۵۰)",
+            ),
+            OpenApiParameter(
+                name="status",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="فیلتر بر اساس وضعیت پروژه",
+            ),
+            OpenApiParameter(
+                name="featured",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="فقط پروژه‌های ویژه (true/false)",
+            ),
+            OpenApiParameter(
+                name="tags",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="شناسه تگ‌ها، جداشده با کاما (مثلاً `1,4`)",
+            ),
+            *RANGE_PARAMETERS,
+            OpenApiParameter(
+                name="search",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="جستجو در عنوان، شماره پرونده، نام مالک یا آدرس پروژه",
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                response=OpenApiTypes.OBJECT,
+                description="✅ هیستوگرام هر فیلد (`min`، `max` و لیست `buckets`)",
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="❌ فیلد ناشناخته، `buckets` نامعتبر یا مقدار نامعتبر بازه",
+            ),
+        },
+        examples=[
+            OpenApiExample(
+                "نمونه خروجی",
+                value={
+                    "floors_count": {
+                        "min": 1.0,
+                        "max": 9.0,
+                        "buckets": [
+                            {"lower": 1.0, "upper": 5.0, "count": 14},
+                            {"lower": 5.0, "upper": 9.0, "count": 3},
+                        ],
+                    }
+                },
+            )
+        ],
+    )
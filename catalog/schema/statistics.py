@@ -0,0 +1,75 @@
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample, OpenApiParameter, inline_serializer
+from drf_spectacular.types import OpenApiTypes
+from rest_framework import serializers, status
+
+
+def _rollups(name):
+    return serializers.ListField(
+        child=inline_serializer(
+            name=name,
+            fields={
+                "key": serializers.CharField(),
+                "project_count": serializers.IntegerField(),
+                "total_budget": serializers.DecimalField(max_digits=20, decimal_places=2),
+                "total_area": serializers.DecimalField(max_digits=18, decimal_places=2),
+            },
+        )
+    )
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Statistics Schema
+# ------------------------------------------------------------------------
+class ProjectStatisticsSchema:
+    """📈 Schema برای آمار تجمیعی پروژه‌ها"""
+
+    statistics_schema = extend_schema(
+        summary="آمار تجمیعی پروژه‌ها",
+        description=(
+            "تعداد پروژه‌ها، مجموع بودجه و مجموع متراژ به تفکیک وضعیت (`status`)، "
+            "مالک (`owner`، شناسه کاربر) و ماه شروع قرارداد (`month`، به شکل `YYYY-MM`؛ "
+            "کلید خالی یعنی بدون تاریخ شروع).\n\n"
+            "مقادیر از پیش محاسبه شده‌اند و با هر تغییر پروژه به‌روز می‌شوند، "
+            "پس زمان پاسخ به تعداد پروژه‌ها بستگی ندارد. فقط برای مدیران سیستم."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="dimensions",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="تفکیک‌های مورد نیاز، جداشده با کاما (`status`, `owner`, `month`؛ پیش‌فرض همه)",
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                response=inline_serializer(
+                    name="ProjectStatistics",
+                    fields={
+                        "status": _rollups("ProjectStatusRollup"),
+                        "owner": _rollups("ProjectOwnerRollup"),
+                        "month": _rollups("ProjectMonthRollup"),
+                    },
+                ),
+                description="✅ آمار با موفقیت دریافت شد",
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="❌ تفکیک ناشناخته",
+            ),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(
+                description="❌ فقط مدیران سیستم دسترسی دارند",
+            ),
+        },
+        examples=[
+            OpenApiExample(
+                "نمونه خروجی",
+                value={
+                    "status": [
+                        {"key": "active", "project_count": 9, "total_budget": "1250000000.00", "total_area": "5400.00"}
+                    ],
+                    "month": [
+                        {"key": "2025-03", "project_count": 2, "total_budget": "300000000.00", "total_area": "820.50"}
+                    ],
+                },
+            )
+        ],
+    )
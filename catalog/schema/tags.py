@@ -1,4 +1,5 @@
-from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
 from rest_framework import status
 from catalog.serializers.projects import TagSerializer
 
@@ -8,12 +9,23 @@ class TagListCreateSchema:
 
     list_schema = extend_schema(
         summary="لیست تمام Tagها",
-        description="دریافت لیست همه Tagها",
+        description="دریافت لیست همه Tagها (با امکان جستجو در نام)",
+        parameters=[
+            OpenApiParameter(
+                name="search",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="جستجو در نام Tag (حساس نبودن به ی/ک عربی، نیم‌فاصله و ارقام فارسی)",
+            ),
+        ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
                 response=TagSerializer(many=True),
                 description="لیست Tagها با موفقیت دریافت شد",
             ),
+            status.HTTP_304_NOT_MODIFIED: OpenApiResponse(
+                description="لیست Tagها تغییری نکرده است (If-None-Match)",
+            ),
         },
     )
 
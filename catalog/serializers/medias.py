@@ -1,5 +1,36 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from catalog.models.medias import Media
+from catalog.services.images import srcset
+
+
+@extend_schema_field(
+    serializers.DictField(
+        child=serializers.CharField(),
+        help_text='نسخه‌های کوچک‌شده تصویر برای srcset به تفکیک فرمت؛ تا ساخته شدن نسخه‌ها خالی است',
+    )
+)
+class SrcsetField(serializers.Field):
+    """
+    ``srcset`` strings per format from a variants JSON column (see catalog.services.images).
+
+    URLs are absolute when the context has a request, like DRF's FileField.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, variants):
+        request = self.context.get("request")
+
+        def url(name):
+            location = default_storage.url(name)
+            return request.build_absolute_uri(location) if request is not None else location
+
+        return srcset(variants or {}, url)
 
 
 class MediaSerializer(serializers.ModelSerializer):
@@ -16,6 +47,9 @@ class MediaSerializer(serializers.ModelSerializer):
     # uploaded_at should be read-only
     uploaded_at = serializers.DateTimeField(read_only=True)
 
+    # Resized copies of images, for <img srcset>
+    srcset = SrcsetField(source='variants')
+
     class Meta:
         model = Media
         fields = [
@@ -23,12 +57,13 @@ class MediaSerializer(serializers.ModelSerializer):
             'project',
             'project_title',
             'file',
+            'srcset',
             'caption',
             'type',
             'order',
             'uploaded_at',
         ]
-        read_only_fields = ['id', 'project_title', 'uploaded_at']
+        read_only_fields = ['id', 'project_title', 'srcset', 'uploaded_at']
 
     def validate_type(self, value):
         """Ensure the type matches the uploaded file format"""
@@ -54,3 +89,21 @@ class MediaSerializer(serializers.ModelSerializer):
             if media_type == 'file' and content_type in ['image', 'video']:
                 raise serializers.ValidationError("Uploaded file cannot be an image or video for type 'file'")
         return attrs
+
+
+class ChunkedUploadCreateSerializer(serializers.Serializer):
+    """
+    Opens a resumable upload session (see catalog.services.uploads).
+
+    - ``content_type`` is guessed from the file name when omitted.
+    """
+
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
+    content_type = serializers.CharField(max_length=100, required=False, allow_blank=True, default="")
+    caption = serializers.CharField(max_length=180, required=False, allow_blank=True, default="")
+
+    def validate_size(self, value):
+        if value > settings.CATALOG_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(f"Files larger than {settings.CATALOG_UPLOAD_MAX_SIZE} bytes are not accepted.")
+        return value
@@ -0,0 +1,23 @@
+class SparseFieldsetMixin:
+    """
+    Serializer mixin for ``?fields=`` / ``?expand=`` (see catalog.services.fieldsets).
+
+    - ``context["fields"]``: if set, only these fields are rendered.
+    - ``context["expand"]``: names from ``Meta.expandable_fields`` to add. Each value
+      there is a zero-argument factory returning the nested serializer field.
+
+    Without those context keys the serializer behaves exactly like before.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        expand = self.context.get("expand") or ()
+        for name, factory in getattr(self.Meta, "expandable_fields", {}).items():
+            if name in expand:
+                fields[name] = factory()
+
+        requested = self.context.get("fields")
+        if requested:
+            fields = {name: field for name, field in fields.items() if name in requested or name in expand}
+        return fields
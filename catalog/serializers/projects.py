@@ -1,6 +1,13 @@
+from collections import Counter
+
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from catalog.models import Project
 from catalog.models.tags import Tag
+from catalog.serializers.medias import MediaSerializer, SrcsetField
+from catalog.services.bulk import ProjectBulkWriter
+from catalog.serializers.mixins import SparseFieldsetMixin
+from utility.persian import normalize_persian
 
 
 # ------------------------------------------------------------------------
@@ -12,14 +19,39 @@ class TagSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
         read_only_fields = ["id"]
 
+    def validate_name(self, value):
+        """
+        Reject names that only differ from an existing tag in Persian spelling
+        variants (Arabic ye/kaf, ZWNJ, digits).
+        """
+        duplicates = Tag.objects.filter(name_normalized=normalize_persian(value))
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError("A tag with an equivalent name already exists.")
+        return value
+
+
+@extend_schema_field(TagSerializer(many=True))
+class TagSnapshotField(serializers.ReadOnlyField):
+    """
+    Tags rendered from ``Project.tags_snapshot`` (same shape as TagSerializer,
+    no join or prefetch needed).
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("source", "tags_snapshot")
+        super().__init__(**kwargs)
+
 
 # ------------------------------------------------------------------------
 # 🔹 Project List Serializer
 # فقط فیلدهایی که در لیست نیاز داریم (برای performance)
 # ------------------------------------------------------------------------
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     owner_name = serializers.CharField(source="owner.get_full_name", read_only=True)
-    tags = TagSerializer(many=True, read_only=True)
+    tags = TagSnapshotField()
+    cover_srcset = SrcsetField(source="cover_variants")
 
     class Meta:
         model = Project
@@ -32,19 +64,27 @@ class ProjectListSerializer(serializers.ModelSerializer):
             "status",
             "featured",
             "cover",
+            "cover_srcset",
             "created_at",
             "tags",
+            "latitude",
+            "longitude",
         ]
         read_only_fields = ["slug"]
+        # Opt-in nested data for ?expand= (see SparseFieldsetMixin)
+        expandable_fields = {
+            "media": lambda: MediaSerializer(many=True, read_only=True),
+        }
 
 
 # ------------------------------------------------------------------------
 # 🔹 Project Detail Serializer
 # برای نمایش جزئیات کامل پروژه
 # ------------------------------------------------------------------------
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     owner_name = serializers.CharField(source="owner.get_full_name", read_only=True)
-    tags = TagSerializer(many=True, read_only=True)
+    tags = TagSnapshotField()
+    cover_srcset = SrcsetField(source="cover_variants")
     owner = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
@@ -65,9 +105,12 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             "start_date",
             "end_date",
             "address",
+            "latitude",
+            "longitude",
             "status",
             "featured",
             "cover",
+            "cover_srcset",
             "tags",
             "created_at",
             "updated_at",
@@ -79,6 +122,10 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        # Opt-in nested data for ?expand= (see SparseFieldsetMixin)
+        expandable_fields = {
+            "media": lambda: MediaSerializer(many=True, read_only=True),
+        }
 
 
 # ------------------------------------------------------------------------
@@ -110,6 +157,8 @@ class ProjectWriteSerializer(serializers.ModelSerializer):
             "start_date",
             "end_date",
             "address",
+            "latitude",
+            "longitude",
             "status",
             "featured",
             "cover",
@@ -123,13 +172,20 @@ class ProjectWriteSerializer(serializers.ModelSerializer):
         return value
 
     def validate(self, data):
-        """Ensure start_date is before end_date."""
+        """Ensure start_date is before end_date and coordinates come in pairs."""
         start = data.get("start_date")
         end = data.get("end_date")
         if start and end and start > end:
             raise serializers.ValidationError(
                 {"end_date": "End date must be after start date."}
             )
+
+        latitude = data.get("latitude", getattr(self.instance, "latitude", None))
+        longitude = data.get("longitude", getattr(self.instance, "longitude", None))
+        if (latitude is None) != (longitude is None):
+            raise serializers.ValidationError(
+                {"latitude": "Latitude and longitude must be set together."}
+            )
         return data
 
     def create(self, validated_data):
@@ -147,3 +203,50 @@ class ProjectWriteSerializer(serializers.ModelSerializer):
         if tags is not None:
             instance.tags.set(tags)
         return instance
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project Bulk Serializers
+# برای ایجاد/ویرایش دسته‌ای پروژه‌ها (see catalog.services.bulk)
+# ------------------------------------------------------------------------
+class ProjectBulkListSerializer(serializers.ListSerializer):
+    """
+    Validates the whole batch with a constant number of queries and hands the
+    items to ProjectBulkWriter on save().
+    """
+
+    def validate(self, attrs):
+        counts = Counter(item["municipal_file_number"] for item in attrs)
+        duplicates = sorted(number for number, count in counts.items() if count > 1)
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Duplicate municipal_file_number in batch: {', '.join(duplicates)}"
+            )
+
+        tag_ids = {tag_id for item in attrs for tag_id in item.get("tags", [])}
+        missing = tag_ids - set(Tag.objects.filter(pk__in=tag_ids).values_list("pk", flat=True))
+        if missing:
+            raise serializers.ValidationError(
+                f"Unknown tag id(s): {', '.join(map(str, sorted(missing)))}"
+            )
+        return attrs
+
+    def create(self, validated_data):
+        return ProjectBulkWriter(self.context["request"].user).save(validated_data)
+
+
+class ProjectBulkItemSerializer(ProjectWriteSerializer):
+    """
+    One item of a bulk request: ProjectWriteSerializer without per-item queries.
+    Tag ids and file-number uniqueness are checked once for the whole batch.
+    """
+
+    tags = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+
+    class Meta(ProjectWriteSerializer.Meta):
+        list_serializer_class = ProjectBulkListSerializer
+        # The batch key: existing numbers are updated, not rejected (see ProjectBulkWriter)
+        extra_kwargs = {"municipal_file_number": {"required": True, "validators": []}}
+
+    def validate_tags(self, value):
+        return list(dict.fromkeys(value))
@@ -0,0 +1,313 @@
+import logging
+import uuid
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import BigIntegerField, F, Lookup, QuerySet, Value
+from redis.exceptions import RedisError
+
+from catalog.models import Project
+from utility.redis import RedisService
+
+logger = logging.getLogger(__name__)
+
+
+class _EqualsAny(Lookup):
+    """``lhs = ANY(rhs)`` for an array ``rhs``."""
+
+    lookup_name = "equals_any"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} = ANY({rhs})", (*lhs_params, *rhs_params)
+
+
+def filter_ids(queryset: QuerySet, ids: Sequence[int]) -> QuerySet:
+    """
+    ``queryset.filter(pk__in=ids)`` as ``id = ANY(%s)`` with one array parameter.
+
+    A resolved id set can hold CATALOG_BITMAP_MAX_IDS ids and the filtered
+    queryset is run more than once (validators, page); an ``IN (...)`` list
+    would repeat every id as a literal in each statement.
+    """
+    return queryset.filter(_EqualsAny(F("pk"), Value(list(ids), output_field=ArrayField(BigIntegerField()))))
+
+
+class ProjectBitmapIndex:
+    """
+    Optional Redis bitmap index for the status / featured / tag filters.
+
+    One bitmap per status value, per ``featured`` flag and per tag, where bit
+    ``n`` is set when project ``n`` matches, plus an ``all`` bitmap of existing
+    projects. A filter combination resolves with BITOP AND/OR (always ANDed
+    with ``all``) into an id set, which the caller fetches by primary key.
+
+    The bitmaps are maintained from the catalog signals after commit and by the
+    bulk writer; ``rebuild_bitmap_index`` rebuilds them from the database and
+    ``check_bitmap_index`` compares both. Reads only use the index while the
+    ``ready`` marker set by a rebuild exists; a failed write removes it, so
+    filters fall back to SQL until the next rebuild.
+
+    Enabled with ``CATALOG_BITMAP_INDEX = True``.
+
+    Example:
+        >>> index = ProjectBitmapIndex()
+        >>> index.resolve(statuses=["active"], featured=True, tag_ids=[3, 5])
+        [12, 40, 41]
+    """
+
+    prefix = "catalog:bitmap"
+    ready_key = f"{prefix}:ready"
+    all_key = f"{prefix}:all"
+
+    def __init__(self, redis_service: Optional[RedisService] = None):
+        """
+        Args:
+            redis_service (Optional[RedisService]): Custom RedisService instance for testing.
+        """
+        self.redis = redis_service or RedisService()
+        self.max_ids = getattr(settings, "CATALOG_BITMAP_MAX_IDS", 50000)
+
+    @staticmethod
+    def enabled() -> bool:
+        return getattr(settings, "CATALOG_BITMAP_INDEX", False)
+
+    # ------------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------------
+    def status_key(self, value: str) -> str:
+        return f"{self.prefix}:status:{value}"
+
+    def featured_key(self, value: bool) -> str:
+        return f"{self.prefix}:featured:{int(bool(value))}"
+
+    def tag_key(self, tag_id: int) -> str:
+        return f"{self.prefix}:tag:{tag_id}"
+
+    def is_ready(self) -> bool:
+        try:
+            return self.redis.exists(self.ready_key)
+        except RedisError as e:
+            logger.warning(f"Bitmap index unavailable: {e}")
+            return False
+
+    # ------------------------------------------------------------------------
+    # Maintenance (signals / bulk writer)
+    # ------------------------------------------------------------------------
+    def add_projects(self, rows: Iterable[Tuple[int, str, bool]]):
+        """Index ``(id, status, featured)`` rows, clearing their previous status/flag bits."""
+        statuses = [value for value, _ in Project.STATUS_CHOICES]
+
+        def write(pipe):
+            for project_id, status, featured in rows:
+                pipe.setbit(self.all_key, project_id, 1)
+                for value in set(statuses) | {status}:
+                    pipe.setbit(self.status_key(value), project_id, int(value == status))
+                pipe.setbit(self.featured_key(True), project_id, int(bool(featured)))
+                pipe.setbit(self.featured_key(False), project_id, int(not featured))
+
+        self._write(write)
+
+    def remove_projects(self, project_ids: Iterable[int]):
+        """Drop deleted projects; stale bits elsewhere are masked by ``all``."""
+
+        def write(pipe):
+            for project_id in project_ids:
+                pipe.setbit(self.all_key, project_id, 0)
+
+        self._write(write)
+
+    def set_tags(self, pairs: Iterable[Tuple[int, int]], value: bool = True):
+        """Set or clear ``(project_id, tag_id)`` memberships."""
+
+        def write(pipe):
+            for project_id, tag_id in pairs:
+                pipe.setbit(self.tag_key(tag_id), project_id, int(value))
+
+        self._write(write)
+
+    def drop_tag(self, tag_id: int):
+        self._write(lambda pipe: pipe.delete(self.tag_key(tag_id)))
+
+    def refresh_projects(self, project_ids: Sequence[int], removed_tags: Iterable[Tuple[int, int]] = ()):
+        """
+        Re-index projects written without signals (bulk writes): status/flag from
+        the database, tag bits cleared for ``removed_tags`` and set for current ones.
+        """
+        if not self.enabled() or not project_ids:
+            return
+        projects = Project.objects.filter(pk__in=project_ids).values_list("id", "status", "featured")
+        tags = Project.tags.through.objects.filter(project_id__in=project_ids).values_list("project_id", "tag_id")
+        self.set_tags(removed_tags, value=False)
+        self.add_projects(list(projects))
+        self.set_tags(list(tags), value=True)
+
+    def _write(self, commands):
+        try:
+            pipe = self.redis.connection.pipeline(transaction=False)
+            commands(pipe)
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Bitmap index write failed, disabling until rebuild: {e}")
+            try:
+                self.redis.delete(self.ready_key)
+            except RedisError:
+                pass
+
+    # ------------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------------
+    def resolve(
+        self,
+        statuses: Sequence[str] = (),
+        featured: Optional[bool] = None,
+        tag_ids: Sequence[int] = (),
+        match_all_tags: bool = True,
+    ) -> Optional[List[int]]:
+        """
+        Resolve a filter combination into matching project ids.
+
+        Statuses are ORed, tags are ANDed (or ORed with ``match_all_tags=False``),
+        and the families are ANDed together.
+
+        Returns:
+            Optional[List[int]]: Sorted ids, or None when the index is not ready,
+            Redis fails, or more than ``CATALOG_BITMAP_MAX_IDS`` projects match
+            (an unselective filter is cheaper in SQL).
+        """
+        if not self.is_ready():
+            return None
+
+        token = uuid.uuid4().hex
+        temporary = []
+
+        def combine(pipe, operation, keys):
+            if len(keys) == 1:
+                return keys[0]
+            destination = f"{self.prefix}:tmp:{token}:{len(temporary)}"
+            temporary.append(destination)
+            pipe.bitop(operation, destination, *keys)
+            return destination
+
+        try:
+            pipe = self.redis.connection.pipeline(transaction=False)
+            families = [self.all_key]
+            if statuses:
+                families.append(combine(pipe, "OR", [self.status_key(value) for value in statuses]))
+            if featured is not None:
+                families.append(self.featured_key(featured))
+            if tag_ids:
+                families.append(combine(pipe, "AND" if match_all_tags else "OR", [self.tag_key(t) for t in tag_ids]))
+            result = combine(pipe, "AND", families)
+            pipe.bitcount(result)
+            pipe.get(result)
+            if temporary:
+                pipe.delete(*temporary)
+            replies = pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Bitmap index query failed, using SQL: {e}")
+            return None
+
+        count, bitmap = replies[len(temporary)], replies[len(temporary) + 1]
+        if count > self.max_ids:
+            return None
+        return self.decode(bitmap or b"")
+
+    @staticmethod
+    def decode(bitmap: bytes) -> List[int]:
+        """Positions of the set bits (Redis bit 0 is the MSB of byte 0)."""
+        ids = []
+        for offset, byte in enumerate(bitmap):
+            if byte:
+                base = offset * 8
+                ids.extend(base + bit for bit in range(8) if byte & (0x80 >> bit))
+        return ids
+
+    # ------------------------------------------------------------------------
+    # Rebuild & Consistency
+    # ------------------------------------------------------------------------
+    def expected(self) -> Dict[str, set]:
+        """The bitmaps as they should be, computed from the database."""
+        bitmaps = {self.all_key: set()}
+        for project_id, status, featured in Project.objects.values_list("id", "status", "featured").iterator(
+            chunk_size=5000
+        ):
+            bitmaps[self.all_key].add(project_id)
+            bitmaps.setdefault(self.status_key(status), set()).add(project_id)
+            bitmaps.setdefault(self.featured_key(featured), set()).add(project_id)
+        for project_id, tag_id in Project.tags.through.objects.values_list("project_id", "tag_id").iterator(
+            chunk_size=5000
+        ):
+            bitmaps.setdefault(self.tag_key(tag_id), set()).add(project_id)
+        return bitmaps
+
+    def rebuild(self, batch_size: int = 10000) -> Dict[str, int]:
+        """
+        Rebuild every bitmap from the database into staging keys, then swap them in
+        (RENAME) and drop bitmaps that no longer exist, in one MULTI/EXEC.
+
+        Returns:
+            Dict[str, int]: Number of set bits per bitmap key.
+        """
+        bitmaps = self.expected()
+        staging = f"{self.prefix}:staging:{uuid.uuid4().hex}"
+        connection = self.redis.connection
+
+        pipe = connection.pipeline(transaction=False)
+        queued = 0
+        for key, project_ids in bitmaps.items():
+            for project_id in project_ids:
+                pipe.setbit(f"{staging}:{key}", project_id, 1)
+                queued += 1
+                if queued >= batch_size:
+                    pipe.execute()
+                    queued = 0
+        pipe.execute()
+
+        stale = [key for key in self._live_keys() if key not in bitmaps and key != self.ready_key]
+
+        swap = connection.pipeline(transaction=True)
+        for key, project_ids in bitmaps.items():
+            if project_ids:
+                swap.rename(f"{staging}:{key}", key)
+            else:
+                swap.delete(key)
+        if stale:
+            swap.delete(*stale)
+        swap.set(self.ready_key, 1)
+        swap.execute()
+        return {key: len(project_ids) for key, project_ids in bitmaps.items()}
+
+    def check(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Compare every bitmap with the database (bits of deleted projects are
+        ignored, as they are masked by ``all`` at query time).
+
+        Returns:
+            Dict[str, Tuple[int, int]]: ``key -> (missing, unexpected)`` for drifted bitmaps.
+        """
+        expected = self.expected()
+        connection = self.redis.connection
+        keys = set(expected) | {key for key in self._live_keys() if key != self.ready_key}
+        existing = set(self.decode(connection.get(self.all_key) or b""))
+
+        drift = {}
+        for key in sorted(keys):
+            actual = set(self.decode(connection.get(key) or b""))
+            if key != self.all_key:
+                actual &= existing
+            wanted = expected.get(key, set())
+            if actual != wanted:
+                drift[key] = (len(wanted - actual), len(actual - wanted))
+        return drift
+
+    def _live_keys(self) -> List[str]:
+        """Every index key except staging and temporary ones."""
+        keys = []
+        for key in self.redis.connection.scan_iter(match=f"{self.prefix}:*", count=1000):
+            key = key.decode() if isinstance(key, bytes) else key
+            if not key.startswith((f"{self.prefix}:staging:", f"{self.prefix}:tmp:")):
+                keys.append(key)
+        return keys
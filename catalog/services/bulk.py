@@ -0,0 +1,145 @@
+from typing import List
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied
+
+from catalog.models import Project
+from catalog.services.bitmaps import ProjectBitmapIndex
+from catalog.services.cache import CatalogResponseCache
+from catalog.services.search import PROJECT_SEARCH_FIELDS, project_search_vector
+from catalog.services.slugs import allocate_slugs
+from catalog.services.statistics import ProjectStatistics, statistic_values
+from catalog.services.tags import tag_snapshot_expression
+
+
+class ProjectBulkWriter:
+    """
+    Create or update many projects of one owner in a fixed number of queries.
+
+    Items are matched on ``municipal_file_number``: unknown numbers are inserted
+    with ``bulk_create`` (slugs allocated for the whole batch in one query),
+    known ones owned by ``owner`` are updated with ``bulk_update``. Numbers owned
+    by someone else reject the whole batch. Tag through-rows are replaced with
+    one DELETE and one ``bulk_create``, all inside a single transaction.
+
+    Bulk writes bypass ``Project.save()`` and model signals, so the derived
+    columns, search vectors, tag snapshots, statistics rollups, the response
+    cache generation and the bitmap index are maintained here explicitly.
+
+    Example:
+        >>> created, updated = ProjectBulkWriter(request.user).save(validated_items)
+    """
+
+    batch_size = 500
+    # Batches retried when a concurrent write takes an allocated slug or file number
+    attempts = 3
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    def save(self, items: List[dict]):
+        """
+        Write the batch, retrying from scratch if a concurrent insert wins a race.
+
+        Args:
+            items (List[dict]): Validated project data; ``tags`` is a list of tag ids.
+
+        Returns:
+            tuple: ``(created, updated)`` lists of Project instances.
+
+        Raises:
+            PermissionDenied: If a file number belongs to another owner.
+        """
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return self._save(items)
+            except IntegrityError:
+                if attempt == self.attempts:
+                    raise
+
+    def _save(self, items: List[dict]):
+        with transaction.atomic():
+            existing = {
+                project.municipal_file_number: project
+                for project in Project.objects.select_for_update().filter(
+                    municipal_file_number__in=[item["municipal_file_number"] for item in items]
+                )
+            }
+            foreign = sorted(number for number, project in existing.items() if project.owner_id != self.owner.pk)
+            if foreign:
+                raise PermissionDenied(f"Projects owned by another user: {', '.join(foreign)}")
+
+            new_items = [item for item in items if item["municipal_file_number"] not in existing]
+            old_items = [item for item in items if item["municipal_file_number"] in existing]
+
+            # Rollups: drop the stored values of updated rows, add every written row
+            statistics = ProjectStatistics()
+            for project in existing.values():
+                statistics.add(statistic_values(project), sign=-1)
+
+            created = self._create(new_items)
+            updated = self._update(old_items, existing)
+
+            for project in created + updated:
+                statistics.add(statistic_values(project), sign=1)
+            statistics.apply()
+
+            tag_sets = {}
+            for project, item in zip(created + updated, new_items + old_items):
+                if "tags" in item:
+                    tag_sets[project.pk] = item["tags"]
+            removed_tags = self._replace_tags(tag_sets)
+
+            project_ids = [project.pk for project in created + updated]
+            Project.objects.filter(pk__in=project_ids).update(
+                search_vector=project_search_vector(), tags_snapshot=tag_snapshot_expression()
+            )
+            transaction.on_commit(lambda: CatalogResponseCache().bump())
+            transaction.on_commit(lambda: ProjectBitmapIndex().refresh_projects(project_ids, removed_tags))
+        return created, updated
+
+    def _create(self, items: List[dict]) -> List[Project]:
+        slugs = allocate_slugs(Project, [item["title"] for item in items])
+        projects = []
+        for item, slug in zip(items, slugs):
+            fields = {key: value for key, value in item.items() if key != "tags"}
+            project = Project(owner=self.owner, slug=slug, **fields)
+            project.populate_computed_fields()
+            projects.append(project)
+        # PostgreSQL returns the new primary keys
+        return Project.objects.bulk_create(projects, batch_size=self.batch_size)
+
+    def _update(self, items: List[dict], existing: dict) -> List[Project]:
+        now = timezone.now()
+        fields = {"updated_at"}
+        projects = []
+        for item in items:
+            project = existing[item["municipal_file_number"]]
+            for key, value in item.items():
+                if key != "tags":
+                    setattr(project, key, value)
+                    fields.add(key)
+            project.updated_at = now
+            project.populate_computed_fields()
+            projects.append(project)
+
+        if projects:
+            fields.update(f"{field}_normalized" for field in PROJECT_SEARCH_FIELDS)
+            fields.add("geohash")
+            Project.objects.bulk_update(projects, sorted(fields), batch_size=self.batch_size)
+        return projects
+
+    def _replace_tags(self, tag_sets: dict) -> list:
+        """Replace the tag sets; returns the removed ``(project_id, tag_id)`` pairs."""
+        if not tag_sets:
+            return []
+        through = Project.tags.through
+        previous = through.objects.filter(project_id__in=list(tag_sets))
+        removed = list(previous.values_list("project_id", "tag_id"))
+        previous.delete()
+        through.objects.bulk_create(
+            [through(project_id=project_id, tag_id=tag_id) for project_id, tag_ids in tag_sets.items() for tag_id in tag_ids],
+            batch_size=self.batch_size,
+        )
+        return removed
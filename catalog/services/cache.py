@@ -0,0 +1,293 @@
+import hashlib
+import logging
+from typing import Awaitable, Callable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django_redis.exceptions import ConnectionInterrupted
+from redis.exceptions import RedisError
+from rest_framework.renderers import JSONRenderer
+
+from utility.db_router import use_primary
+from utility.redis import RedisService, get_async_redis_connection
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogResponseCache:
+    """
+    Versioned cache of pre-rendered JSON responses for public catalog reads.
+
+    Every key embeds the current catalog *generation*, a Redis counter bumped by
+    the catalog signals whenever a Project, Tag or Media row changes. Bumping it
+    makes all previous entries unreachable at once (O(1), no key scanning); the
+    stale entries simply expire after ``CATALOG_CACHE_TTL``.
+
+    Redis failures never break a read: the response is built without the cache.
+
+    With read replicas, misses within ``DATABASE_REPLICA_STICKY_SECONDS`` of a
+    bump are built from the primary, so a lagging replica cannot store the old
+    rows under the new generation.
+
+    Example:
+        >>> cache = CatalogResponseCache()
+        >>> return cache.respond(request, "project-list", lambda: build_data(request))
+    """
+
+    generation_key = "catalog:generation"
+    fresh_key = "catalog:generation:fresh"
+    key_prefix = "catalog:response"
+
+    def __init__(self, redis_service: Optional[RedisService] = None, alias: str = "default"):
+        """
+        Args:
+            redis_service (Optional[RedisService]): Custom RedisService instance for testing.
+            alias (str): Cache alias holding the rendered bodies.
+        """
+        self.redis = redis_service or RedisService(alias)
+        self.cache = caches[alias]
+        self.ttl = getattr(settings, "CATALOG_CACHE_TTL", 600)
+        # How long replicas may lag behind a bump (0 without replicas)
+        self.replica_lag = (
+            getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 10) if getattr(settings, "DATABASE_REPLICAS", []) else 0
+        )
+
+    # ------------------------------------------------------------------------
+    # Generation Counter
+    # ------------------------------------------------------------------------
+    def generation(self) -> int:
+        """Return the current catalog generation (0 before the first write)."""
+        value = self.redis.get(self.generation_key)
+        return int(value) if value else 0
+
+    def bump(self) -> Optional[int]:
+        """
+        Invalidate every cached catalog response by moving to a new generation.
+
+        Returns:
+            Optional[int]: The new generation, or None if Redis is unavailable.
+        """
+        try:
+            generation = self.redis.incr(self.generation_key)
+            if self.replica_lag:
+                self.redis.set(self.fresh_key, generation, ttl=self.replica_lag)
+            return generation
+        except RedisError as e:
+            logger.warning(f"Could not bump catalog generation: {e}")
+            return None
+
+    # ------------------------------------------------------------------------
+    # Keys & Storage
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def normalized_query(request) -> str:
+        """
+        The query parameters, sorted so ``?a=1&b=2`` and ``?b=2&a=1`` compare equal.
+
+        Also the ETag variant of collections, so every page (``cursor``,
+        ``page_size``), ordering, search and fieldset of the same rows gets its
+        own ETag, identical on the sync and async routes.
+        """
+        params = sorted(
+            (key, value) for key in request.query_params for value in request.query_params.getlist(key)
+        )
+        return repr(params)
+
+    def key_for(self, namespace: str, request, generation: int) -> str:
+        """
+        Build a cache key from the namespace, generation and normalized request URL.
+
+        Scheme and host are included because rendered pagination links are absolute.
+        """
+        raw = "|".join([request.scheme, request.get_host(), request.path, self.normalized_query(request)])
+        digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:{namespace}:{generation}:{digest}"
+
+    def is_cacheable(self, request, shared: bool = False) -> bool:
+        """
+        Only GET requests are cached; unless the data is ``shared`` (identical for
+        every user), only anonymous requests share cached bodies.
+        """
+        return request.method == "GET" and (shared or not request.user.is_authenticated)
+
+    def respond(self, request, namespace: str, build: Callable[[], object], shared: bool = False) -> HttpResponse:
+        """
+        Serve a cached JSON body or build, render and store it.
+
+        Args:
+            request: The DRF request.
+            namespace (str): Endpoint name, part of the cache key.
+            build (Callable): Returns the response data (only called on a miss).
+            shared (bool): The data does not depend on the user, so authenticated
+                requests may use the cache too.
+
+        Returns:
+            HttpResponse: ``application/json`` response with an ``X-Cache`` header.
+        """
+        if not self.is_cacheable(request, shared):
+            return self._render(build(), cache_status="BYPASS")
+
+        try:
+            key = self.key_for(namespace, request, self.generation())
+            body = self.cache.get(key)
+        except (RedisError, ConnectionInterrupted) as e:
+            logger.warning(f"Catalog cache unavailable, serving uncached: {e}")
+            return self._render(build(), cache_status="BYPASS")
+
+        if body is not None:
+            return self._response(body, cache_status="HIT")
+
+        if self._generation_is_fresh():
+            with use_primary():
+                body = JSONRenderer().render(build())
+        else:
+            body = JSONRenderer().render(build())
+        try:
+            self.cache.set(key, body, self.ttl)
+        except (RedisError, ConnectionInterrupted) as e:
+            logger.warning(f"Could not store catalog response {key}: {e}")
+        return self._response(body, cache_status="MISS")
+
+    def validators(self, request, namespace: str, compute: Callable[[], Tuple]) -> Tuple:
+        """
+        Serve the cached ``(etag, last_modified)`` of a request or compute and store them.
+
+        Validators change only with the rows, so they are cached per generation
+        for every user (unlike bodies): a revalidation or cache hit costs Redis
+        lookups instead of the aggregate query behind ``compute``.
+
+        Args:
+            request: The DRF request.
+            namespace (str): Endpoint name, part of the cache key.
+            compute (Callable): Returns the validators (only called on a miss).
+        """
+        try:
+            key = self.key_for(f"{namespace}:validators", request, self.generation())
+            value = self.cache.get(key)
+        except (RedisError, ConnectionInterrupted) as e:
+            logger.warning(f"Catalog cache unavailable, computing validators: {e}")
+            return compute()
+
+        if value is not None:
+            return value
+
+        if self._generation_is_fresh():
+            with use_primary():
+                value = compute()
+        else:
+            value = compute()
+        try:
+            self.cache.set(key, value, self.ttl)
+        except (RedisError, ConnectionInterrupted) as e:
+            logger.warning(f"Could not store catalog validators {key}: {e}")
+        return value
+
+    # ------------------------------------------------------------------------
+    # Internal Helpers
+    # ------------------------------------------------------------------------
+    def _generation_is_fresh(self) -> bool:
+        """Whether the replicas may still lag behind the current generation."""
+        if not self.replica_lag:
+            return False
+        try:
+            return self.redis.exists(self.fresh_key)
+        except RedisError:
+            return True
+
+    def _render(self, data, cache_status: str) -> HttpResponse:
+        return self._response(JSONRenderer().render(data), cache_status)
+
+    @staticmethod
+    def _response(body: bytes, cache_status: str) -> HttpResponse:
+        response = HttpResponse(body, content_type="application/json")
+        response["X-Cache"] = cache_status
+        return response
+
+
+class AsyncCatalogResponseCache(CatalogResponseCache):
+    """
+    CatalogResponseCache for async views, through a ``redis.asyncio`` client.
+
+    Entries are stored exactly as the sync cache stores them (same keys and
+    encoding), so both views share the cached bodies and generations.
+
+    Example:
+        >>> cache = AsyncCatalogResponseCache()
+        >>> return await cache.arespond(request, "project-list", build_data)
+    """
+
+    def __init__(self, alias: str = "default"):
+        """
+        Args:
+            alias (str): Cache alias holding the rendered bodies.
+        """
+        super().__init__(alias=alias)
+        self.aredis = get_async_redis_connection(alias)
+        self.client = self.cache.client  # django-redis key / value encoding
+
+    async def ageneration(self) -> int:
+        """generation() without blocking the event loop."""
+        value = await self.aredis.get(self.generation_key)
+        return int(value) if value else 0
+
+    async def arespond(
+        self, request, namespace: str, build: Callable[[], Awaitable[object]], shared: bool = False
+    ) -> HttpResponse:
+        """
+        respond() for async views: ``build`` is a coroutine function.
+        """
+        if not self.is_cacheable(request, shared):
+            return self._render(await build(), cache_status="BYPASS")
+
+        try:
+            key = self.client.make_key(self.key_for(namespace, request, await self.ageneration()))
+            body = await self.aredis.get(key)
+        except RedisError as e:
+            logger.warning(f"Catalog cache unavailable, serving uncached: {e}")
+            return self._render(await build(), cache_status="BYPASS")
+
+        if body is not None:
+            return self._response(self.client.decode(body), cache_status="HIT")
+
+        if await self._ageneration_is_fresh():
+            with use_primary():
+                body = JSONRenderer().render(await build())
+        else:
+            body = JSONRenderer().render(await build())
+        try:
+            await self.aredis.set(key, self.client.encode(body), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Could not store catalog response {key}: {e}")
+        return self._response(body, cache_status="MISS")
+
+    async def avalidators(self, request, namespace: str, compute: Callable[[], Awaitable[Tuple]]) -> Tuple:
+        """validators() for async views: ``compute`` is a coroutine function."""
+        try:
+            key = self.client.make_key(self.key_for(f"{namespace}:validators", request, await self.ageneration()))
+            value = await self.aredis.get(key)
+        except RedisError as e:
+            logger.warning(f"Catalog cache unavailable, computing validators: {e}")
+            return await compute()
+
+        if value is not None:
+            return self.client.decode(value)
+
+        if await self._ageneration_is_fresh():
+            with use_primary():
+                value = await compute()
+        else:
+            value = await compute()
+        try:
+            await self.aredis.set(key, self.client.encode(value), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Could not store catalog validators {key}: {e}")
+        return value
+
+    async def _ageneration_is_fresh(self) -> bool:
+        if not self.replica_lag:
+            return False
+        try:
+            return bool(await self.aredis.exists(self.fresh_key))
+        except RedisError:
+            return True
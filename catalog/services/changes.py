@@ -0,0 +1,156 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+
+from catalog.models import Media, Project, Tag, Tombstone
+from catalog.serializers.fast import FastProjectSerializer
+from catalog.serializers.medias import MediaSerializer
+from catalog.serializers.projects import ProjectDetailSerializer, TagSerializer
+
+
+class ResyncRequired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = "Cursor is older than the tombstone retention; sync again without a cursor."
+    default_code = "resync_required"
+
+
+class CatalogChangeFeed:
+    """
+    Incremental sync of the catalog: rows changed after a cursor, plus deletions.
+
+    Projects, media, tags and deletion tombstones are four streams, each paged
+    by its own ``(updated_at, id)`` keyset over an ``(updated_at, id)`` index,
+    so a sync reads O(changes) rows. The cursor is an opaque base64 JSON of the
+    four positions. Without a cursor the live streams start from the beginning
+    (a full initial sync) and tombstones from now.
+
+    Rows updated during the last ``CATALOG_CHANGES_LAG_SECONDS`` are held back:
+    ``updated_at`` is assigned before commit, so a slow transaction could
+    otherwise commit a row behind a cursor that was already handed out.
+    Once the tombstones are drained their position moves up to the horizon,
+    so only clients that did not sync within the retention get a 410.
+
+    Clients apply ``projects`` / ``media`` / ``tags`` as upserts, then
+    ``deleted``, store ``cursor`` and repeat while ``has_more`` is true.
+
+    Example:
+        >>> CatalogChangeFeed(cursor=request.query_params.get("cursor"), request=request).page()
+        {"projects": [...], "media": [...], "tags": [...], "deleted": {...}, "cursor": "...", "has_more": False}
+
+    Raises:
+        NotFound: For a malformed cursor (like KeysetPagination).
+        ResyncRequired: If the cursor predates the tombstone retention (410).
+        ValidationError: For a ``limit`` outside 1..CATALOG_CHANGES_MAX_LIMIT.
+    """
+
+    streams = ("projects", "media", "tags", "deleted")
+    # Tombstone.kind -> key of the ``deleted`` object
+    deleted_keys = {"project": "projects", "media": "media", "tag": "tags"}
+    default_limit = 500
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, cursor: Optional[str] = None, limit=None, request=None):
+        self.request = request
+        self.now = timezone.now()
+        self.horizon = self.now - datetime.timedelta(seconds=settings.CATALOG_CHANGES_LAG_SECONDS)
+        self.limit = self._limit(limit)
+        self.positions = self.decode_cursor(cursor) if cursor else {"deleted": (self.horizon, 0)}
+
+        deleted = self.positions.get("deleted")
+        retention = datetime.timedelta(days=settings.CATALOG_TOMBSTONE_RETENTION_DAYS)
+        if deleted and deleted[0] < self.now - retention:
+            raise ResyncRequired()
+
+    def _limit(self, raw) -> int:
+        if raw in (None, ""):
+            return min(self.default_limit, settings.CATALOG_CHANGES_MAX_LIMIT)
+        try:
+            limit = int(raw)
+        except (TypeError, ValueError):
+            limit = 0
+        if not 1 <= limit <= settings.CATALOG_CHANGES_MAX_LIMIT:
+            raise ValidationError({"limit": f"Must be an integer between 1 and {settings.CATALOG_CHANGES_MAX_LIMIT}."})
+        return limit
+
+    # ------------------------------------------------------------------------
+    # Cursor
+    # ------------------------------------------------------------------------
+    def encode_cursor(self, positions: dict) -> str:
+        payload = {name: [value.isoformat(), pk] for name, (value, pk) in positions.items()}
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, encoded: str) -> dict:
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            positions = {}
+            for name, (value, pk) in payload.items():
+                if name not in self.streams or not isinstance(pk, int):
+                    raise ValueError
+                value = datetime.datetime.fromisoformat(value)
+                if timezone.is_naive(value):
+                    raise ValueError
+                positions[name] = (value, pk)
+            return positions
+        except (TypeError, ValueError, AttributeError, UnicodeEncodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    # ------------------------------------------------------------------------
+    # Streams
+    # ------------------------------------------------------------------------
+    def _after(self, queryset: QuerySet, name: str) -> QuerySet:
+        """Rows of ``queryset`` after the stream position, up to the horizon, in keyset order."""
+        queryset = queryset.filter(updated_at__lte=self.horizon)
+        position = self.positions.get(name)
+        if position:
+            updated_at, pk = position
+            queryset = queryset.filter(updated_at__gte=updated_at).filter(
+                Q(updated_at__gt=updated_at) | Q(id__gt=pk)
+            )
+        return queryset.order_by("updated_at", "id")[: self.limit + 1]
+
+    def page(self) -> dict:
+        context = {"request": self.request}
+        fast = FastProjectSerializer(ProjectDetailSerializer, context)
+
+        projects = list(fast.queryset(self._after(Project.objects.all(), "projects"), ("updated_at",)))
+        media = list(self._after(Media.objects.select_related("project"), "media"))
+        tags = list(self._after(Tag.objects.all(), "tags"))
+        deleted = list(self._after(Tombstone.objects.all(), "deleted").values("id", "kind", "object_id", "updated_at"))
+
+        has_more = False
+        positions = dict(self.positions)
+        for name, rows in (("projects", projects), ("media", media), ("tags", tags), ("deleted", deleted)):
+            drained = len(rows) <= self.limit
+            if not drained:
+                has_more = True
+                del rows[self.limit :]
+            if rows:
+                last = rows[-1]
+                positions[name] = (last["updated_at"], last["id"]) if isinstance(last, dict) else (last.updated_at, last.id)
+            if name == "deleted" and drained and positions.get(name, (self.horizon,))[0] < self.horizon:
+                # Every tombstone up to the horizon was delivered: the retention
+                # check then measures the age of the sync, not of the last deletion
+                positions["deleted"] = (self.horizon, 0)
+
+        grouped = {key: [] for key in self.deleted_keys.values()}
+        for row in deleted:
+            grouped[self.deleted_keys[row["kind"]]].append(row["object_id"])
+
+        return {
+            "projects": fast.to_representation(projects),
+            "media": MediaSerializer(media, many=True, context=context).data,
+            "tags": TagSerializer(tags, many=True).data,
+            "deleted": grouped,
+            "cursor": self.encode_cursor(positions),
+            "has_more": has_more,
+        }
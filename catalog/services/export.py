@@ -0,0 +1,105 @@
+import csv
+from typing import Iterator
+
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from catalog.filters import ProjectFilter
+from catalog.models import Project
+from catalog.pagination import ProjectCursorPagination
+from catalog.serializers.fast import FastProjectSerializer
+from catalog.serializers.projects import ProjectDetailSerializer
+
+
+class _Echo:
+    """File-like object whose ``write`` returns the line instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+class ProjectExporter:
+    """
+    Stream the filtered project catalog as NDJSON or CSV with constant memory.
+
+    Rows are read through a server-side cursor (``.values().iterator(chunk_size)``)
+    and serialized one chunk at a time with FastProjectSerializer (the
+    ProjectDetailSerializer representation), so memory depends on ``chunk_size``
+    and not on the number of projects. Filters and ordering are those of the
+    project list (see catalog.filters.ProjectFilter).
+
+    Example:
+        >>> exporter = ProjectExporter({"status": "active"}, file_format="csv")
+        >>> for chunk in exporter.stream():
+        ...     output.write(chunk)
+
+    Raises:
+        ValueError: For an unsupported ``file_format``.
+        ValidationError: For an ordering outside catalog.pagination.PROJECT_ORDERINGS
+            or a malformed filter.
+    """
+
+    content_types = {
+        "ndjson": "application/x-ndjson; charset=utf-8",
+        "csv": "text/csv; charset=utf-8",
+    }
+    serializer_class = ProjectDetailSerializer
+
+    def __init__(self, params, file_format: str = "ndjson", chunk_size: int = 2000, request=None):
+        if file_format not in self.content_types:
+            raise ValueError(f"Unsupported export format: {file_format}")
+        self.filter = ProjectFilter(params)
+        # Resolved up front so an unsupported ordering or filter fails before streaming starts
+        self.ordering = self.filter.ordering()
+        self.queryset = ProjectCursorPagination.order(self.filter.apply(Project.objects.all()), self.ordering)
+        self.file_format = file_format
+        self.chunk_size = chunk_size
+        self.serializer = FastProjectSerializer(self.serializer_class, context={"request": request})
+
+    @property
+    def content_type(self) -> str:
+        return self.content_types[self.file_format]
+
+    @property
+    def filename(self) -> str:
+        return f"projects.{self.file_format}"
+
+    def records(self) -> Iterator[dict]:
+        """Yield one representation dict per project."""
+        rows = self.serializer.queryset(self.queryset, self.ordering).iterator(chunk_size=self.chunk_size)
+
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                yield from self.serializer.to_representation(chunk)
+                chunk = []
+        if chunk:
+            yield from self.serializer.to_representation(chunk)
+
+    def stream(self) -> Iterator[str]:
+        """Yield the export line by line in the requested format."""
+        if self.file_format == "csv":
+            return self._csv()
+        return self._ndjson()
+
+    def _ndjson(self) -> Iterator[str]:
+        encoder = JSONEncoder(ensure_ascii=False)
+        for record in self.records():
+            yield encoder.encode(record) + "\n"
+
+    def _csv(self) -> Iterator[str]:
+        # Nested values are flattened: tags to "a|b", cover_srcset to one column per format
+        srcset_columns = {f"cover_srcset_{name}": name for name in settings.CATALOG_IMAGE_VARIANT_FORMATS}
+        columns = []
+        for column in self.serializer_class.Meta.fields:
+            columns.extend(srcset_columns if column == "cover_srcset" else [column])
+        writer = csv.writer(_Echo())
+        # BOM so spreadsheet tools detect UTF-8 (Persian text)
+        yield "\ufeff" + writer.writerow(columns)
+        for record in self.records():
+            record["tags"] = "|".join(tag["name"] for tag in record["tags"])
+            srcset = record.pop("cover_srcset") or {}
+            for column, variant_format in srcset_columns.items():
+                record[column] = srcset.get(variant_format)
+            yield writer.writerow(["" if record[column] is None else record[column] for column in columns])
@@ -0,0 +1,66 @@
+from django.db.models import Count
+
+from catalog.filters import ProjectFilter
+from catalog.models import Project
+
+
+class ProjectFacets:
+    """
+    Facet counts (status, featured, tags) for the project list filters.
+
+    Each family is one grouped query over the filtered projects, ignoring the
+    family's own filter, so the sidebar keeps showing the alternatives of a
+    selected value (e.g. the other statuses while ``status=active`` is set).
+    The total of the fully filtered list is derived from the status family,
+    so no extra COUNT query is needed.
+
+    Example:
+        >>> ProjectFacets(ProjectFilter(request.query_params)).counts()
+        {"total": 12, "status": [...], "featured": [...], "tags": [...]}
+    """
+
+    def __init__(self, project_filter: ProjectFilter):
+        self.filter = project_filter
+
+    def _queryset(self, *ignored):
+        return self.filter.without(*ignored).apply(Project.objects.all()).order_by()
+
+    def counts(self) -> dict:
+        status_counts = self.status_counts()
+        selected_status = self.filter.params.get("status")
+        if selected_status:
+            total = next((item["count"] for item in status_counts if item["value"] == selected_status), 0)
+        else:
+            total = sum(item["count"] for item in status_counts)
+
+        return {
+            "total": total,
+            "status": status_counts,
+            "featured": self.featured_counts(),
+            "tags": self.tag_counts(),
+        }
+
+    def status_counts(self) -> list:
+        """Every status choice with its count (zero when absent)."""
+        rows = dict(self._queryset("status").values_list("status").annotate(count=Count("pk")))
+        counts = [
+            {"value": value, "label": label, "count": rows.pop(value, 0)} for value, label in Project.STATUS_CHOICES
+        ]
+        # Legacy values outside STATUS_CHOICES
+        counts.extend({"value": value, "label": value, "count": count} for value, count in sorted(rows.items()))
+        return counts
+
+    def featured_counts(self) -> list:
+        rows = dict(self._queryset("featured").values_list("featured").annotate(count=Count("pk")))
+        return [{"value": value, "count": rows.get(value, 0)} for value in (True, False)]
+
+    def tag_counts(self) -> list:
+        """Tags used by the filtered projects, most frequent first."""
+        projects = self._queryset("tags").values("pk")
+        rows = (
+            Project.tags.through.objects.filter(project_id__in=projects)
+            .values("tag_id", "tag__name")
+            .annotate(count=Count("project_id"))
+            .order_by("-count", "tag_id")
+        )
+        return [{"id": row["tag_id"], "name": row["tag__name"], "count": row["count"]} for row in rows]
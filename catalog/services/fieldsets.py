@@ -0,0 +1,103 @@
+from typing import Iterable, Optional
+
+from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+
+
+# What each non-column serializer field needs from the database.
+# Every other field is read from the project column of the same name.
+PROJECT_FIELD_REQUIREMENTS = {
+    "owner_name": {"select_related": "owner", "only": ["owner__first_name", "owner__last_name"]},
+    "owner": {"only": ["owner"]},
+    "tags": {"only": ["tags_snapshot"]},
+    "cover_srcset": {"only": ["cover_variants"]},
+    # MediaSerializer renders project.title from the prefetched parent
+    "media": {"prefetch_related": "media", "only": ["title"]},
+}
+
+
+def _split(raw: Optional[str]) -> list:
+    return [name.strip() for name in (raw or "").split(",") if name.strip()]
+
+
+class ProjectFieldPlan:
+    """
+    Plan a project read from ``?fields=`` and ``?expand=``.
+
+    The same plan trims the serializer output (through SparseFieldsetMixin) and the
+    SQL: only requested columns are selected, and the owner join / media prefetch
+    are skipped unless a requested field needs them.
+
+    Example:
+        >>> plan = ProjectFieldPlan.from_request(request, ProjectListSerializer)
+        >>> queryset = plan.apply(Project.objects.all())
+        >>> ProjectListSerializer(queryset, many=True, context={"request": request, **plan.context()})
+    """
+
+    def __init__(self, serializer_class, fields: Iterable[str] = (), expand: Iterable[str] = ()):
+        self.serializer_class = serializer_class
+        self.fields = list(fields)
+        self.expand = list(expand)
+
+    @classmethod
+    def from_request(cls, request, serializer_class) -> "ProjectFieldPlan":
+        """
+        Parse and validate ``fields`` / ``expand`` (comma separated).
+
+        Raises:
+            ValidationError: For unknown field or expansion names.
+        """
+        fields = _split(request.query_params.get("fields"))
+        expand = _split(request.query_params.get("expand"))
+
+        errors = {}
+        unknown = sorted(set(fields) - set(serializer_class.Meta.fields))
+        if unknown:
+            errors["fields"] = f"Unknown field(s): {', '.join(unknown)}"
+        unknown = sorted(set(expand) - set(getattr(serializer_class.Meta, "expandable_fields", {})))
+        if unknown:
+            errors["expand"] = f"Unknown expansion(s): {', '.join(unknown)}"
+        if errors:
+            raise ValidationError(errors)
+        return cls(serializer_class, fields, expand)
+
+    @property
+    def is_default(self) -> bool:
+        return not self.fields and not self.expand
+
+    @property
+    def selected(self) -> list:
+        """Output field names, in serializer order."""
+        names = [name for name in self.serializer_class.Meta.fields if not self.fields or name in self.fields]
+        return names + [name for name in self.expand if name not in names]
+
+    def context(self) -> dict:
+        """Serializer context entries consumed by SparseFieldsetMixin."""
+        return {"fields": self.fields, "expand": self.expand}
+
+    def apply(self, queryset: QuerySet, extra_columns: Iterable[str] = ()) -> QuerySet:
+        """
+        Restrict columns and joins to what the selected fields need.
+
+        Args:
+            queryset (QuerySet): A Project queryset.
+            extra_columns (Iterable[str]): Columns needed besides the output
+                (e.g. ordering keys for the pagination cursor).
+        """
+        only = {"id", *(column.lstrip("-") for column in extra_columns)}
+        select_related, prefetch_related = [], []
+        for name in self.selected:
+            requirement = PROJECT_FIELD_REQUIREMENTS.get(name, {"only": [name]})
+            only.update(requirement.get("only", []))
+            if "select_related" in requirement:
+                select_related.append(requirement["select_related"])
+            if "prefetch_related" in requirement:
+                prefetch_related.append(requirement["prefetch_related"])
+
+        annotations = set(queryset.query.annotations)
+        queryset = queryset.only(*sorted(only - annotations - {"pk"}))
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
@@ -0,0 +1,65 @@
+import math
+from functools import reduce
+from operator import or_
+
+from django.db.models import FloatField, Q, QuerySet, Value
+from django.db.models.functions import ASin, Cast, Cos, Least, Power, Radians, Sin, Sqrt
+
+from utility.geohash import EARTH_RADIUS_M, covering_cells, radius_bounds
+
+
+# Upper bound of geohash prefixes OR'd per query (one index range scan each).
+# More cells hug the viewport tighter; fewer keep the plan small.
+GEOHASH_MAX_CELLS = 16
+
+
+def _geohash_prefixes(south, west, north, east) -> Q:
+    cells = covering_cells(south, west, north, east, max_cells=GEOHASH_MAX_CELLS)
+    if cells is None:
+        # World-sized viewport: a prefix scan would read everything anyway
+        return Q(geohash__gt="")
+    return reduce(or_, (Q(geohash__startswith=cell) for cell in cells))
+
+
+def within_bbox(queryset: QuerySet, south: float, west: float, north: float, east: float) -> QuerySet:
+    """
+    Projects whose coordinates fall inside a bounding box.
+
+    Candidates come from geohash prefix scans (``catalog_proj_geohash_like_idx``);
+    the exact latitude / longitude bounds are then checked in the same query.
+
+    Example:
+        >>> within_bbox(Project.objects.all(), 35.68, 51.30, 35.72, 51.45)
+    """
+    return queryset.filter(
+        _geohash_prefixes(south, west, north, east),
+        latitude__gte=south,
+        latitude__lte=north,
+        longitude__gte=west,
+        longitude__lte=east,
+    )
+
+
+def distance_m(latitude: float, longitude: float):
+    """Haversine distance (meters) from a point to each project's coordinates, as a SQL expression."""
+    project_lat = Radians(Cast("latitude", FloatField()))
+    project_lng = Radians(Cast("longitude", FloatField()))
+    lat, lng = Value(math.radians(latitude)), Value(math.radians(longitude))
+    half_chord = Power(Sin((project_lat - lat) / 2), 2) + Cos(project_lat) * Cos(lat) * Power(
+        Sin((project_lng - lng) / 2), 2
+    )
+    # LEAST() guards asin() against rounding just above 1 for antipodal points
+    return Value(2 * EARTH_RADIUS_M) * ASin(Least(Sqrt(half_chord), Value(1.0)))
+
+
+def within_radius(queryset: QuerySet, latitude: float, longitude: float, radius_m: float) -> QuerySet:
+    """
+    Projects within ``radius_m`` meters (great-circle) of a point.
+
+    The enclosing box narrows candidates through the geohash index as in
+    within_bbox(); the exact haversine distance is checked in SQL.
+    """
+    south, west, north, east = radius_bounds(latitude, longitude, radius_m)
+    return within_bbox(queryset, south, west, north, east).alias(
+        distance_m=distance_m(latitude, longitude)
+    ).filter(distance_m__lte=radius_m)
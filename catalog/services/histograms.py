@@ -0,0 +1,120 @@
+from typing import Iterable
+
+from django.db import connection
+from rest_framework.exceptions import ValidationError
+
+from catalog.filters import PROJECT_RANGE_FIELDS, ProjectFilter
+from catalog.models import Project
+
+
+class ProjectHistograms:
+    """
+    Bucketed distributions of the range-filterable project columns.
+
+    Every field gets ``buckets`` equal-width buckets between its minimum and
+    maximum over the filtered projects; all fields are computed by a single
+    SQL query (one CTE per field, ``width_bucket`` + GROUP BY). Like the facet
+    counts, each histogram ignores the field's own ``_min`` / ``_max`` filter
+    so a slider keeps showing the whole distribution while it is being moved.
+    Projects with a NULL value are left out of that field's histogram.
+
+    Example:
+        >>> ProjectHistograms(ProjectFilter(request.query_params), ["budget"], buckets=4).data()
+        {"budget": {"min": 0.0, "max": 400.0, "buckets": [{"lower": 0.0, "upper": 100.0, "count": 3}, ...]}}
+
+    Raises:
+        ValidationError: For unknown fields or a bucket count outside 1..max_buckets.
+    """
+
+    default_buckets = 10
+    max_buckets = 50
+
+    def __init__(self, project_filter: ProjectFilter, fields: Iterable[str] = (), buckets=None):
+        fields = list(dict.fromkeys(fields)) or list(PROJECT_RANGE_FIELDS)
+        unknown = [name for name in fields if name not in PROJECT_RANGE_FIELDS]
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(unknown)}"})
+        self.filter = project_filter
+        self.fields = fields
+        self.buckets = self._bucket_count(buckets)
+
+    def _bucket_count(self, raw) -> int:
+        if raw in (None, ""):
+            return self.default_buckets
+        try:
+            buckets = int(raw)
+        except (TypeError, ValueError):
+            buckets = 0
+        if not 1 <= buckets <= self.max_buckets:
+            raise ValidationError({"buckets": f"Must be an integer between 1 and {self.max_buckets}."})
+        return buckets
+
+    # ------------------------------------------------------------------------
+    # SQL
+    # ------------------------------------------------------------------------
+    def _values_sql(self, name):
+        """SQL selecting ``name`` of the projects matched by every filter except its own range."""
+        queryset = (
+            self.filter.without(f"{name}_min", f"{name}_max")
+            .apply(Project.objects.all())
+            .filter(**{f"{name}__isnull": False})
+            .order_by()
+            .values(name)
+        )
+        return queryset.query.sql_with_params()
+
+    def _query(self):
+        ctes, selects, params = [], [], []
+        for index, name in enumerate(self.fields):
+            sql, sql_params = self._values_sql(name)
+            ctes.append(f"v{index}(value) AS ({sql})")
+            params.extend(sql_params)
+        for index, name in enumerate(self.fields):
+            # width_bucket() puts the maximum in bucket n + 1, LEAST() folds it into
+            # the last bucket; a single distinct value has no width and is bucket 1.
+            selects.append(
+                f"SELECT %s, b.lo, b.hi, "
+                f"CASE WHEN b.lo = b.hi THEN 1 ELSE LEAST(width_bucket(v.value::numeric, b.lo, b.hi, %s), %s) END, "
+                f"COUNT(*) "
+                f"FROM v{index} v CROSS JOIN (SELECT MIN(value)::numeric lo, MAX(value)::numeric hi FROM v{index}) b "
+                f"GROUP BY 2, 3, 4"
+            )
+            params.extend([name, self.buckets, self.buckets])
+        return f"WITH {', '.join(ctes)} {' UNION ALL '.join(selects)}", params
+
+    # ------------------------------------------------------------------------
+    # Result
+    # ------------------------------------------------------------------------
+    def data(self) -> dict:
+        sql, params = self._query()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        counts = {name: {} for name in self.fields}
+        bounds = {}
+        for name, low, high, bucket, count in rows:
+            bounds[name] = (low, high)
+            counts[name][bucket] = count
+
+        result = {}
+        for name in self.fields:
+            if name not in bounds:
+                result[name] = {"min": None, "max": None, "buckets": []}
+                continue
+            low, high = bounds[name]
+            width = (high - low) / self.buckets
+            buckets = 1 if low == high else self.buckets
+            result[name] = {
+                "min": float(low),
+                "max": float(high),
+                "buckets": [
+                    {
+                        "lower": float(low + width * index),
+                        "upper": float(high if index == buckets - 1 else low + width * (index + 1)),
+                        "count": counts[name].get(index + 1, 0),
+                    }
+                    for index in range(buckets)
+                ],
+            }
+        return result
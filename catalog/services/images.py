@@ -0,0 +1,201 @@
+import io
+import logging
+import posixpath
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.fields.json import KT
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from catalog.models import Media, Project
+from catalog.services.cache import CatalogResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+# Variant format -> (Pillow format, file extension)
+VARIANT_FORMATS = {
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+}
+
+
+def variant_name(name: str, width: int, variant_format: str) -> str:
+    """
+    Deterministic storage name of one derivative of ``name``.
+
+    Example:
+        >>> variant_name("projects/covers/site.png", 640, "webp")
+        'projects/covers/derived/site.png/640w.webp'
+    """
+    directory, filename = posixpath.split(name)
+    return posixpath.join(directory, "derived", filename, f"{width}w.{VARIANT_FORMATS[variant_format][1]}")
+
+
+def variant_widths(width: int) -> List[int]:
+    """Configured widths for an image ``width`` pixels wide; larger ones collapse to the original (no upscaling)."""
+    return sorted({min(target, width) for target in settings.CATALOG_IMAGE_VARIANT_WIDTHS}, reverse=True)
+
+
+def render_variants(name: str) -> dict:
+    """
+    Render and store every configured size and format of the image ``name``.
+
+    Touches storage only (no database), so it can run in a worker process.
+    JPEG sources are decoded at a reduced scale when the largest variant
+    allows it, and each size is resized from the next larger one.
+
+    Returns:
+        dict: ``{"source": name, "<format>": {"<width>": "<storage name>", ...}, ...}``;
+        just ``{"source": name}`` if the file is not a readable image.
+    """
+    variants = {"source": name}
+    try:
+        with default_storage.open(name, "rb") as source:
+            with Image.open(source) as image:
+                largest = max(settings.CATALOG_IMAGE_VARIANT_WIDTHS)
+                image.draft("RGB", (largest, largest))
+                image = ImageOps.exif_transpose(image)
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA" if "transparency" in image.info or "A" in image.mode else "RGB")
+
+                for width in variant_widths(image.width):
+                    height = max(round(image.height * width / image.width), 1)
+                    image = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+                    for variant_format in settings.CATALOG_IMAGE_VARIANT_FORMATS:
+                        stored = _store(variant_name(name, width, variant_format), _encode(image, variant_format))
+                        variants.setdefault(variant_format, {})[str(width)] = stored
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        logger.warning(f"No image variants for {name}: {e}")
+        return {"source": name}
+    return variants
+
+
+def _encode(image: Image.Image, variant_format: str) -> bytes:
+    pillow_format = VARIANT_FORMATS[variant_format][0]
+    if pillow_format == "JPEG" and image.mode == "RGBA":
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    options = {"quality": settings.CATALOG_IMAGE_VARIANT_QUALITY}
+    if pillow_format == "JPEG":
+        options.update(optimize=True, progressive=True)
+    buffer = io.BytesIO()
+    image.save(buffer, pillow_format, **options)
+    return buffer.getvalue()
+
+
+def _store(name: str, content: bytes) -> str:
+    """Write ``content`` under ``name`` and return the name the storage actually used."""
+    # Overwrite in place: storages rename on collisions, which would break the deterministic name
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    return default_storage.save(name, ContentFile(content))
+
+
+def variant_files(variants: dict) -> List[str]:
+    """Storage names listed in a variants column."""
+    return [
+        name
+        for variant_format, sizes in variants.items()
+        if variant_format in VARIANT_FORMATS
+        for name in sizes.values()
+    ]
+
+
+def srcset(variants: dict, url: Callable[[str], str]) -> Dict[str, str]:
+    """``{"<format>": "<url> 320w, <url> 640w", ...}`` from a variants column."""
+    return {
+        variant_format: ", ".join(
+            f"{url(name)} {width}w" for width, name in sorted(sizes.items(), key=lambda item: int(item[0]))
+        )
+        for variant_format, sizes in variants.items()
+        if variant_format in VARIANT_FORMATS
+    }
+
+
+class ImageDerivatives:
+    """
+    Keep ``Project.cover_variants`` and ``Media.variants`` in step with their images.
+
+    A row is pending while its variants were rendered from another file than
+    the current one (``variants["source"]``). Rendering goes through ``map``
+    (the builtin by default; ``build_image_variants`` passes a process pool's
+    ``map``), results are written only to rows whose file is still the one
+    rendered, and the response cache generation is bumped afterwards. The
+    updates move ``updated_at``, so HTTP validators and the change feed see
+    the new srcsets.
+
+    Example:
+        >>> ImageDerivatives().refresh_media([12, 13])
+        2
+    """
+
+    def __init__(self, map_fn: Callable = map):
+        self.map = map_fn
+
+    @staticmethod
+    def on_upload() -> bool:
+        return getattr(settings, "CATALOG_IMAGE_VARIANTS_ON_UPLOAD", True)
+
+    # ------------------------------------------------------------------------
+    # Pending rows
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def pending_covers(force: bool = False):
+        queryset = Project.objects.exclude(cover="").exclude(cover__isnull=True)
+        if not force:
+            queryset = queryset.annotate(variants_source=KT("cover_variants__source")).filter(
+                Q(variants_source__isnull=True) | ~Q(variants_source=F("cover"))
+            )
+        return queryset.order_by("pk").values_list("pk", "cover")
+
+    @staticmethod
+    def pending_media(force: bool = False):
+        queryset = Media.objects.filter(type="image").exclude(file="")
+        if not force:
+            queryset = queryset.annotate(variants_source=KT("variants__source")).filter(
+                Q(variants_source__isnull=True) | ~Q(variants_source=F("file"))
+            )
+        return queryset.order_by("pk").values_list("pk", "file")
+
+    # ------------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------------
+    def refresh_covers(self, project_ids: Iterable[int]) -> int:
+        rows = list(self.pending_covers().filter(pk__in=list(project_ids)))
+        return self.save_covers(rows, self.map(render_variants, [name for _, name in rows]))
+
+    def refresh_media(self, media_ids: Iterable[int]) -> int:
+        rows = list(self.pending_media().filter(pk__in=list(media_ids)))
+        return self.save_media(rows, self.map(render_variants, [name for _, name in rows]))
+
+    def save_covers(self, rows: List[Tuple[int, str]], results: Iterable[dict]) -> int:
+        """Store rendered cover variants; returns the number of projects updated."""
+        results = list(results)  # render before the transaction opens
+        now, updated = timezone.now(), 0
+        with transaction.atomic():
+            for (pk, name), variants in zip(rows, results):
+                updated += Project.objects.filter(pk=pk, cover=name).update(cover_variants=variants, updated_at=now)
+            if updated:
+                transaction.on_commit(lambda: CatalogResponseCache().bump())
+        return updated
+
+    def save_media(self, rows: List[Tuple[int, str]], results: Iterable[dict]) -> int:
+        """Store rendered media variants and touch their projects; returns the number of rows updated."""
+        results = list(results)  # render before the transaction opens
+        now, updated = timezone.now(), 0
+        with transaction.atomic():
+            for (pk, name), variants in zip(rows, results):
+                updated += Media.objects.filter(pk=pk, file=name).update(variants=variants, updated_at=now)
+            if updated:
+                # Media is part of the ?expand=media representation of its project
+                project_ids = Media.objects.filter(pk__in=[pk for pk, _ in rows]).values("project_id")
+                Project.objects.filter(pk__in=project_ids).update(updated_at=now)
+                transaction.on_commit(lambda: CatalogResponseCache().bump())
+        return updated
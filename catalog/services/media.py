@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from django.db import transaction
+from django.db.models import Max
+from django.http import Http404
+from django.utils import timezone
+
+from catalog.models import Media, Project
+from catalog.services.cache import CatalogResponseCache
+from catalog.services.images import ImageDerivatives, render_variants, variant_files
+
+
+def media_type_for(upload) -> str:
+    """Media.type of an uploaded file from its content type (image / video / file)."""
+    kind = (getattr(upload, "content_type", None) or "").split("/")[0]
+    return kind if kind in ("image", "video") else "file"
+
+
+class MediaBatchUploader:
+    """
+    Attach many uploaded files to one project in a fixed number of queries.
+
+    Files are streamed to storage first, concurrently and outside any
+    transaction; image variants are rendered alongside them (see
+    catalog.services.images) and inserted with the rows. The rows are then
+    written in one short transaction: an UPDATE that touches
+    ``Project.updated_at`` and locks the project row (so concurrent uploads
+    to the same project take ``order`` values one after the other), one
+    ``MAX(order)`` query and a single ``bulk_create``.
+    Stored files and variants are deleted again if the rows cannot be written.
+
+    ``bulk_create`` bypasses the Media signals, so the response cache
+    generation is bumped here explicitly.
+
+    Example:
+        >>> media = MediaBatchUploader(project).save(request.FILES.getlist("files"))
+        >>> MediaSerializer(media, many=True, context={"request": request}).data  # no queries
+    """
+
+    # Concurrent storage writes (network-bound backends gain the most)
+    upload_workers = 4
+
+    def __init__(self, project: Project):
+        self.project = project
+        self.field = Media._meta.get_field("file")
+
+    def save(self, files, captions: Optional[List[str]] = None) -> List[Media]:
+        """
+        Store ``files`` and create their Media rows, appended after the project's current media.
+
+        Args:
+            files: Uploaded files (anything with ``name``, ``content_type`` and ``chunks()``).
+            captions (Optional[List[str]]): Caption of each file (default: empty).
+
+        Returns:
+            List[Media]: The created rows, with ``project`` set to the given instance.
+
+        Raises:
+            Http404: If the project was deleted meanwhile.
+        """
+        captions = captions or [""] * len(files)
+        media = [
+            Media(project=self.project, type=media_type_for(upload), caption=caption)
+            for upload, caption in zip(files, captions)
+        ]
+        self._store(media, files)
+        try:
+            with transaction.atomic():
+                if not Project.objects.filter(pk=self.project.pk).update(updated_at=timezone.now()):
+                    raise Http404("No Project matches the given query.")
+                last = Media.objects.filter(project_id=self.project.pk).aggregate(last=Max("order"))["last"]
+                first = 0 if last is None else last + 1
+                for offset, item in enumerate(media):
+                    item.order = first + offset
+                Media.objects.bulk_create(media)
+                transaction.on_commit(lambda: CatalogResponseCache().bump())
+        except BaseException:
+            self._discard(media)
+            raise
+        return media
+
+    # ------------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------------
+    def _store(self, media: List[Media], files):
+        """
+        Write every file (and the variants of images) to storage; on any
+        failure remove the ones written and re-raise.
+        """
+        render = ImageDerivatives.on_upload()
+
+        def write(item, upload):
+            name = self.field.generate_filename(item, upload.name)
+            item.file = self.field.storage.save(name, upload, max_length=self.field.max_length)
+            if render and item.type == "image":
+                item.variants = render_variants(item.file.name)
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=max(min(self.upload_workers, len(media)), 1)) as pool:
+            for future in [pool.submit(write, item, upload) for item, upload in zip(media, files)]:
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            self._discard(media)
+            raise errors[0]
+
+    def _discard(self, media: List[Media]):
+        for item in media:
+            if item.file:
+                self.field.storage.delete(item.file.name)
+            for name in variant_files(item.variants):
+                self.field.storage.delete(name)
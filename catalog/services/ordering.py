@@ -0,0 +1,17 @@
+import datetime
+from decimal import Decimal
+
+from django.db.models import DecimalField, Value
+from django.db.models.functions import Coalesce
+
+
+# Nullable columns are ordered through a non-null key (NULLs sort as the lowest
+# value), as keyset cursors cannot compare NULLs. Each expression is indexed
+# verbatim together with id (see Project.Meta.indexes) and annotated by
+# catalog.pagination.ProjectCursorPagination.order.
+PROJECT_ORDERING_KEYS = {
+    "start_date_key": Coalesce("start_date", Value(datetime.date.min)),
+    "budget_key": Coalesce(
+        "budget", Value(Decimal("-1")), output_field=DecimalField(max_digits=14, decimal_places=2)
+    ),
+}
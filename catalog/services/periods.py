@@ -0,0 +1,44 @@
+import datetime
+
+from django.contrib.postgres.fields import DateRangeField
+from django.db.backends.postgresql.psycopg_any import DateRange
+from django.db.models import F, Func, Q, QuerySet, Value
+
+
+# Rows whose contract period is a valid range: a start date and no end date
+# before it. Only these are indexed (and matched), so a bad row can neither
+# break the index build nor the query; the filter repeats the condition so the
+# planner can use the partial index.
+CONTRACT_PERIOD_CONDITION = Q(start_date__isnull=False) & (
+    Q(end_date__isnull=True) | Q(end_date__gte=F("start_date"))
+)
+
+
+def contract_period() -> Func:
+    """
+    ``daterange(start_date, end_date, '[]')``, the inclusive contract period.
+
+    A NULL ``end_date`` is an open-ended contract. Indexed with GiST as
+    ``catalog_proj_contract_gist`` (see Project.Meta.indexes).
+    """
+    return Func(
+        F("start_date"),
+        F("end_date"),
+        Value("[]"),
+        function="daterange",
+        output_field=DateRangeField(),
+    )
+
+
+def active_between(queryset: QuerySet, start: datetime.date, end: datetime.date) -> QuerySet:
+    """
+    Projects under contract on at least one day of ``[start, end]``.
+
+    Example:
+        >>> active_between(Project.objects.all(), date(2025, 3, 1), date(2025, 3, 31))
+    """
+    return (
+        queryset.alias(contract_period=contract_period())
+        .filter(CONTRACT_PERIOD_CONDITION)
+        .filter(contract_period__overlap=DateRange(start, end, "[]"))
+    )
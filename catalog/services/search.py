@@ -0,0 +1,92 @@
+import re
+from typing import Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, FloatField, Q, QuerySet, Value
+from django.db.models.functions import Cast
+
+from utility.persian import normalize_persian
+
+
+# Persian has no stemming dictionary in stock PostgreSQL, so lexemes are only
+# lower-cased ("simple") and matched by prefix.
+SEARCH_CONFIG = "simple"
+
+# Columns folded into ``Project.search_vector`` with their ranking weight.
+# The vector is built from each column's ``<field>_normalized`` shadow.
+PROJECT_SEARCH_FIELDS = {
+    "title": "A",
+    "municipal_file_number": "A",
+    "owner_name": "B",
+    "address": "C",
+}
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def project_search_vector() -> SearchVector:
+    """
+    Build the weighted ``tsvector`` expression stored in ``Project.search_vector``.
+    """
+    vector = None
+    for field, weight in PROJECT_SEARCH_FIELDS.items():
+        part = SearchVector(f"{field}_normalized", weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+class ProjectSearch:
+    """
+    Full-text search over the project catalog.
+
+    - Word matches use the GIN-indexed ``search_vector`` with prefix matching,
+      so partially typed words (one keystroke at a time) still match.
+    - Substrings of the file number or title fall back to ``contains`` on the
+      normalized shadows, served by their ``pg_trgm`` GIN indexes.
+    - The term goes through the same Persian normalization as the stored data.
+    - Results are annotated with ``search_rank`` for relevance ordering.
+
+    Example:
+        >>> queryset = ProjectSearch("برج تهران").apply(Project.objects.all())
+        >>> queryset.order_by(*ProjectSearch.ordering)
+    """
+
+    rank_annotation = "search_rank"
+    ordering = ("-search_rank", "-id")
+
+    def __init__(self, term: str):
+        self.term = normalize_persian(term)
+
+    def tokens(self) -> list:
+        return TOKEN_RE.findall(self.term)
+
+    def query(self) -> Optional[SearchQuery]:
+        """Return a prefix ``tsquery`` ANDing every typed word, or None for empty input."""
+        tokens = self.tokens()
+        if not tokens:
+            return None
+        raw = " & ".join(f"{token}:*" for token in tokens)
+        return SearchQuery(raw, search_type="raw", config=SEARCH_CONFIG)
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """
+        Filter ``queryset`` to matching projects and annotate ``search_rank``.
+        """
+        if not self.term:
+            return queryset
+
+        query = self.query()
+        condition = Q(municipal_file_number_normalized__contains=self.term) | Q(
+            title_normalized__contains=self.term
+        )
+        if query is None:
+            return queryset.filter(condition).annotate(
+                **{self.rank_annotation: Value(0.0, output_field=FloatField())}
+            )
+
+        # ts_rank() returns float4; casting to float8 keeps the value exact when it
+        # round-trips through a pagination cursor.
+        rank = Cast(SearchRank(F("search_vector"), query), output_field=FloatField())
+        return queryset.filter(Q(search_vector=query) | condition).annotate(
+            **{self.rank_annotation: rank}
+        )
@@ -0,0 +1,68 @@
+import re
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable, List, Set, Tuple
+
+from django.db.models import BigIntegerField, Count, Max, Q
+from django.db.models.functions import Cast, Substr
+from django.utils.text import slugify
+
+
+# Used when a title has no ASCII-sluggable characters (e.g. Persian-only titles)
+FALLBACK_SLUG = "project"
+
+
+def slug_base(title: str) -> str:
+    """The slug a title gets when it is not taken yet."""
+    return slugify(title) or FALLBACK_SLUG
+
+
+def allocate_slugs(model, titles: Iterable[str]) -> List[str]:
+    """
+    Allocate unique slugs for a batch of titles with a single query.
+
+    One aggregate query tells, per distinct base, whether the base itself is
+    taken and the highest numeric ``<base>-<n>`` suffix in use; no slugs are
+    loaded. Each title then takes its base if free, otherwise the suffix after
+    the highest one, also avoiding slugs handed out earlier in the same batch.
+
+    Args:
+        model: The model owning the unique ``slug`` field.
+        titles (Iterable[str]): Titles in batch order.
+
+    Returns:
+        List[str]: One slug per title, in the same order.
+
+    Example:
+        >>> allocate_slugs(Project, ["Tower", "Tower"])
+        ['tower-2', 'tower-3']  # when "tower" and "tower-1" already exist
+    """
+    bases = [slug_base(title) for title in titles]
+    if not bases:
+        return []
+
+    taken, highest = _taken_bases(model, set(bases))
+    handed, slugs = set(), []
+    for base in bases:
+        slug = base
+        while slug in handed or (slug == base and base in taken):
+            highest[base] += 1
+            slug = f"{base}-{highest[base]}"
+        handed.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def _taken_bases(model, bases: Iterable[str]) -> Tuple[Set[str], Dict[str, int]]:
+    """The bases already in use, and the highest ``n`` of ``<base>-<n>`` per base (0 if none)."""
+    bases = sorted(bases)
+    aggregates = {}
+    for i, base in enumerate(bases):
+        # Bounded digit count: the suffix must fit a bigint
+        numbered = Q(slug__regex=rf"^{re.escape(base)}-[0-9]{{1,18}}$")
+        aggregates[f"taken_{i}"] = Count("pk", filter=Q(slug=base))
+        aggregates[f"suffix_{i}"] = Max(Cast(Substr("slug", len(base) + 2), BigIntegerField()), filter=numbered)
+    prefixes = reduce(or_, (Q(slug__startswith=base) for base in bases))
+    row = model.objects.filter(prefixes).aggregate(**aggregates)
+    taken = {base for i, base in enumerate(bases) if row[f"taken_{i}"]}
+    return taken, {base: row[f"suffix_{i}"] or 0 for i, base in enumerate(bases)}
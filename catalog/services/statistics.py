@@ -0,0 +1,166 @@
+from collections import defaultdict
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterable, Optional
+
+from django.db import connection, transaction
+from django.db.models import Count, DecimalField, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+from django.utils import timezone
+
+from catalog.models import Project, ProjectStatistic
+
+
+# Project columns the rollups depend on
+STATISTIC_FIELDS = ("status", "owner_id", "start_date", "budget", "total_area")
+
+ZERO = Decimal("0")
+
+
+def statistic_keys(values: dict) -> list:
+    """``(dimension, key)`` rows a project with ``values`` contributes to."""
+    start_date = values["start_date"]
+    return [
+        ("status", values["status"]),
+        ("owner", str(values["owner_id"])),
+        ("month", start_date.strftime("%Y-%m") if start_date else ""),
+    ]
+
+
+def statistic_values(project: Project) -> dict:
+    """
+    The STATISTIC_FIELDS of ``project`` as the database stores them.
+
+    Attributes may still hold what the caller assigned (``budget="10.00"``,
+    ``total_area=12.5``, ``start_date="2025-03-04"``), so each value goes
+    through its field's ``to_python()``; decimals are rounded to the column's
+    scale the way PostgreSQL rounds them on write.
+    """
+    values = {}
+    for name in STATISTIC_FIELDS:
+        field = Project._meta.get_field(name)
+        value = field.to_python(getattr(project, name))
+        if value is not None and field.get_internal_type() == "DecimalField":
+            value = value.quantize(Decimal(1).scaleb(-field.decimal_places), rounding=ROUND_HALF_UP)
+        values[name] = value
+    return values
+
+
+class ProjectStatistics:
+    """
+    Incremental maintenance of the ProjectStatistic rollups.
+
+    Callers add the old values of changed projects with ``sign=-1`` and the
+    new ones with ``sign=+1``; apply() merges the deltas per rollup row and
+    writes them with a single ``INSERT ... ON CONFLICT DO UPDATE`` that adds
+    to the stored totals, so concurrent writers never lose an increment.
+    Run it in the transaction that changes the projects.
+
+    Example:
+        >>> stats = ProjectStatistics()
+        >>> stats.add(old_values, sign=-1)
+        >>> stats.add(statistic_values(project), sign=1)
+        >>> stats.apply()
+    """
+
+    def __init__(self):
+        self.deltas = defaultdict(lambda: [0, ZERO, ZERO])
+
+    def add(self, values: Optional[dict], sign: int = 1) -> "ProjectStatistics":
+        if values is None:
+            return self
+        budget = values["budget"] or ZERO
+        area = values["total_area"] or ZERO
+        for key in statistic_keys(values):
+            delta = self.deltas[key]
+            delta[0] += sign
+            delta[1] += sign * budget
+            delta[2] += sign * area
+        return self
+
+    def apply(self):
+        rows = [(key, delta) for key, delta in sorted(self.deltas.items()) if any(delta)]
+        self.deltas.clear()
+        if not rows:
+            return
+
+        table = ProjectStatistic._meta.db_table
+        now = timezone.now()
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(rows))
+        params = []
+        # Sorted keys: concurrent writers lock the rollup rows in the same order
+        for (dimension, key), (count, budget, area) in rows:
+            params.extend([dimension, key, count, budget, area, now, now])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (dimension, key, project_count, total_budget, total_area, created_at, updated_at) "
+                f"VALUES {placeholders} "
+                f"ON CONFLICT (dimension, key) DO UPDATE SET "
+                f"project_count = {table}.project_count + EXCLUDED.project_count, "
+                f"total_budget = {table}.total_budget + EXCLUDED.total_budget, "
+                f"total_area = {table}.total_area + EXCLUDED.total_area, "
+                f"updated_at = EXCLUDED.updated_at",
+                params,
+            )
+
+    # ------------------------------------------------------------------------
+    # Full rebuild
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def rebuild() -> int:
+        """
+        Recompute every rollup from ``Project`` (three grouped queries).
+
+        Project writes are blocked meanwhile (SHARE lock), so no increment can
+        interleave with the recomputation. Returns the number of rollup rows.
+        """
+        totals = {
+            "project_count": Count("pk"),
+            "total_budget": Coalesce(Sum("budget"), Value(ZERO), output_field=DecimalField()),
+            "total_area": Coalesce(Sum("total_area"), Value(ZERO), output_field=DecimalField()),
+        }
+        groups = [
+            ("status", "status", Project.objects.all()),
+            ("owner", "owner_id", Project.objects.all()),
+            ("month", "month", Project.objects.annotate(month=TruncMonth("start_date"))),
+        ]
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(f"LOCK TABLE {Project._meta.db_table} IN SHARE MODE")
+            rows = []
+            for dimension, column, queryset in groups:
+                grouped = queryset.order_by().values(column).annotate(**totals).values_list(column, *totals)
+                rows.extend(
+                    ProjectStatistic(
+                        dimension=dimension,
+                        key=ProjectStatistics._rebuild_key(dimension, value),
+                        project_count=count,
+                        total_budget=budget,
+                        total_area=area,
+                    )
+                    for value, count, budget, area in grouped
+                )
+            ProjectStatistic.objects.all().delete()
+            ProjectStatistic.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+    @staticmethod
+    def _rebuild_key(dimension, value) -> str:
+        if dimension == "month":
+            return value.strftime("%Y-%m") if value else ""
+        return str(value)
+
+    # ------------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def read(dimensions: Iterable[str]) -> dict:
+        """Non-empty rollup rows of ``dimensions``, one indexed query (no scan of ``Project``)."""
+        data = {dimension: [] for dimension in dimensions}
+        rows = (
+            ProjectStatistic.objects.filter(dimension__in=data, project_count__gt=0)
+            .order_by("dimension", "key")
+            .values("dimension", "key", "project_count", "total_budget", "total_area")
+        )
+        for row in rows:
+            data[row.pop("dimension")].append(row)
+        return data
@@ -0,0 +1,49 @@
+from typing import Iterable, Union
+
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.db.models import JSONField, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce, JSONObject
+from django.utils import timezone
+
+from catalog.models import Project
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project.tags_snapshot
+# ------------------------------------------------------------------------
+# Each project stores its tags as ``[{"id": ..., "name": ...}]`` ordered by id,
+# so list and detail reads render tags without a join or prefetch. The snapshot
+# is recomputed in SQL (one UPDATE per write) by the catalog signals, the bulk
+# writer and the reconcile_tag_snapshots command.
+
+
+def tag_snapshot_expression():
+    """SQL expression of a project's current tag snapshot (for ``update()`` / ``annotate()``)."""
+    tags = (
+        Project.tags.through.objects.filter(project_id=OuterRef("pk"))
+        .order_by()
+        .values("project_id")
+        .annotate(
+            snapshot=JSONBAgg(JSONObject(id="tag_id", name="tag__name"), order_by="tag_id")
+        )
+        .values("snapshot")
+    )
+    return Coalesce(Subquery(tags), Value([], output_field=JSONField()))
+
+
+def refresh_tag_snapshots(projects: Union[QuerySet, Iterable[int]], touch: bool = True) -> int:
+    """
+    Recompute ``tags_snapshot`` for the given projects with one UPDATE.
+
+    Args:
+        projects: Project ids or a Project queryset.
+        touch (bool): Also move ``updated_at`` (the representation changed).
+
+    Returns:
+        int: Number of updated projects.
+    """
+    queryset = projects if isinstance(projects, QuerySet) else Project.objects.filter(pk__in=list(projects))
+    values = {"tags_snapshot": tag_snapshot_expression()}
+    if touch:
+        values["updated_at"] = timezone.now()
+    return queryset.update(**values)
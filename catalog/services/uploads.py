@@ -0,0 +1,328 @@
+import mimetypes
+import os
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Optional
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from redis.exceptions import WatchError
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+
+from catalog.models import Media, Project
+from catalog.services.media import MediaBatchUploader
+from utility.redis import RedisService
+
+
+CONTENT_RANGE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+
+class UploadConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "The upload is busy or the chunk does not continue it."
+    default_code = "upload_conflict"
+
+
+class _AssembledFile(UploadedFile):
+    """The assembled ``.part`` file; FileSystemStorage moves it into place instead of copying it."""
+
+    def __init__(self, path: str, name: str, content_type: str, size: int):
+        super().__init__(open(path, "rb"), name, content_type, size)
+        self.path = path
+
+    def temporary_file_path(self) -> str:
+        return self.path
+
+
+class ChunkedUpload:
+    """
+    Resumable upload of one large file to a project, in byte ranges.
+
+    A session is created with the file's name and size. The client PUTs
+    consecutive ranges (``Content-Range: bytes start-end/size``), each streamed
+    from the request straight into ``<CATALOG_UPLOAD_DIR>/<id>.part``, so a
+    worker never holds more than ``read_size`` bytes of it. After a failure the
+    client reads ``offset`` and continues from there; ranges may overlap what
+    was already received, but not leave a gap. Once complete, ``commit``
+    turns the file into a Media row (see MediaBatchUploader).
+
+    The session state lives in the Redis hash ``catalog:upload:<id>`` and
+    expires ``CATALOG_UPLOAD_SESSION_TTL`` seconds after the last chunk;
+    ``prune_upload_sessions`` removes the files of expired sessions. The
+    upload directory must be shared by all workers.
+
+    Example:
+        >>> upload = ChunkedUpload.create(project, "survey.mp4", 3_000_000_000)
+        >>> upload.write(0, 8_388_608, request.stream)
+        >>> media = ChunkedUpload.get(upload.id, request.user).commit()
+    """
+
+    prefix = "catalog:upload"
+    read_size = 64 * 1024
+    # A chunk holds the session lock while it streams, renewing it every
+    # lock_ttl / 3 seconds; a crashed worker's lock expires
+    lock_ttl = 60 * 2
+
+    def __init__(self, upload_id: str, state: dict, redis_service: Optional[RedisService] = None):
+        self.id = upload_id
+        self.state = state
+        self.redis = redis_service or RedisService()
+        self._lock_token, self._lock_renewed = None, 0.0
+
+    # ------------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------------
+    @classmethod
+    def key(cls, upload_id: str) -> str:
+        return f"{cls.prefix}:{upload_id}"
+
+    @staticmethod
+    def directory() -> str:
+        return settings.CATALOG_UPLOAD_DIR
+
+    @classmethod
+    def create(
+        cls, project: Project, filename: str, size: int, content_type: str = "", caption: str = ""
+    ) -> "ChunkedUpload":
+        """Open a session for ``size`` bytes of ``filename`` and create its empty ``.part`` file."""
+        upload = cls(
+            str(uuid.uuid4()),
+            {
+                "project": project.pk,
+                "owner": project.owner_id,
+                "filename": os.path.basename(filename),
+                "content_type": content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream",
+                "caption": caption,
+                "size": size,
+                "offset": 0,
+            },
+        )
+        os.makedirs(cls.directory(), exist_ok=True)
+        open(upload.path, "xb").close()
+        upload._save_state()
+        return upload
+
+    @classmethod
+    def get(cls, upload_id: str, user) -> "ChunkedUpload":
+        """
+        Load a session of ``user``.
+
+        Raises:
+            NotFound: If the session expired, never existed or belongs to someone else.
+        """
+        redis_service = RedisService()
+        raw = redis_service.connection.hgetall(cls.key(upload_id))
+        state = {name.decode(): value.decode() for name, value in raw.items()}
+        if not state or int(state["owner"]) != user.pk:
+            raise NotFound("Upload not found or expired.")
+        for name in ("project", "owner", "size", "offset"):
+            state[name] = int(state[name])
+        return cls(upload_id, state, redis_service)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory(), f"{self.id}.part")
+
+    @property
+    def offset(self) -> int:
+        return self.state["offset"]
+
+    @property
+    def size(self) -> int:
+        return self.state["size"]
+
+    @property
+    def complete(self) -> bool:
+        return self.offset >= self.size
+
+    def data(self) -> dict:
+        return {
+            "id": self.id,
+            "project": self.state["project"],
+            "filename": self.state["filename"],
+            "content_type": self.state["content_type"],
+            "size": self.size,
+            "offset": self.offset,
+            "complete": self.complete,
+            "expires_in": self.redis.ttl(self.key(self.id)),
+        }
+
+    @contextmanager
+    def _locked(self):
+        """
+        Hold the session lock and reload the offset under it.
+
+        The lock stores a random token and is only renewed (``_renew_lock``)
+        or released by the holder of that token, so a request whose lock
+        expired cannot release the lock of the one that took over.
+
+        Raises:
+            UploadConflict: If a chunk or the commit of this upload is in progress.
+            NotFound: If the session ended meanwhile.
+        """
+        token = uuid.uuid4().hex
+        if not self.redis.connection.set(self._lock_key, token, nx=True, ex=self.lock_ttl):
+            raise UploadConflict("Another request is writing to this upload.")
+        self._lock_token, self._lock_renewed = token, time.monotonic()
+        try:
+            offset = self.redis.connection.hget(self.key(self.id), "offset")
+            if offset is None:  # committed, aborted or expired meanwhile
+                raise NotFound("Upload not found or expired.")
+            self.state["offset"] = int(offset)
+            yield
+        finally:
+            self._while_locked(lambda pipeline: pipeline.delete(self._lock_key))
+            self._lock_token = None
+
+    @property
+    def _lock_key(self) -> str:
+        return f"{self.key(self.id)}:lock"
+
+    def _while_locked(self, queue) -> bool:
+        """
+        Run the commands ``queue`` adds to a pipeline, atomically, if this request still holds the lock.
+
+        Uses WATCH / MULTI: the transaction is dropped if the lock changed
+        hands between the token check and EXEC.
+
+        Returns:
+            bool: False if the lock expired or belongs to another request.
+        """
+        with self.redis.connection.pipeline() as pipeline:
+            try:
+                pipeline.watch(self._lock_key)
+                current = pipeline.get(self._lock_key)
+                if current is None or current.decode() != self._lock_token:
+                    return False
+                pipeline.multi()
+                queue(pipeline)
+                pipeline.execute()
+                return True
+            except WatchError:
+                return False
+
+    def _renew_lock(self):
+        """
+        Extend the lock once a third of its TTL has passed.
+
+        Raises:
+            UploadConflict: If the lock was lost (the request stalled for longer than ``lock_ttl``).
+        """
+        if time.monotonic() - self._lock_renewed < self.lock_ttl / 3:
+            return
+        if not self._while_locked(lambda pipeline: pipeline.expire(self._lock_key, self.lock_ttl)):
+            raise UploadConflict("The upload lock expired while the chunk was being received.")
+        self._lock_renewed = time.monotonic()
+
+    def _save_state(self):
+        pipeline = self.redis.connection.pipeline()
+        self._queue_state(pipeline)
+        pipeline.execute()
+
+    def _queue_state(self, pipeline):
+        key = self.key(self.id)
+        pipeline.hset(key, mapping=self.state)
+        pipeline.expire(key, settings.CATALOG_UPLOAD_SESSION_TTL)
+
+    # ------------------------------------------------------------------------
+    # Chunks
+    # ------------------------------------------------------------------------
+    def parse_range(self, header: Optional[str], length: int):
+        """
+        ``(start, length)`` of a ``Content-Range: bytes start-end/size`` header.
+
+        Raises:
+            ValidationError: If the header is missing, malformed or does not match the body or the session.
+        """
+        match = CONTENT_RANGE.match(header or "")
+        if match is None:
+            raise ValidationError({"Content-Range": "Expected 'bytes <start>-<end>/<size>'."})
+        start, end, total = match.groups()
+        start, end = int(start), int(end)
+        if total != "*" and int(total) != self.size:
+            raise ValidationError({"Content-Range": f"Upload size is {self.size} bytes."})
+        if end < start or end >= self.size:
+            raise ValidationError({"Content-Range": f"Range must lie within 0-{self.size - 1}."})
+        if end - start + 1 != length:
+            raise ValidationError({"Content-Range": "Range length does not match Content-Length."})
+        return start, length
+
+    def write(self, start: int, length: int, stream) -> int:
+        """
+        Stream ``length`` bytes from ``stream`` into the file at ``start``.
+
+        The offset is advanced by whatever was written, even if the stream
+        breaks off, so the retry only sends the rest.
+
+        Returns:
+            int: The new offset.
+
+        Raises:
+            UploadConflict: If another chunk is streaming or ``start`` leaves a gap.
+        """
+        with self._locked():
+            if start > self.offset:
+                raise UploadConflict(f"Chunk starts at {start}, the upload continues at {self.offset}.")
+            written = 0
+            try:
+                with open(self.path, "r+b") as destination:
+                    destination.seek(start)
+                    while written < length:
+                        self._renew_lock()
+                        chunk = stream.read(min(self.read_size, length - written))
+                        if not chunk:
+                            break
+                        destination.write(chunk)
+                        written += len(chunk)
+            finally:
+                self.state["offset"] = max(self.offset, start + written)
+                # Not over a newer offset saved by whoever holds the lock now
+                saved = self._while_locked(self._queue_state)
+            if not saved:
+                raise UploadConflict("The upload lock expired while the chunk was being received.")
+        return self.offset
+
+    # ------------------------------------------------------------------------
+    # Commit / abort
+    # ------------------------------------------------------------------------
+    def commit(self) -> Media:
+        """
+        Attach the completed file to its project as a Media row and close the session.
+
+        Raises:
+            UploadConflict: If bytes are still missing or a chunk is being received.
+            NotFound: If the project was deleted meanwhile.
+        """
+        with self._locked():
+            return self._commit()
+
+    def _commit(self) -> Media:
+        if not self.complete:
+            raise UploadConflict(f"Upload is incomplete: {self.offset} of {self.size} bytes received.")
+        project = Project.objects.only("id", "owner_id", "title").filter(pk=self.state["project"]).first()
+        if project is None:
+            self.abort()
+            raise NotFound("No Project matches the given query.")
+
+        assembled = _AssembledFile(self.path, self.state["filename"], self.state["content_type"], self.size)
+        try:
+            media = MediaBatchUploader(project).save([assembled], captions=[self.state["caption"]])[0]
+        except Exception:
+            if not os.path.exists(self.path):
+                self.abort()  # moved into storage and discarded again: nothing left to retry
+            raise
+        finally:
+            assembled.close()
+        self.abort()
+        return media
+
+    def abort(self):
+        """Drop the session and its file."""
+        self.redis.delete(self.key(self.id))
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
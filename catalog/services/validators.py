@@ -0,0 +1,106 @@
+from typing import Optional, Tuple
+
+from django.db.models import Count, Max, QuerySet, Subquery
+
+from catalog.models import Project, Tag
+from utility.conditional import build_etag
+
+
+# Validators are computed with a single aggregate query and never serialize rows,
+# so an unchanged resource can answer 304 Not Modified cheaply.
+
+
+def _latest(*values):
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def _project_row(**lookup) -> QuerySet:
+    return (
+        Project.objects.filter(**lookup)
+        .annotate(tags_modified=Max("tags__updated_at"))
+        .values_list("id", "updated_at", "owner__updated_at", "tags_modified")
+    )
+
+
+def _project_result(row) -> Optional[Tuple[str, object]]:
+    if row is None:
+        return None
+    project_id, updated_at, owner_modified, tags_modified = row
+    last_modified = _latest(updated_at, owner_modified, tags_modified)
+    return build_etag("project", project_id, last_modified), last_modified
+
+
+def project_validators(**lookup) -> Optional[Tuple[str, object]]:
+    """
+    ETag / Last-Modified for one project, including its owner and tags
+    (both are part of the detail representation). Changing the tag set touches
+    ``Project.updated_at`` (see catalog.signals); tag renames are caught here.
+
+    Returns:
+        Optional[tuple]: ``(etag, last_modified)`` or None if the project does not exist.
+    """
+    return _project_result(_project_row(**lookup).first())
+
+
+async def aproject_validators(**lookup) -> Optional[Tuple[str, object]]:
+    """project_validators() for async views."""
+    return _project_result(await _project_row(**lookup).afirst())
+
+
+def _collection_aggregates() -> dict:
+    latest_tag = Tag.objects.order_by("-updated_at").values("updated_at")[:1]
+    return {
+        "total": Count("pk"),
+        "last_modified": Max("updated_at"),
+        "owner_modified": Max("owner__updated_at"),
+        "tags_modified": Max(Subquery(latest_tag)),
+    }
+
+
+def _collection_result(aggregate, variant) -> Tuple[str, None]:
+    last_modified = _latest(aggregate["last_modified"], aggregate["owner_modified"], aggregate["tags_modified"])
+    return build_etag("projects", aggregate["total"], last_modified, *variant), None
+
+
+def project_collection_validators(queryset: QuerySet, *variant) -> Tuple[str, None]:
+    """
+    ETag for a filtered project collection from ``(max(updated_at), count)``.
+
+    Any insert, update or delete in the filtered set changes at least one of the two
+    (tag-set changes touch ``Project.updated_at``, see catalog.signals). Owner
+    renames (``owner_name``) are covered by the newest owner ``updated_at``, tag
+    renames by the newest ``Tag.updated_at`` (an uncorrelated subquery,
+    evaluated once).
+
+    No Last-Modified is returned (the second item is always None): a delete, or
+    a project leaving the filter, does not advance ``max(updated_at)``, so an
+    If-Modified-Since check would wrongly answer 304. Only the ETag sees the count.
+
+    Args:
+        queryset (QuerySet): The filtered, unpaginated collection.
+        *variant: Extra parts distinguishing representations of the same rows;
+            views pass CatalogResponseCache.normalized_query(), which covers the page
+            (``cursor``, ``page_size``), ``ordering``, ``search`` and fieldsets.
+    """
+    return _collection_result(queryset.order_by().aggregate(**_collection_aggregates()), variant)
+
+
+async def aproject_collection_validators(queryset: QuerySet, *variant) -> Tuple[str, None]:
+    """project_collection_validators() for async views."""
+    return _collection_result(await queryset.order_by().aaggregate(**_collection_aggregates()), variant)
+
+
+def tag_collection_validators(queryset: QuerySet, *variant) -> Tuple[str, None]:
+    """
+    ETag for a tag collection from ``(max(updated_at), count)`` and ``variant``
+    (see project_collection_validators()); no Last-Modified, for the same reason.
+    """
+    aggregate = queryset.order_by().aggregate(total=Count("pk"), last_modified=Max("updated_at"))
+    return build_etag("tags", aggregate["total"], aggregate["last_modified"], *variant), None
+
+
+async def atag_collection_validators(queryset: QuerySet, *variant) -> Tuple[str, None]:
+    """tag_collection_validators() for async views."""
+    aggregate = await queryset.order_by().aaggregate(total=Count("pk"), last_modified=Max("updated_at"))
+    return build_etag("tags", aggregate["total"], aggregate["last_modified"], *variant), None
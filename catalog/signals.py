@@ -0,0 +1,287 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.utils import timezone
+
+from catalog.models import Media, Project, Tag, Tombstone
+from catalog.services.bitmaps import ProjectBitmapIndex
+from catalog.services.cache import CatalogResponseCache
+from catalog.services.images import ImageDerivatives
+from catalog.services.statistics import STATISTIC_FIELDS, ProjectStatistics, statistic_values
+from catalog.services.tags import refresh_tag_snapshots
+
+
+# ------------------------------------------------------------------------
+# 🔹 Response cache invalidation
+# ------------------------------------------------------------------------
+def bump_catalog_generation(sender, **kwargs):
+    """
+    Invalidate cached catalog responses after any catalog write.
+
+    The bump runs on commit, so a concurrent reader cannot cache the old rows
+    under the new generation.
+    """
+    if kwargs.get("action", "post_").startswith("pre_"):
+        return
+    transaction.on_commit(lambda: CatalogResponseCache().bump())
+
+
+for model in (Project, Tag, Media):
+    post_save.connect(
+        bump_catalog_generation, sender=model, dispatch_uid=f"catalog_generation_save_{model.__name__}"
+    )
+    post_delete.connect(
+        bump_catalog_generation, sender=model, dispatch_uid=f"catalog_generation_delete_{model.__name__}"
+    )
+
+m2m_changed.connect(
+    bump_catalog_generation, sender=Project.tags.through, dispatch_uid="catalog_generation_project_tags"
+)
+
+
+def bump_catalog_generation_on_owner_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Owner names are rendered as ``owner_name``; logins (``last_login`` only) change nothing shown."""
+    if created or (update_fields is not None and not {"first_name", "last_name"} & set(update_fields)):
+        return
+    transaction.on_commit(lambda: CatalogResponseCache().bump())
+
+
+post_save.connect(
+    bump_catalog_generation_on_owner_saved,
+    sender=settings.AUTH_USER_MODEL,
+    dispatch_uid="catalog_generation_owner_save",
+)
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project.tags_snapshot / updated_at on tag changes
+# ------------------------------------------------------------------------
+def refresh_projects_on_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    A project's tag set is part of its representation, so changing it must
+    recompute ``Project.tags_snapshot`` and move ``Project.updated_at`` (used by
+    HTTP validators and incremental sync).
+    """
+    if reverse:
+        # instance is a Tag; pk_set holds project ids (None on clear, captured in pre_clear)
+        if action == "pre_clear":
+            instance._cleared_project_ids = list(instance.projects.values_list("pk", flat=True))
+            return
+        if action == "post_clear":
+            pk_set = getattr(instance, "_cleared_project_ids", [])
+        elif action not in ("post_add", "post_remove"):
+            return
+        project_ids = list(pk_set or [])
+    else:
+        if action not in ("post_add", "post_remove", "post_clear"):
+            return
+        project_ids = [instance.pk]
+
+    if project_ids:
+        refresh_tag_snapshots(project_ids)
+    if not reverse:
+        # Keep the in-memory project consistent for the response being built
+        instance.refresh_from_db(fields=["tags_snapshot", "updated_at"])
+
+
+def refresh_projects_on_tag_saved(sender, instance, created, update_fields=None, **kwargs):
+    """A renamed tag changes the snapshot of every project using it."""
+    if created or (update_fields is not None and "name" not in update_fields):
+        return
+    refresh_tag_snapshots(Project.objects.filter(pk__in=instance.projects.values("pk")))
+
+
+def capture_projects_on_tag_delete(sender, instance, **kwargs):
+    """Deleting a tag removes it from projects without firing m2m_changed."""
+    instance._deleted_from_project_ids = list(instance.projects.values_list("pk", flat=True))
+
+
+def refresh_projects_on_tag_delete(sender, instance, **kwargs):
+    project_ids = getattr(instance, "_deleted_from_project_ids", [])
+    if project_ids:
+        refresh_tag_snapshots(project_ids)
+
+
+m2m_changed.connect(
+    refresh_projects_on_tags_changed, sender=Project.tags.through, dispatch_uid="catalog_touch_projects_tags"
+)
+post_save.connect(refresh_projects_on_tag_saved, sender=Tag, dispatch_uid="catalog_snapshot_tag_save")
+pre_delete.connect(capture_projects_on_tag_delete, sender=Tag, dispatch_uid="catalog_touch_projects_tag_delete")
+post_delete.connect(refresh_projects_on_tag_delete, sender=Tag, dispatch_uid="catalog_snapshot_tag_delete")
+
+
+# ------------------------------------------------------------------------
+# 🔹 Project.updated_at on media changes
+# ------------------------------------------------------------------------
+def touch_project_on_media_changed(sender, instance, **kwargs):
+    """Media is part of the ``?expand=media`` representation of its project."""
+    Project.objects.filter(pk=instance.project_id).update(updated_at=timezone.now())
+
+
+post_save.connect(touch_project_on_media_changed, sender=Media, dispatch_uid="catalog_touch_project_media_save")
+post_delete.connect(touch_project_on_media_changed, sender=Media, dispatch_uid="catalog_touch_project_media_delete")
+
+
+# ------------------------------------------------------------------------
+# 🔹 Image derivatives (see catalog.services.images)
+# ------------------------------------------------------------------------
+def _variants_stale(instance, file_field: str, variants_field: str) -> bool:
+    if variants_field in instance.get_deferred_fields():
+        return True  # the refresh re-checks the stored source
+    return getattr(instance, variants_field).get("source") != getattr(instance, file_field).name
+
+
+def render_cover_variants(sender, instance, raw=False, **kwargs):
+    """Render the variants of a new cover after commit; drop them with the cover."""
+    if raw or "cover" in instance.get_deferred_fields():
+        return
+    if not instance.cover:
+        if "cover_variants" in instance.get_deferred_fields() or instance.cover_variants:
+            Project.objects.filter(pk=instance.pk).update(cover_variants={})
+            instance.cover_variants = {}
+        return
+    if ImageDerivatives.on_upload() and _variants_stale(instance, "cover", "cover_variants"):
+
+        def refresh():
+            if ImageDerivatives().refresh_covers([instance.pk]):
+                # Keep the in-memory project consistent for the response being built
+                instance.refresh_from_db(fields=["cover_variants", "updated_at"])
+
+        transaction.on_commit(refresh)
+
+
+def render_media_variants(sender, instance, raw=False, **kwargs):
+    if raw or instance.type != "image" or not instance.file:
+        return
+    if ImageDerivatives.on_upload() and _variants_stale(instance, "file", "variants"):
+        media_id = instance.pk
+        transaction.on_commit(lambda: ImageDerivatives().refresh_media([media_id]))
+
+
+post_save.connect(render_cover_variants, sender=Project, dispatch_uid="catalog_image_variants_project")
+post_save.connect(render_media_variants, sender=Media, dispatch_uid="catalog_image_variants_media")
+
+
+# ------------------------------------------------------------------------
+# 🔹 Change feed tombstones (see catalog.services.changes)
+# ------------------------------------------------------------------------
+TOMBSTONE_KINDS = {Project: "project", Media: "media", Tag: "tag"}
+
+
+def lock_deleted_row(sender, instance, **kwargs):
+    """
+    Lock the row in the deleting transaction. When a concurrent delete of the
+    same row committed first there is nothing left to lock, and the post_delete
+    bookkeeping (tombstone, statistics rollups) is skipped instead of counted twice.
+    """
+    instance._delete_won = bool(list(sender.objects.select_for_update().filter(pk=instance.pk).values_list("pk")))
+
+
+def record_tombstone(sender, instance, **kwargs):
+    """Written in the deleting transaction, so a rolled back delete leaves no tombstone."""
+    if not getattr(instance, "_delete_won", True):
+        return
+    Tombstone.objects.create(kind=TOMBSTONE_KINDS[sender], object_id=instance.pk)
+
+
+for model in TOMBSTONE_KINDS:
+    pre_delete.connect(lock_deleted_row, sender=model, dispatch_uid=f"catalog_lock_deleted_{model.__name__}")
+    post_delete.connect(record_tombstone, sender=model, dispatch_uid=f"catalog_tombstone_{model.__name__}")
+
+
+# ------------------------------------------------------------------------
+# 🔹 Statistics rollups (see catalog.services.statistics)
+# ------------------------------------------------------------------------
+def capture_project_statistics(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Remember the stored values the rollups currently count for this project."""
+    instance._statistic_values = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not set(STATISTIC_FIELDS) & {
+        sender._meta.get_field(name).attname for name in update_fields
+    }:
+        return
+    # Locked until Project.save()'s transaction ends, so concurrent saves of
+    # this project take turns and each one subtracts what the previous wrote
+    instance._statistic_values = (
+        Project.objects.select_for_update().filter(pk=instance.pk).values(*STATISTIC_FIELDS).first()
+    )
+
+
+def update_project_statistics(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    old = getattr(instance, "_statistic_values", None)
+    if not created and old is None:
+        return
+    new = statistic_values(instance)
+    if old is not None and update_fields is not None:
+        # Fields outside update_fields were not written; the stored value still counts
+        written = {sender._meta.get_field(name).attname for name in update_fields}
+        new = {field: new[field] if field in written else old[field] for field in STATISTIC_FIELDS}
+    if new != old:
+        ProjectStatistics().add(old, sign=-1).add(new, sign=1).apply()
+
+
+def remove_project_statistics(sender, instance, **kwargs):
+    if not getattr(instance, "_delete_won", True):
+        return
+    ProjectStatistics().add(statistic_values(instance), sign=-1).apply()
+
+
+pre_save.connect(capture_project_statistics, sender=Project, dispatch_uid="catalog_statistics_project_pre_save")
+post_save.connect(update_project_statistics, sender=Project, dispatch_uid="catalog_statistics_project_save")
+post_delete.connect(remove_project_statistics, sender=Project, dispatch_uid="catalog_statistics_project_delete")
+
+
+# ------------------------------------------------------------------------
+# 🔹 Redis bitmap facet index (optional, see catalog.services.bitmaps)
+# ------------------------------------------------------------------------
+def index_project_on_save(sender, instance, **kwargs):
+    if ProjectBitmapIndex.enabled():
+        row = (instance.pk, instance.status, instance.featured)
+        transaction.on_commit(lambda: ProjectBitmapIndex().add_projects([row]))
+
+
+def unindex_project_on_delete(sender, instance, **kwargs):
+    if ProjectBitmapIndex.enabled():
+        project_id = instance.pk
+        transaction.on_commit(lambda: ProjectBitmapIndex().remove_projects([project_id]))
+
+
+def index_project_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """Mirror tag-set changes (both directions) into the tag bitmaps."""
+    if not ProjectBitmapIndex.enabled():
+        return
+    if action == "pre_clear":
+        # the cleared ids are unknown after the DELETE
+        if reverse:
+            instance._bitmap_cleared_ids = list(instance.projects.values_list("pk", flat=True))
+        else:
+            instance._bitmap_cleared_ids = list(instance.tags.values_list("pk", flat=True))
+        return
+    if action == "post_clear":
+        pk_set, value = getattr(instance, "_bitmap_cleared_ids", []), False
+    elif action in ("post_add", "post_remove"):
+        value = action == "post_add"
+    else:
+        return
+
+    if reverse:
+        pairs = [(project_id, instance.pk) for project_id in pk_set or []]
+    else:
+        pairs = [(instance.pk, tag_id) for tag_id in pk_set or []]
+    if pairs:
+        transaction.on_commit(lambda: ProjectBitmapIndex().set_tags(pairs, value=value))
+
+
+def unindex_tag_on_delete(sender, instance, **kwargs):
+    if ProjectBitmapIndex.enabled():
+        tag_id = instance.pk
+        transaction.on_commit(lambda: ProjectBitmapIndex().drop_tag(tag_id))
+
+
+post_save.connect(index_project_on_save, sender=Project, dispatch_uid="catalog_bitmap_project_save")
+post_delete.connect(unindex_project_on_delete, sender=Project, dispatch_uid="catalog_bitmap_project_delete")
+m2m_changed.connect(index_project_tags, sender=Project.tags.through, dispatch_uid="catalog_bitmap_project_tags")
+post_delete.connect(unindex_tag_on_delete, sender=Tag, dispatch_uid="catalog_bitmap_tag_delete")
@@ -0,0 +1,60 @@
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+
+from account.models import CustomUser
+from catalog.models import Project, ProjectStatistic
+from catalog.services.statistics import statistic_values
+
+
+class ProjectStatisticsSignalTests(TestCase):
+    """The rollups follow ORM saves whatever Python types the fields were assigned."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user("09120000000", "pw")
+
+    def create(self, number="1", **fields):
+        return Project.objects.create(owner=self.owner, title="Tower", municipal_file_number=number, **fields)
+
+    def rollup(self, dimension, key):
+        return ProjectStatistic.objects.values_list("project_count", "total_budget", "total_area").get(
+            dimension=dimension, key=key
+        )
+
+    def test_budget_as_string(self):
+        self.create(budget="10.00")
+        self.assertEqual(self.rollup("owner", str(self.owner.pk)), (1, Decimal("10.00"), Decimal("0")))
+
+    def test_budget_as_float(self):
+        self.create(budget=1.5)
+        self.assertEqual(self.rollup("owner", str(self.owner.pk)), (1, Decimal("1.50"), Decimal("0")))
+
+    def test_total_area_as_float(self):
+        self.create(total_area=12.5)
+        self.assertEqual(self.rollup("owner", str(self.owner.pk)), (1, Decimal("0"), Decimal("12.50")))
+
+    def test_start_date_as_string(self):
+        self.create(start_date="2025-03-04")
+        self.assertEqual(self.rollup("month", "2025-03")[0], 1)
+
+    def test_update_with_strings_moves_the_rollups(self):
+        project = self.create(budget=Decimal("5.00"), start_date=datetime.date(2025, 1, 2))
+        project.budget, project.start_date = "7.25", "2025-02-01"
+        project.save()
+        self.assertEqual(self.rollup("owner", str(self.owner.pk))[:2], (1, Decimal("7.25")))
+        self.assertEqual(self.rollup("month", "2025-01")[0], 0)
+        self.assertEqual(self.rollup("month", "2025-02")[0], 1)
+
+    def test_delete_after_assigning_a_string(self):
+        project = self.create(budget="3.00")
+        project.delete()
+        self.assertEqual(self.rollup("owner", str(self.owner.pk)), (0, Decimal("0"), Decimal("0")))
+
+    def test_values_are_rounded_like_the_column(self):
+        project = Project(owner=self.owner, budget=2.005, total_area="1.004", start_date=datetime.date(2025, 5, 6))
+        values = statistic_values(project)
+        self.assertEqual(values["budget"], Decimal("2.01"))
+        self.assertEqual(values["total_area"], Decimal("1.00"))
+        self.assertEqual(values["owner_id"], self.owner.pk)
@@ -1,15 +1,45 @@
 from django.urls import path, include
 
-from catalog.apis.medias import ProjectMediaUploadAPIView
-from catalog.apis.projects import ProjectDetailAPIView, ProjectListCreateAPIView
+from catalog.apis.asynchronous import AsyncProjectDetailView, AsyncProjectListView, AsyncTagListView
+from catalog.apis.changes import CatalogChangesAPIView
+from catalog.apis.medias import (
+    ProjectMediaUploadAPIView,
+    ProjectUploadSessionAPIView,
+    UploadSessionAPIView,
+    UploadSessionCommitAPIView,
+)
+from catalog.apis.projects import (
+    ProjectBulkAPIView,
+    ProjectDetailAPIView,
+    ProjectExportAPIView,
+    ProjectFacetsAPIView,
+    ProjectHistogramsAPIView,
+    ProjectListCreateAPIView,
+)
+from catalog.apis.statistics import ProjectStatisticsAPIView
 from catalog.apis.tags import TagDetailAPIView, TagListCreateAPIView 
 
 
 urlpatterns = [
     path('projects', ProjectListCreateAPIView.as_view(), name='project-list-create'),
-    path('projects/<int:pk>', ProjectDetailAPIView.as_view(), name='project-detail'),
+    path('projects/facets', ProjectFacetsAPIView.as_view(), name='project-facets'),
+    path('projects/histograms', ProjectHistogramsAPIView.as_view(), name='project-histograms'),
+    path('projects/statistics', ProjectStatisticsAPIView.as_view(), name='project-statistics'),
+    path('projects/bulk', ProjectBulkAPIView.as_view(), name='project-bulk'),
+    path('projects/export.<str:file_format>', ProjectExportAPIView.as_view(), name='project-export'),
+    path('projects/<slug:pk_or_slug>', ProjectDetailAPIView.as_view(), name='project-detail'),
     path('projects/<int:pk>/upload-media', ProjectMediaUploadAPIView.as_view(), name='project-upload-media'),
+    path('projects/<int:pk>/uploads', ProjectUploadSessionAPIView.as_view(), name='project-upload-session'),
+    path('uploads/<uuid:upload_id>', UploadSessionAPIView.as_view(), name='upload-session'),
+    path('uploads/<uuid:upload_id>/commit', UploadSessionCommitAPIView.as_view(), name='upload-session-commit'),
 
     path('tags', TagListCreateAPIView.as_view(), name='tag-list-create'),
     path('tags/<int:pk>', TagDetailAPIView.as_view(), name='tag-detail'),
+
+    path('changes', CatalogChangesAPIView.as_view(), name='catalog-changes'),
+
+    # Async read path (same responses as above, for ASGI deployments)
+    path('async/projects', AsyncProjectListView.as_view(), name='async-project-list'),
+    path('async/projects/<slug:pk_or_slug>', AsyncProjectDetailView.as_view(), name='async-project-detail'),
+    path('async/tags', AsyncTagListView.as_view(), name='async-tag-list'),
 ]
@@ -15,7 +15,14 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from .auth_password_validators import AUTH_PASSWORD_VALIDATORS
-from .databases.postgres import DATABASES
+from .databases.postgres import (
+    DATABASES,
+    DATABASE_REPLICAS,
+    DATABASE_ROUTERS,
+    DATABASE_REPLICA_APPS,
+    DATABASE_REPLICA_STICKY_SECONDS,
+    DATABASE_REPLICA_STICKY_COOKIE,
+)
 from .installed_apps import INSTALLED_APPS
 from .middleware import MIDDLEWARE
 from .templates import TEMPLATES
@@ -24,6 +31,23 @@ from .drf.rest_framework import REST_FRAMEWORK
 from .drf.simple_jwt import SIMPLE_JWT
 from .utilities.smtp import DEFAULT_FROM_EMAIL, EMAIL_BACKEND, EMAIL_HOST, EMAIL_HOST_PASSWORD, EMAIL_HOST_USER, EMAIL_PORT, EMAIL_USE_TLS
 from .databases.caches import CACHES
+from .catalog import (
+    CATALOG_CACHE_TTL,
+    CATALOG_BULK_MAX_ITEMS,
+    CATALOG_MEDIA_UPLOAD_MAX_FILES,
+    CATALOG_UPLOAD_DIR,
+    CATALOG_UPLOAD_MAX_SIZE,
+    CATALOG_UPLOAD_SESSION_TTL,
+    CATALOG_IMAGE_VARIANT_WIDTHS,
+    CATALOG_IMAGE_VARIANT_FORMATS,
+    CATALOG_IMAGE_VARIANT_QUALITY,
+    CATALOG_IMAGE_VARIANTS_ON_UPLOAD,
+    CATALOG_BITMAP_INDEX,
+    CATALOG_BITMAP_MAX_IDS,
+    CATALOG_CHANGES_LAG_SECONDS,
+    CATALOG_CHANGES_MAX_LIMIT,
+    CATALOG_TOMBSTONE_RETENTION_DAYS,
+)
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -0,0 +1,42 @@
+# Catalog read-path settings
+import os
+import tempfile
+
+# Seconds a pre-rendered public catalog response stays in Redis.
+# Entries are invalidated earlier by bumping the catalog generation (catalog.signals).
+CATALOG_CACHE_TTL = 60 * 10
+
+# Maximum number of projects accepted by one bulk create/update request.
+CATALOG_BULK_MAX_ITEMS = 5000
+# Maximum number of files in one project media upload.
+CATALOG_MEDIA_UPLOAD_MAX_FILES = 50
+
+# Resumable chunked uploads (see catalog.services.uploads).
+# Directory of the partially received files; must be shared by all workers.
+CATALOG_UPLOAD_DIR = os.getenv("CATALOG_UPLOAD_DIR", os.path.join(tempfile.gettempdir(), "rah_nama_uploads"))
+# Largest file accepted by one upload session, in bytes.
+CATALOG_UPLOAD_MAX_SIZE = 4 * 1024 ** 3
+# Seconds an upload session survives without receiving a chunk.
+CATALOG_UPLOAD_SESSION_TTL = 60 * 60 * 24
+
+# Image derivatives of Project.cover and image Media (see catalog.services.images).
+# Widths in pixels (never upscaled) and formats of the generated copies.
+CATALOG_IMAGE_VARIANT_WIDTHS = [320, 640, 1280]
+CATALOG_IMAGE_VARIANT_FORMATS = ["webp", "jpeg"]
+CATALOG_IMAGE_VARIANT_QUALITY = 80
+# Render them right after an upload commits; when off, run `manage.py build_image_variants` instead.
+CATALOG_IMAGE_VARIANTS_ON_UPLOAD = True
+
+# Resolve the status / featured / tags filters through Redis bitmaps
+# (see catalog.services.bitmaps; build them with `manage.py rebuild_bitmap_index`).
+CATALOG_BITMAP_INDEX = False
+# Above this many matches the SQL filters are used instead of an id list.
+CATALOG_BITMAP_MAX_IDS = 50000
+
+# Change feed (see catalog.services.changes): rows newer than this many seconds
+# are held back, so a transaction committing late cannot slip behind a cursor.
+CATALOG_CHANGES_LAG_SECONDS = 5
+# Rows per kind in one change feed page.
+CATALOG_CHANGES_MAX_LIMIT = 1000
+# Days deletion tombstones are kept; older cursors must resync from scratch.
+CATALOG_TOMBSTONE_RETENTION_DAYS = 90
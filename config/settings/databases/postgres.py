@@ -20,6 +20,22 @@ load_dotenv(BASE_DIR / ".env")
 #     }
 # }
 
+# ------------------------------------------------------------------------
+# 🔹 Connection pool (psycopg 3 pool of django.db.backends.postgresql)
+# ------------------------------------------------------------------------
+# Each process keeps its own pool per database alias; size it so that
+# workers × DB_POOL_MAX_SIZE stays below the server's max_connections.
+DATABASE_POOL = {
+    'min_size': int(os.getenv("DB_POOL_MIN_SIZE", 2)),
+    'max_size': int(os.getenv("DB_POOL_MAX_SIZE", 10)),
+    # Seconds a request waits for a free connection before failing
+    'timeout': float(os.getenv("DB_POOL_TIMEOUT", 10)),
+    # Idle connections above min_size are closed after this many seconds
+    'max_idle': float(os.getenv("DB_POOL_MAX_IDLE", 300)),
+    # Connections are replaced after this many seconds (spreads server-side memory growth)
+    'max_lifetime': float(os.getenv("DB_POOL_MAX_LIFETIME", 1800)),
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -28,5 +44,45 @@ DATABASES = {
         'PASSWORD': '44139890',
         'HOST': 'db',
         'PORT': 5432,
+        # Health check: a pooled / persistent connection is pinged before
+        # being handed out and replaced if the server dropped it
+        'CONN_HEALTH_CHECKS': True,
     }
 }
+
+if DATABASE_POOL['max_size'] > 0:
+    DATABASES['default']['OPTIONS'] = {'pool': DATABASE_POOL}
+else:
+    # DB_POOL_MAX_SIZE=0 (e.g. behind PgBouncer): persistent per-thread
+    # connections instead
+    DATABASES['default']['CONN_MAX_AGE'] = 60
+
+# ------------------------------------------------------------------------
+# 🔹 Read replicas
+# ------------------------------------------------------------------------
+# Comma separated ``host[:port]`` list of streaming replicas of ``default``
+# (same database name and credentials), e.g. "replica-1,replica-2:5433".
+# Empty disables replica routing; every query then goes to ``default``.
+DATABASE_REPLICAS = []
+for number, address in enumerate(filter(None, map(str.strip, os.getenv("DB_REPLICA_HOSTS", "").split(","))), 1):
+    host, _, port = address.partition(":")
+    alias = f"replica_{number}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        'HOST': host,
+        'PORT': int(port or DATABASES["default"]["PORT"]),
+        # Tests run against ``default`` only; replicas see the same data.
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['utility.db_router.PrimaryReplicaRouter']
+
+# Apps whose safe (GET / HEAD / OPTIONS) views read from a replica
+# (see utility.middleware.ReplicaRoutingMiddleware).
+DATABASE_REPLICA_APPS = ['catalog', 'account']
+
+# Read-your-writes: after a write, the client keeps reading from ``default``
+# for this many seconds (tracked in a cookie). Keep it above the replica lag.
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", 10))
+DATABASE_REPLICA_STICKY_COOKIE = 'db_primary_until'
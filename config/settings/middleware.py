@@ -10,4 +10,5 @@ MIDDLEWARE = [
 
     # Other middlewares
     'corsheaders.middleware.CorsMiddleware',
+    'utility.middleware.ReplicaRoutingMiddleware',
 ]
@@ -21,6 +21,7 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
     TokenVerifyView,
 )
+from utility.db_pool import DatabasePoolStatsAPIView
 from drf_spectacular.views import (
     SpectacularAPIView, 
     SpectacularSwaggerView, 
@@ -35,6 +36,9 @@ urlpatterns = [
     path('api/catalog/', include('catalog.urls')),
     path('api/account/', include('account.urls')),
 
+    # health
+    path('api/health/db-pool', DatabasePoolStatsAPIView.as_view(), name='db-pool-stats'),
+
     # swagger docs
     path('api/docs', SpectacularAPIView.as_view(), name='schema'),
 
@@ -0,0 +1,50 @@
+import datetime
+import hashlib
+from typing import Optional
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def build_etag(*parts) -> str:
+    """
+    Build a strong, quoted ETag from validator parts (ids, timestamps, counts).
+
+    Example:
+        >>> build_etag("project", 12, updated_at)
+        '"3f0c...e1"'
+    """
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def not_modified_response(request, etag: Optional[str], last_modified: Optional[datetime.datetime]):
+    """
+    Evaluate ``If-None-Match`` / ``If-Modified-Since`` against the validators.
+
+    Args:
+        request: The Django or DRF request.
+        etag (Optional[str]): Current ETag of the resource.
+        last_modified (Optional[datetime]): Current modification time of the resource.
+
+    Returns:
+        Optional[HttpResponse]: A 304 (or 412) response when the client copy is
+        still valid, otherwise None.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag: Optional[str], last_modified: Optional[datetime.datetime]):
+    """
+    Attach ``ETag`` / ``Last-Modified`` and ask clients to revalidate on every use.
+    """
+    if etag:
+        response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, no_cache=True)
+    return response
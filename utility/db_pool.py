@@ -0,0 +1,79 @@
+from django.db import connections
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+def pool_stats() -> dict:
+    """
+    Connection pool counters of this process, per database alias.
+
+    Counters accumulate since the pool was created. Aliases without a pool
+    (``DB_POOL_MAX_SIZE=0`` or another backend) are reported as ``None``.
+
+    Example:
+        >>> pool_stats()["default"]["wait_ms_avg"]
+        0.4
+    """
+    data = {}
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is None:
+            data[alias] = None
+            continue
+        stats = pool.get_stats()
+        requests = stats.get("requests_num", 0)
+        queued = stats.get("requests_queued", 0)
+        wait_ms = stats.get("requests_wait_ms", 0)
+        opened = stats.get("connections_num", 0)
+        data[alias] = {
+            "min_size": stats.get("pool_min", pool.min_size),
+            "max_size": stats.get("pool_max", pool.max_size),
+            "size": stats.get("pool_size", 0),
+            "available": stats.get("pool_available", 0),
+            "waiting": stats.get("requests_waiting", 0),
+            "requests": requests,
+            # Requests that found no free connection and had to wait
+            "queued": queued,
+            "timeouts": stats.get("requests_errors", 0),
+            "wait_ms_total": wait_ms,
+            "wait_ms_avg": round(wait_ms / requests, 3) if requests else 0,
+            "wait_ms_avg_queued": round(wait_ms / queued, 3) if queued else 0,
+            "connections_opened": opened,
+            "connect_ms_avg": round(stats.get("connections_ms", 0) / opened, 3) if opened else 0,
+            "connections_failed": stats.get("connections_errors", 0),
+            # Connections found broken by the health check or returned in a bad state
+            "connections_lost": stats.get("connections_lost", 0) + stats.get("returns_bad", 0),
+        }
+    return data
+
+
+# ------------------------------------------------------------------------
+# 🔹 Pool Statistics
+# ------------------------------------------------------------------------
+class DatabasePoolStatsAPIView(APIView):
+    """
+    Database connection pool counters of the worker process serving the request.
+
+    Every worker process has its own pools, so consecutive calls may report
+    different workers. Staff only.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    @extend_schema(
+        summary="آمار استخر اتصال پایگاه داده",
+        description=(
+            "شمارنده‌های استخر اتصال (connection pool) هر پایگاه داده در پروسه‌ای که درخواست را پاسخ داده: "
+            "اندازه فعلی، اتصال‌های آزاد، درخواست‌های منتظر، زمان انتظار برای گرفتن اتصال "
+            "(مجموع و میانگین به میلی‌ثانیه) و اتصال‌های خراب شده.\n\n"
+            "هر پروسه استخر جداگانه دارد. فقط برای مدیران سیستم."
+        ),
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(description="✅ آمار با موفقیت دریافت شد"),
+            status.HTTP_403_FORBIDDEN: OpenApiResponse(description="❌ فقط مدیران سیستم دسترسی دارند"),
+        },
+    )
+    def get(self, request):
+        return Response(pool_stats())
@@ -0,0 +1,106 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@dataclass
+class RoutingState:
+    """Database routing decision of the current request."""
+
+    replica: Optional[str] = None  # alias serving this request's reads, None = primary
+    wrote: bool = False  # a write went to the primary during the request
+    chooser: Optional[Callable[[], Optional[str]]] = None  # picks ``replica`` on the first read
+
+    def read_alias(self) -> Optional[str]:
+        if self.chooser is not None:
+            self.replica, self.chooser = self.chooser(), None
+        return self.replica
+
+
+_state: ContextVar[Optional[RoutingState]] = ContextVar("db_routing_state", default=None)
+
+
+def pick_replica() -> Optional[str]:
+    """One configured replica at random, or None when none are configured."""
+    replicas = getattr(settings, "DATABASE_REPLICAS", [])
+    return random.choice(replicas) if replicas else None
+
+
+@contextmanager
+def routing(replica: Optional[str] = None, chooser: Optional[Callable[[], Optional[str]]] = None):
+    """
+    Route the reads of the enclosed block to ``replica`` (None = primary), or
+    to the alias ``chooser()`` returns when the block first reads.
+
+    Used by ReplicaRoutingMiddleware around a request; code outside any
+    ``routing`` block (management commands, shells, workers) uses the primary.
+
+    Example:
+        >>> with routing(pick_replica()) as state:
+        ...     Project.objects.count()  # served by the replica
+    """
+    state = RoutingState(replica=replica, chooser=chooser)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Read from the primary inside the block, e.g. for data that must not be stale."""
+    state = _state.get()
+    if state is None or state.read_alias() is None:
+        yield
+        return
+    replica, state.replica = state.replica, None
+    try:
+        yield
+    finally:
+        # A write inside the block pins the rest of the request to the primary
+        if not state.wrote:
+            state.replica = replica
+
+
+class PrimaryReplicaRouter:
+    """
+    Send reads to the replica chosen for the current request, writes to ``default``.
+
+    Reads stay on the primary when no replica was chosen, inside a transaction
+    on the primary, and for the rest of a request once it has written, so a
+    request always sees its own writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or state.read_alias() is None:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+            state.replica, state.chooser = None, None
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        aliases = {DEFAULT_DB_ALIAS, *getattr(settings, "DATABASE_REPLICAS", [])}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication
+        if db in getattr(settings, "DATABASE_REPLICAS", []):
+            return False
+        return None
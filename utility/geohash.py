@@ -0,0 +1,90 @@
+import math
+from typing import List, Optional, Tuple
+
+
+# Standard geohash alphabet; each character carries 5 bits, interleaved
+# longitude first, so a longer hash is a smaller cell inside its prefix.
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+MAX_PRECISION = 12
+
+# Mean Earth radius (meters), used for radius searches
+EARTH_RADIUS_M = 6_371_008.8
+
+
+def encode(latitude: float, longitude: float, precision: int = MAX_PRECISION) -> str:
+    """
+    Geohash of a point.
+
+    Example:
+        >>> encode(35.6997, 51.3380, 7)
+        'tnke04z'
+    """
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        interval, coordinate = (lng_range, longitude) if even else (lat_range, latitude)
+        middle = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """``(height, width)`` in degrees of a cell with ``precision`` characters."""
+    lng_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 // 2
+    return 180.0 / 2**lat_bits, 360.0 / 2**lng_bits
+
+
+def _grid(south, west, north, east, precision):
+    height, width = cell_size(precision)
+    rows = range(int((south + 90) // height), int(min(north + 90, 180 - 1e-9) // height) + 1)
+    cols = range(int((west + 180) // width), int(min(east + 180, 360 - 1e-9) // width) + 1)
+    return height, width, rows, cols
+
+
+def covering_cells(south: float, west: float, north: float, east: float, max_cells: int = 16) -> Optional[List[str]]:
+    """
+    The geohash cells covering a bounding box, at the finest precision that
+    needs at most ``max_cells`` cells.
+
+    Every point of the box has one of the returned prefixes (cells may stick
+    out of the box, so results still need an exact bounds check). Returns
+    None when even single-character cells are too many (a world-sized box).
+
+    Example:
+        >>> covering_cells(35.68, 51.30, 35.72, 51.45)
+        ['tnk6z', 'tnkdb', 'tnkdc', ...]
+    """
+    for precision in range(MAX_PRECISION, 0, -1):
+        height, width, rows, cols = _grid(south, west, north, east, precision)
+        if len(rows) * len(cols) <= max_cells:
+            return [
+                encode(-90 + (row + 0.5) * height, -180 + (col + 0.5) * width, precision)
+                for row in rows
+                for col in cols
+            ]
+    return None
+
+
+def radius_bounds(latitude: float, longitude: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """``(south, west, north, east)`` of the box enclosing a circle (clamped at the poles / antimeridian)."""
+    delta_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+    cos_lat = math.cos(math.radians(latitude))
+    delta_lng = 180.0 if cos_lat < 1e-9 else min(math.degrees(radius_m / (EARTH_RADIUS_M * cos_lat)), 180.0)
+    return (
+        max(latitude - delta_lat, -90.0),
+        max(longitude - delta_lng, -180.0),
+        min(latitude + delta_lat, 90.0),
+        min(longitude + delta_lng, 180.0),
+    )
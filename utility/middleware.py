@@ -0,0 +1,81 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from utility.db_router import pick_replica, routing
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve safe requests to the ``DATABASE_REPLICA_APPS`` views from a read replica.
+
+    Read-your-writes: a request that writes sets a short-lived cookie
+    (``DATABASE_REPLICA_STICKY_COOKIE``) holding the time until which the
+    client's reads stay on the primary, so it never reads around its own
+    write while the replicas catch up. Views opt out of replica reads with
+    a ``replica_reads = False`` class attribute.
+
+    Works in both sync (WSGI) and async (ASGI) stacks without a thread hop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.apps = set(getattr(settings, "DATABASE_REPLICA_APPS", []))
+        self.sticky_seconds = getattr(settings, "DATABASE_REPLICA_STICKY_SECONDS", 10)
+        self.cookie = getattr(settings, "DATABASE_REPLICA_STICKY_COOKIE", "db_primary_until")
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        # The replica is picked on the first read, once the view is resolved
+        with routing(chooser=lambda: self._choose(request)) as state:
+            response = self.get_response(request)
+        return self._stick(request, response, state)
+
+    async def __acall__(self, request):
+        with routing(chooser=lambda: self._choose(request)) as state:
+            response = await self.get_response(request)
+        return self._stick(request, response, state)
+
+    def _choose(self, request):
+        match = request.resolver_match
+        if (
+            request.method in SAFE_METHODS
+            and match is not None
+            and self._replica_view(match.func)
+            and not self._sticky(request)
+        ):
+            return pick_replica()
+        return None
+
+    def _stick(self, request, response, state):
+        if state.wrote or request.method not in SAFE_METHODS:
+            response.set_cookie(
+                self.cookie,
+                str(int(time.time()) + self.sticky_seconds),
+                max_age=self.sticky_seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def _replica_view(self, view_func) -> bool:
+        view = getattr(view_func, "view_class", None) or getattr(view_func, "cls", None) or view_func
+        if not getattr(view, "replica_reads", True):
+            return False
+        return view.__module__.split(".", 1)[0] in self.apps
+
+    def _sticky(self, request) -> bool:
+        try:
+            return int(request.COOKIES.get(self.cookie, 0)) > time.time()
+        except ValueError:
+            return False
@@ -0,0 +1,277 @@
+import base64
+import binascii
+import datetime
+import json
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque cursor (keyset) pagination driven by the queryset's own ``order_by``.
+
+    Unlike ``PageNumberPagination`` this never issues ``COUNT(*)`` or ``OFFSET``:
+    each page is fetched with a ``WHERE (a, b) > (x, y) ... LIMIT n`` predicate
+    built from the last row of the previous page, so page N costs the same as
+    page 1 as long as a composite index matches the ordering.
+
+    The ordering must end with a unique column (``id``); when it does not,
+    ``pk`` is appended as a tie-breaker.
+
+    Example:
+        >>> paginator = KeysetPagination()
+        >>> page = paginator.paginate_queryset(qs.order_by("-created_at", "-id"), request)
+        >>> return paginator.get_paginated_response(serializer_class(page, many=True).data)
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self):
+        self.base_url: Optional[str] = None
+        self.next_position: Optional[List[Any]] = None
+        self.previous_position: Optional[List[Any]] = None
+        self.ordering: Tuple[str, ...] = ()
+
+    # ------------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------------
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> list:
+        """
+        Return a single page of ``queryset`` starting after the request cursor.
+
+        Args:
+            queryset (QuerySet): An ordered queryset.
+            request: The DRF request carrying ``cursor`` / ``page_size``.
+
+        Returns:
+            list: The rows of the requested page, in the queryset ordering.
+
+        Raises:
+            NotFound: If the cursor is malformed or was issued for another ordering.
+        """
+        queryset, page_size, cursor = self._page_queryset(queryset, request)
+        return self._page(list(queryset[: page_size + 1]), page_size, cursor)
+
+    async def apaginate_queryset(self, queryset: QuerySet, request, view=None) -> list:
+        """paginate_queryset() for async views (the page is fetched with the async ORM)."""
+        queryset, page_size, cursor = self._page_queryset(queryset, request)
+        return self._page([row async for row in queryset[: page_size + 1]], page_size, cursor)
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data) -> dict:
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_position is None:
+            return None
+        return self._link(self.next_position, reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if self.previous_position is None:
+            return None
+        return self._link(self.previous_position, reverse=True)
+
+    def get_page_size(self, request) -> int:
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return self.page_size
+        try:
+            size = int(raw)
+        except (TypeError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, queryset: QuerySet) -> Tuple[str, ...]:
+        """
+        Read the ordering from the queryset and make sure it ends in a unique key.
+        """
+        ordering = tuple(queryset.query.order_by or queryset.model._meta.ordering)
+        if not ordering:
+            return ("pk",)
+        last = ordering[-1].lstrip("-")
+        if last not in ("pk", "id", queryset.model._meta.pk.name):
+            ordering += ("-pk" if ordering[0].startswith("-") else "pk",)
+        return ordering
+
+    # ------------------------------------------------------------------------
+    # Cursor Encoding
+    # ------------------------------------------------------------------------
+    def encode_cursor(self, position: Sequence[Any], reverse: bool) -> str:
+        payload = {
+            "o": list(self.ordering),
+            "v": [self._encode_value(value) for value in position],
+            "r": int(reverse),
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request) -> Optional[dict]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if not isinstance(payload, dict) or len(payload["o"]) != len(payload["v"]):
+                raise ValueError
+            if payload["r"] not in (0, 1):
+                raise ValueError
+            return payload
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    # ------------------------------------------------------------------------
+    # Internal Helpers
+    # ------------------------------------------------------------------------
+    def _page_queryset(self, queryset: QuerySet, request):
+        """The page query (limit not applied yet), its page size and the decoded cursor."""
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(queryset)
+        page_size = self.get_page_size(request)
+
+        cursor = self.decode_cursor(request)
+        reverse = False
+        if cursor is not None:
+            if tuple(cursor["o"]) != self.ordering:
+                raise NotFound(self.invalid_cursor_message)
+            reverse = bool(cursor["r"])
+            values = self._parse_values(queryset, cursor["v"])
+            queryset = queryset.filter(self._keyset_filter(values, reverse))
+
+        if reverse:
+            queryset = queryset.order_by(*(self._invert(field) for field in self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        return queryset, page_size, cursor
+
+    def _page(self, rows: list, page_size: int, cursor: Optional[dict]) -> list:
+        """Trim the look-ahead row and record the next / previous positions."""
+        reverse = bool(cursor and cursor["r"])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else cursor is not None
+
+        self.next_position = self._position(rows[-1]) if rows and has_next else None
+        self.previous_position = self._position(rows[0]) if rows and has_previous else None
+        return rows
+
+    @staticmethod
+    def _invert(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _encode_value(value: Any) -> Any:
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+
+    def _parse_values(self, queryset: QuerySet, raw_values: Sequence[Any]) -> List[Any]:
+        """Turn the JSON cursor values back into Python values of the ordering columns."""
+        values = []
+        for field, raw in zip(self.ordering, raw_values):
+            if raw is None:
+                raise NotFound(self.invalid_cursor_message)
+            try:
+                values.append(self._resolve_field(queryset, field.lstrip("-")).to_python(raw))
+            except (ValidationError, FieldDoesNotExist, TypeError, ValueError):
+                # TypeError / ValueError: some to_python() (dates, times) assume strings
+                raise NotFound(self.invalid_cursor_message)
+        return values
+
+    @staticmethod
+    def _resolve_field(queryset: QuerySet, name: str):
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        if name == "pk":
+            return queryset.model._meta.pk
+        return queryset.model._meta.get_field(name)
+
+    def _keyset_filter(self, values: Sequence[Any], reverse: bool) -> Q:
+        """
+        Build the row-comparison predicate ``(a, b, ...) > (x, y, ...)`` as an OR of
+        prefix-equality terms, respecting each column's direction.
+
+        A redundant range condition on the leading column is added so the planner
+        can turn it into an index range scan.
+        """
+        names = [field.lstrip("-") for field in self.ordering]
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            descending = field.startswith("-")
+            lookup = "lt" if descending != reverse else "gt"
+            term = Q(**{f"{names[index]}__{lookup}": values[index]})
+            for prefix_name, prefix_value in zip(names[:index], values[:index]):
+                term &= Q(**{prefix_name: prefix_value})
+            condition |= term
+
+        leading = "lte" if self.ordering[0].startswith("-") != reverse else "gte"
+        return Q(**{f"{names[0]}__{leading}": values[0]}) & condition
+
+    def _position(self, row) -> List[Any]:
+        names = [field.lstrip("-") for field in self.ordering]
+        if isinstance(row, dict):
+            # .values() rows: the ordering names must be among the selected keys
+            return [row[name] for name in names]
+        return [getattr(row, name) for name in names]
+
+    def _link(self, position: Sequence[Any], reverse: bool) -> str:
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse))
+
+    # ------------------------------------------------------------------------
+    # Schema (drf-spectacular)
+    # ------------------------------------------------------------------------
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> list:
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
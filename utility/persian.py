@@ -0,0 +1,59 @@
+import re
+from typing import Optional
+
+
+# Arabic code points that Persian keyboards and OCR'd documents mix in,
+# Persian / Arabic-Indic digits and invisible joiners.
+_CHARACTER_MAP = str.maketrans(
+    {
+        "ي": "ی",  # Arabic yeh
+        "ى": "ی",  # Alef maksura
+        "ك": "ک",  # Arabic kaf
+        "ة": "ه",  # Teh marbuta
+        "ۀ": "ه",  # Heh with yeh above
+        "أ": "ا",
+        "إ": "ا",
+        "ٱ": "ا",
+        "ؤ": "و",
+        "\u200c": " ",  # ZWNJ separates words
+        "\u200d": None,  # ZWJ
+        "\u200e": None,  # LRM
+        "\u200f": None,  # RLM
+        "\u0640": None,  # Tatweel
+        **{persian: str(digit) for digit, persian in enumerate("۰۱۲۳۴۵۶۷۸۹")},
+        **{arabic: str(digit) for digit, arabic in enumerate("٠١٢٣٤٥٦٧٨٩")},
+    }
+)
+
+# Harakat and superscript alef.
+_DIACRITICS_RE = re.compile("[\u064b-\u065f\u0670]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_persian(text: Optional[str]) -> str:
+    """
+    Normalize Persian text for indexing and lookups.
+
+    The same function must be applied when writing the normalized column and
+    when building the query, so both sides compare the canonical form.
+
+    - Arabic ye/kaf (and similar look-alikes) become their Persian forms.
+    - Persian and Arabic-Indic digits become ASCII digits.
+    - ZWNJ becomes a space; other invisible marks, tatweel and diacritics are removed.
+    - Text is case-folded and whitespace is collapsed.
+
+    Args:
+        text (Optional[str]): Raw user input or stored value.
+
+    Returns:
+        str: The normalized text ("" for None).
+
+    Example:
+        >>> normalize_persian("كتابخانه‌ي مركزي ۱۴۰۳")
+        'کتابخانه ی مرکزی 1403'
+    """
+    if not text:
+        return ""
+    text = text.translate(_CHARACTER_MAP)
+    text = _DIACRITICS_RE.sub("", text)
+    return _WHITESPACE_RE.sub(" ", text).strip().casefold()
@@ -1,5 +1,9 @@
+import asyncio
+import weakref
 from typing import Optional, Union
+from django.conf import settings
 from django_redis import get_redis_connection
+from redis import asyncio as aioredis
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from redis.exceptions import ConnectionError, TimeoutError, RedisError
 
@@ -164,3 +168,32 @@ class RedisService:
             return ttl if ttl >= 0 else None
         except RedisError as e:
             raise RedisError(f"Failed to retrieve TTL for key '{key}': {e}")
+
+
+# One asyncio client per event loop and cache alias (clients cannot be shared across loops)
+_async_connections = weakref.WeakKeyDictionary()
+
+
+def get_async_redis_connection(alias: str = "default") -> aioredis.Redis:
+    """
+    ``redis.asyncio`` client for the Redis server behind a cache alias, for async views.
+
+    Keys are shared with the sync ``django-redis`` connection of the same alias.
+
+    Example:
+        >>> redis = get_async_redis_connection()
+        >>> await redis.get("catalog:generation")
+        b'42'
+
+    Raises:
+        ImproperlyConfigured: If the alias is not a Redis cache.
+    """
+    clients = _async_connections.setdefault(asyncio.get_running_loop(), {})
+    if alias not in clients:
+        location = settings.CACHES.get(alias, {}).get("LOCATION")
+        if not location:
+            raise ImproperlyConfigured(f"Cache alias '{alias}' has no Redis LOCATION.")
+        if isinstance(location, (list, tuple)):
+            location = location[0]  # the primary of a replicated setup
+        clients[alias] = aioredis.Redis.from_url(location)
+    return clients[alias]